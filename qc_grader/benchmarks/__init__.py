@@ -0,0 +1,45 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Benchmarks for the grading client.
+
+Each `*_bench.py` module can be run on its own, e.g.
+`python -m qc_grader.benchmarks.custom_encoder_bench`.
+"""
+
+import time
+import tracemalloc
+from typing import Any, Callable
+
+
+def best_time(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the fastest of `repeat` calls to `fn`, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def peak_memory(fn: Callable[[], Any]) -> int:
+    """Return the peak number of bytes traced by `tracemalloc` during `fn()`."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def print_row(label: str, *columns: str) -> None:
+    print(f"{label:<40}" + "".join(f"{column:>16}" for column in columns))
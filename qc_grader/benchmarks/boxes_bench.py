@@ -0,0 +1,80 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time of unrolling the boxes of annotated QAOA ansätze."""
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler import TransformationPass
+from samplomatic import Twirl
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.grader.boxes import unroll_boxes
+
+
+class _LegacyUnrollBoxes(TransformationPass):
+    """The pass lab4b used before, which does not unroll nested boxes."""
+
+    def run(self, dag: DAGCircuit):
+        for node in dag.topological_op_nodes():
+            if node.op.name != "box":
+                continue
+
+            box_circuit = node.op.params[0]
+            box_dag = circuit_to_dag(box_circuit)
+            dag.substitute_node_with_dag(node, box_dag)
+        return dag
+
+
+def _legacy(circuit: QuantumCircuit) -> QuantumCircuit:
+    if any(instr.operation.name == "box" for instr in circuit.data):
+        circuit = _LegacyUnrollBoxes()(circuit)
+    return circuit
+
+
+def _annotated_qaoa(num_qubits: int, reps: int) -> QuantumCircuit:
+    """A ring QAOA ansatz with each cost and mixer layer in a twirled box."""
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(range(num_qubits))
+    for rep in range(reps):
+        gamma, beta = Parameter(f"γ[{rep}]"), Parameter(f"β[{rep}]")
+        with circuit.box([Twirl()]):
+            for qubit in range(num_qubits):
+                circuit.rzz(2 * gamma, qubit, (qubit + 1) % num_qubits)
+        with circuit.box([Twirl()]):
+            circuit.rx(2 * beta, range(num_qubits))
+    circuit.measure_all()
+    return circuit
+
+
+def main() -> None:
+    print_row("annotated QAOA", "legacy (ms)", "unroll (ms)")
+    for num_qubits, reps in [(20, 100), (20, 250), (100, 250)]:
+        circuit = _annotated_qaoa(num_qubits, reps)
+        assert _legacy(circuit) == unroll_boxes(circuit)
+        print_row(
+            f"{num_qubits} qubits, {2 * reps} boxes",
+            f"{best_time(lambda: _legacy(circuit)) * 1e3:.1f}",
+            f"{best_time(lambda: unroll_boxes(circuit)) * 1e3:.1f}",
+        )
+
+    flat = _annotated_qaoa(100, 250)
+    flat = unroll_boxes(flat)
+    print_row(
+        "100 qubits, no boxes",
+        f"{best_time(lambda: _legacy(flat)) * 1e3:.2f}",
+        f"{best_time(lambda: unroll_boxes(flat)) * 1e3:.2f}",
+    )
+
+
+if __name__ == "__main__":
+    main()
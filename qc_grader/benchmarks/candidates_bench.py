@@ -0,0 +1,80 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time of calling a slow circuit builder over the lab2 ex6 test sizes."""
+
+import os
+import time
+from typing import Any, Callable
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit.library import QFTGate
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.grader.candidates import evaluate
+
+_TEST_NUM_QUBITS = [4, 6, 8, 10, 12, 20]
+_WAIT_SECONDS = 0.5
+
+
+def _slow_build_circuit(n: int) -> QuantumCircuit:
+    """A builder that transpiles its circuit, as some students' do."""
+    circuit = QuantumCircuit(n)
+    circuit.append(QFTGate(n), range(n))
+    return transpile(
+        circuit,
+        basis_gates=["rz", "sx", "x", "cz"],
+        optimization_level=3,
+        seed_transpiler=0,
+    )
+
+
+def _waiting_build_circuit(n: int) -> QuantumCircuit:
+    """A builder that spends its time waiting, e.g. on a remote service."""
+    time.sleep(_WAIT_SECONDS)
+    return QuantumCircuit(n)
+
+
+def main() -> None:
+    print_row(f"lab2 ex6 sizes ({os.cpu_count()} CPUs)", "transpile (ms)", "wait (ms)")
+    # Run as `python -m`, this module is `__main__`, whose functions worker processes
+    # cannot import, so take the builders from the importable copy.
+    from qc_grader.benchmarks import candidates_bench
+
+    builders = [
+        candidates_bench._slow_build_circuit,
+        candidates_bench._waiting_build_circuit,
+    ]
+    _slow_build_circuit(_TEST_NUM_QUBITS[0])
+
+    def loop(builder: Callable[[int], QuantumCircuit]) -> None:
+        {str(n): builder(n) for n in _TEST_NUM_QUBITS}
+
+    def row(label: str, run: Callable[[Callable], Any]) -> None:
+        # Every evaluation with processes starts a new pool, so one run is enough.
+        print_row(
+            label, *(f"{best_time(lambda: run(b), 1) * 1e3:.0f}" for b in builders)
+        )
+
+    row("plain loop", loop)
+    for processes in (1, 2, 6):
+        row(
+            f"evaluate, {processes} process(es)",
+            lambda b: list(evaluate(b, _TEST_NUM_QUBITS, processes=processes)),
+        )
+
+    print()
+    print_row("per call", "transpile (ms)")
+    for evaluation in evaluate(_slow_build_circuit, _TEST_NUM_QUBITS):
+        print_row(f"n={evaluation.input}", f"{evaluation.seconds * 1e3:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time of extracting depth, gate counts and other facts from a circuit."""
+
+from typing import Any, cast
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import BoxOp
+from qiskit.circuit.random import random_circuit
+from samplomatic import InjectNoise, Twirl
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.grader.circuits import (
+    circuit_facts,
+    circuit_metrics,
+)
+
+
+def _separate(circuit: QuantumCircuit) -> None:
+    circuit.depth()
+    circuit.depth(lambda instruction: len(instruction.qubits) == 2)
+    circuit.count_ops()
+
+
+def _circuits() -> dict[str, QuantumCircuit]:
+    circuits = {}
+    for num_qubits, depth in [(10, 10), (20, 100), (50, 400)]:
+        circuit = random_circuit(
+            num_qubits, depth, max_operands=2, measure=True, seed=3
+        )
+        circuits[f"{num_qubits} qubits, {circuit.size()} ops"] = circuit
+    return circuits
+
+
+def main() -> None:
+    print_row("metrics time (ms)", "separate", "single pass")
+    for label, circuit in _circuits().items():
+        print_row(
+            label,
+            f"{best_time(lambda: _separate(circuit)) * 1e3:.2f}",
+            f"{best_time(lambda: circuit_metrics(circuit)) * 1e3:.2f}",
+        )
+
+    print()
+    bench_lab3_facts()
+
+
+def _ising(num_qubits: int, num_gates: int, boxed: bool) -> QuantumCircuit:
+    """Layers of rx(pi/8) and cz, each in a twirled box if `boxed`, then a measure."""
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    layers = max(1, num_gates // (num_qubits + num_qubits // 2))
+    for _ in range(layers):
+        if boxed:
+            with circuit.box([Twirl(), InjectNoise(ref="layer")]):
+                circuit.rx(0.3927, range(num_qubits))
+            with circuit.box([Twirl(), InjectNoise(ref="layer")]):
+                for qubit in range(0, num_qubits - 1, 2):
+                    circuit.cz(qubit, qubit + 1)
+        else:
+            circuit.rx(0.3927, range(num_qubits))
+            for qubit in range(0, num_qubits - 1, 2):
+                circuit.cz(qubit, qubit + 1)
+            circuit.barrier()
+    if boxed:
+        with circuit.box([Twirl()]):
+            circuit.measure(range(num_qubits), range(num_qubits))
+    else:
+        circuit.measure(range(num_qubits), range(num_qubits))
+    return circuit
+
+
+def _legacy_lab3_ex2_facts(
+    ising: QuantumCircuit, mirror: QuantumCircuit, boxed: QuantumCircuit
+) -> dict[str, Any]:
+    """The separate scans grade_lab3_ex2 did before."""
+    op_counts: dict[str, int] = {}
+    rx_angles = []
+    has_barriers = False
+    for inst in ising.data:
+        name = inst.operation.name
+        op_counts[name] = op_counts.get(name, 0) + 1
+        if name == "rx":
+            rx_angles.append(float(inst.operation.params[0]))
+        elif name == "barrier":
+            has_barriers = True
+    has_measure = any(inst.operation.name == "measure" for inst in mirror.data)
+    box_insts = [inst for inst in boxed if isinstance(inst.operation, BoxOp)]
+    gate_boxes = [
+        b
+        for b in box_insts
+        if not any(sub.operation.name == "measure" for sub in b.operation.body.data)
+    ]
+    twirl = sum(
+        1
+        for b in gate_boxes
+        if any(type(a).__name__ == "Twirl" for a in b.operation.annotations)
+    )
+    inject = sum(
+        1
+        for b in gate_boxes
+        if any(type(a).__name__ == "InjectNoise" for a in b.operation.annotations)
+    )
+    return {
+        "op_counts": op_counts,
+        "rx_angles": rx_angles,
+        "has_barriers": has_barriers,
+        "has_measure": has_measure,
+        "num_boxes": len(box_insts),
+        "twirl": twirl,
+        "inject": inject,
+    }
+
+
+def bench_lab3_facts() -> None:
+    ising = _ising(100, 10_000, boxed=False)
+    forward = cast(QuantumCircuit, ising.remove_final_measurements(inplace=False))
+    mirror = cast(QuantumCircuit, forward.compose(forward.inverse()))
+    mirror.measure_all()
+    boxed = _ising(100, 10_000, boxed=True)
+
+    def single_pass() -> None:
+        for circuit in (ising, mirror, boxed):
+            circuit_facts(circuit)
+
+    print_row(
+        f"lab3 ex2 facts ({len(ising.data)} ops, {len(boxed.data)} boxes)", "time (ms)"
+    )
+    print_row(
+        "separate scans",
+        f"{best_time(lambda: _legacy_lab3_ex2_facts(ising, mirror, boxed)) * 1e3:.2f}",
+    )
+    print_row("single pass", f"{best_time(single_pass) * 1e3:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Load of a classroom grading at once, for capacity planning.
+
+`python -m qc_grader.benchmarks.classroom --students 300 --window 120` has 300 students
+call real grading functions over two minutes, with answers mixed as in a lab session,
+and reports throughput, latency percentiles and errors per endpoint. It runs against a
+local `stub_server` unless `--url` gives a grading server, whose IAM can be set with
+`--iam-url`; the API key is then read as usual.
+
+Students are threads of one process, so their latencies include waiting for the GIL
+behind each other's encoding, which separate notebooks would not. Against the stub
+server each student has an API key of their own, but against `--url` they all share
+the one that is read.
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Literal
+from unittest.mock import patch
+
+import networkx as nx
+import numpy as np
+from qiskit import QuantumCircuit
+
+from qc_grader.benchmarks import print_row
+from qc_grader.benchmarks.stub_server import (
+    StubConfig,
+    StubGradingServer,
+    serve_in_background,
+)
+from qc_grader.challenges.fallfest_2026 import intro
+from qc_grader.challenges.qgss_2026 import lab1, lab4b, lab4c
+from qc_grader.grader import api, grade
+from qc_grader.grader.grade import create_check_progress_function
+
+Arrivals = Literal["burst", "uniform", "poisson"]
+
+_PERCENTILES = (50, 95, 99)
+
+# The student whose submission is being graded, e.g. "student-7".
+_student: ContextVar[str] = ContextVar("_student", default="classroom")
+
+
+@dataclass(frozen=True)
+class Submission:
+    name: str
+    # How often students submit this, relative to the other submissions.
+    weight: float
+    grade: Callable[[], None]
+
+
+def _ghz(num_qubits: int) -> QuantumCircuit:
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for qubit in range(num_qubits - 1):
+        qc.cx(qubit, qubit + 1)
+    return qc
+
+
+def default_mix() -> list[Submission]:
+    """Answers of the sizes students send in a lab session, most of them small."""
+    rng = np.random.default_rng(seed=42)
+    raw_bitstrings = rng.random((10_000, 52)) < 0.5
+    graph = nx.random_regular_graph(3, 50, seed=42)
+    check_progress = create_check_progress_function("qgss_2026")
+    return [
+        Submission("fallfest bool", 5, lambda: intro.grade_intro_ex1(True)),
+        Submission("lab1 circuit", 3, lambda: lab1.grade_lab1_ex7(_ghz(64))),
+        Submission(
+            "lab4c arrays",
+            1,
+            lambda: lab4c.grade_lab4c_ex2a(
+                lambda bits, n: bits.reshape(len(bits), 2, n), raw_bitstrings
+            ),
+        ),
+        Submission("lab4b graph", 1, lambda: lab4b.grade_lab4b_ex1a(graph)),
+        Submission("progress", 1, check_progress),
+    ]
+
+
+def arrival_times(
+    count: int, arrivals: Arrivals, window: float, rng: random.Random
+) -> list[float]:
+    """Seconds from the start at which each of `count` students submits.
+
+    `burst` has everyone submit at once, `uniform` spreads them evenly over `window`
+    and `poisson` at random at the same average rate.
+    """
+    if arrivals == "burst":
+        return [0.0] * count
+    if arrivals == "uniform":
+        return [window * i / count for i in range(count)]
+    rate = count / window
+    times, now = [], 0.0
+    for _ in range(count):
+        now += rng.expovariate(rate)
+        times.append(now)
+    return times
+
+
+@dataclass
+class Request:
+    endpoint: str
+    seconds: float
+    # `None` for a successful request, else the message of the error raised.
+    error: str | None
+
+
+@dataclass
+class Report:
+    requests: list[Request] = field(default_factory=list)
+    # Seconds each student waited for a free worker after their arrival time.
+    start_delays: list[float] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def by_endpoint(self) -> dict[str, list[Request]]:
+        endpoints: dict[str, list[Request]] = {}
+        for request in self.requests:
+            endpoints.setdefault(request.endpoint, []).append(request)
+        return dict(sorted(endpoints.items()))
+
+    def errors(self) -> Counter[tuple[str, str]]:
+        return Counter(
+            (request.endpoint, request.error)
+            for request in self.requests
+            if request.error is not None
+        )
+
+
+def percentiles(values: list[float]) -> list[float]:
+    if not values:
+        return [float("nan")] * len(_PERCENTILES)
+    return list(np.percentile(values, _PERCENTILES))
+
+
+@contextlib.contextmanager
+def _recording(report: Report) -> Iterator[None]:
+    """Record each call to `send_request` made by the grading functions."""
+    send_request = api.send_request
+
+    def recorded_send_request(endpoint: str, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        error = None
+        try:
+            return send_request(endpoint, *args, **kwargs)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            # Appending to a list is atomic, so the workers can share it.
+            report.requests.append(
+                Request(endpoint, time.perf_counter() - start, error)
+            )
+
+    with (
+        patch.object(grade, "send_request", recorded_send_request),
+        contextlib.redirect_stdout(io.StringIO()),
+    ):
+        yield
+
+
+def run(
+    mix: list[Submission],
+    students: int,
+    concurrency: int,
+    arrivals: Arrivals = "burst",
+    window: float = 0.0,
+    seed: int | None = None,
+) -> Report:
+    """Have `students` each make a submission drawn from `mix`, `concurrency` at once."""
+    rng = random.Random(seed)
+    submissions = rng.choices(mix, [s.weight for s in mix], k=students)
+    times = arrival_times(students, arrivals, window, rng)
+    report = Report()
+    lock = threading.Lock()
+
+    def student(index: int, submission: Submission, arrival: float) -> None:
+        with lock:
+            report.start_delays.append(time.perf_counter() - arrival)
+        _student.set(f"student-{index}")
+        submission.grade()
+
+    with _recording(report), ThreadPoolExecutor(concurrency) as workers:
+        start = time.perf_counter()
+        futures = []
+        for index, (submission, at) in enumerate(zip(submissions, times)):
+            time.sleep(max(0.0, start + at - time.perf_counter()))
+            futures.append(workers.submit(student, index, submission, start + at))
+        for future in futures:
+            future.result()
+        report.seconds = time.perf_counter() - start
+    return report
+
+
+def print_report(report: Report) -> None:
+    print_row("endpoint", "requests", "errors", "p50 (ms)", "p95 (ms)", "p99 (ms)")
+    rows = {**report.by_endpoint(), "all": report.requests}
+    for endpoint, requests in rows.items():
+        print_row(
+            endpoint,
+            str(len(requests)),
+            str(sum(request.error is not None for request in requests)),
+            *(
+                f"{p * 1e3:.1f}"
+                for p in percentiles([request.seconds for request in requests])
+            ),
+        )
+
+    print(
+        f"\n{len(report.requests) / report.seconds:.1f} requests/s over "
+        f"{report.seconds:.1f} s"
+    )
+    delays = ", ".join(
+        f"p{q} {p * 1e3:.1f} ms"
+        for q, p in zip(_PERCENTILES, percentiles(report.start_delays))
+    )
+    print(f"Waited for a worker: {delays}")
+
+    if errors := report.errors():
+        print("\nErrors:")
+        for (endpoint, error), count in errors.most_common():
+            print(f"{count:>6}  {endpoint}  {error}")
+
+
+@contextlib.contextmanager
+def _target(args: argparse.Namespace) -> Iterator[StubGradingServer | None]:
+    """Point the client at `--url`, or at a local stub server without one.
+
+    The stub server gets a different API key from each student.
+    """
+    with contextlib.ExitStack() as stack:
+        url, iam_url = args.url, args.iam_url
+        server = None
+        if url is None:
+            server = stack.enter_context(
+                serve_in_background(
+                    StubConfig(
+                        latency=args.stub_latency,
+                        jitter=args.stub_latency,
+                        error_rate=args.stub_error_rate,
+                        seed=args.seed,
+                    )
+                )
+            )
+            url = iam_url = server.url
+            stack.enter_context(
+                patch("qc_grader.grader.auth.read_api_key", _student.get)
+            )
+        stack.enter_context(patch("qc_grader.grader.api.GRADER_BASE_URL", url))
+        if iam_url is not None:
+            stack.enter_context(patch("qc_grader.grader.auth.IAM_BASE_URL", iam_url))
+        yield server
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m qc_grader.benchmarks.classroom")
+    parser.add_argument("--students", type=int, default=300)
+    parser.add_argument(
+        "--concurrency", type=int, default=32, help="submissions in flight at once"
+    )
+    parser.add_argument(
+        "--arrivals", choices=["burst", "uniform", "poisson"], default="poisson"
+    )
+    parser.add_argument(
+        "--window", type=float, default=120.0, help="seconds students arrive over"
+    )
+    parser.add_argument("--url", help="grading server, by default a local stub")
+    parser.add_argument("--iam-url", help="IAM of the grading server")
+    parser.add_argument(
+        "--stub-latency", type=float, default=0.05, help="seconds, up to double"
+    )
+    parser.add_argument("--stub-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    mix = default_mix()
+    print(
+        f"{args.students} students, {args.concurrency} at once, "
+        f"{args.arrivals} arrivals over {args.window:g} s: "
+        + ", ".join(f"{s.name} x{s.weight:g}" for s in mix)
+        + "\n"
+    )
+    with _target(args):
+        report = run(
+            mix, args.students, args.concurrency, args.arrivals, args.window, args.seed
+        )
+    print_report(report)
+    print(
+        "\nStudents are threads of this process, so latencies include waiting for "
+        "the GIL."
+    )
+    if args.url is not None:
+        print("They all used the same API key.")
+
+
+if __name__ == "__main__":
+    main()
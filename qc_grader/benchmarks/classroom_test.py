@@ -0,0 +1,57 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import argparse
+import random
+
+from qc_grader.benchmarks import classroom
+from qc_grader.benchmarks.classroom import Submission, arrival_times, run
+from qc_grader.challenges.fallfest_2026 import intro
+
+
+def test_arrival_times():
+    rng = random.Random(0)
+    assert arrival_times(3, "burst", 10, rng) == [0, 0, 0]
+    assert arrival_times(4, "uniform", 10, rng) == [0, 2.5, 5, 7.5]
+    poisson = arrival_times(1000, "poisson", 10, rng)
+    assert poisson == sorted(poisson)
+    assert 8 < poisson[-1] < 12
+
+
+def test_run_against_the_stub_server(capsys):
+    mix = [
+        Submission("bool", 3, lambda: intro.grade_intro_ex1(True)),
+        Submission("str", 1, lambda: intro.grade_intro_ex10("answer")),
+    ]
+    args = argparse.Namespace(
+        url=None, iam_url=None, stub_latency=0.0, stub_error_rate=0.25, seed=3
+    )
+    with classroom._target(args) as server:
+        report = run(mix, students=20, concurrency=4, seed=3)
+
+    assert server is not None
+    # Each student got a token with their own API key.
+    assert len(set(server._users_by_token.values())) == 20
+
+    assert len(report.requests) == len(report.start_delays) == 20
+    assert set(report.by_endpoint()) <= {
+        "/submissions/fallfest_2026/intro/ex1",
+        "/submissions/fallfest_2026/intro/ex10",
+    }
+    errors = report.errors()
+    assert 0 < errors.total() < 20
+    assert {error for _, error in errors} == {"503 Service Unavailable"}
+    # The grading functions' own output is not printed.
+    assert capsys.readouterr().out == ""
+
+    classroom.print_report(report)
+    out = capsys.readouterr().out
+    assert "requests/s" in out
+    assert "503 Service Unavailable" in out
@@ -0,0 +1,109 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time, peak memory and wire size of encoding NumPy arrays."""
+
+from io import BytesIO
+from typing import Any
+
+import numpy as np
+
+from qc_grader.benchmarks import best_time, peak_memory, print_row
+from qc_grader.custom_encoder import to_json
+from qc_grader.custom_encoder.bitstrings import BitstringMatrix
+from qc_grader.custom_encoder.serializer import ndarray_to_npy_str
+
+
+def _legacy_ndarray_to_npy_str(obj: np.ndarray) -> str:
+    """The `numpy.save` + `BytesIO` implementation used before the single-buffer path."""
+    with BytesIO() as container:
+        np.save(container, obj, allow_pickle=False)
+        array = container.getvalue()
+    return array.decode("ISO-8859-1")
+
+
+def _arrays() -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed=42)
+    return {
+        "float64 (1M,)": rng.random(1_000_000),
+        "bool (100k, 52) samples": rng.random((100_000, 52)) < 0.5,
+        "float64 (2000, 2000)[:, ::2]": rng.random((2000, 2000))[:, ::2],
+        "float64 Fortran (1000, 1000)": np.asfortranarray(rng.random((1000, 1000))),
+    }
+
+
+def main() -> None:
+    print_row("array", "impl", "time (ms)", "peak (MB)", "peak / nbytes")
+    for label, array in _arrays().items():
+        for impl, encode in [
+            ("legacy", _legacy_ndarray_to_npy_str),
+            ("buffer", ndarray_to_npy_str),
+        ]:
+            seconds = best_time(lambda: encode(array))
+            peak = peak_memory(lambda: encode(array))
+            print_row(
+                label,
+                impl,
+                f"{seconds * 1e3:.1f}",
+                f"{peak / 1e6:.1f}",
+                f"{peak / array.nbytes:.2f}",
+            )
+
+    print()
+    print_row("to_json", "", "time (ms)", "peak (MB)", "peak / nbytes")
+    for label, array in _arrays().items():
+        seconds = best_time(lambda: to_json({"array": array}), repeat=3)
+        peak = peak_memory(lambda: to_json({"array": array}))
+        print_row(
+            label,
+            "",
+            f"{seconds * 1e3:.1f}",
+            f"{peak / 1e6:.1f}",
+            f"{peak / array.nbytes:.2f}",
+        )
+
+    print()
+    bench_bitstring_wire_size()
+
+
+_MAX_RAW_BYTES = 100_000_000
+
+
+def _shots(num_shots: int, num_bits: int, dtype: type) -> np.ndarray:
+    """Shots concentrated on a few thousand bitstrings, like a sampler's output."""
+    rng = np.random.default_rng(seed=7)
+    support = rng.random((4_096, num_bits)) < 0.3
+    weights = rng.zipf(1.5, len(support)).astype(float)
+    rows = rng.choice(len(support), num_shots, p=weights / weights.sum())
+    return support[rows].astype(dtype)
+
+
+def bench_bitstring_wire_size() -> None:
+    print_row("bitstring wire size (kB)", "raw", "packed", "deduplicated")
+    for num_bits in (26, 80):
+        for dtype in (bool, np.int64):
+            for num_shots in (10_000, 100_000, 1_000_000):
+                shots = _shots(num_shots, num_bits, dtype)
+                payloads: list[Any] = [
+                    BitstringMatrix.from_array(shots),
+                    BitstringMatrix.from_array(shots, deduplicate=True),
+                ]
+                # The raw JSON of the largest arrays runs to gigabytes.
+                if shots.nbytes <= _MAX_RAW_BYTES:
+                    payloads.insert(0, shots)
+                sizes = [f"{len(to_json(payload)) / 1e3:,.0f}" for payload in payloads]
+                print_row(
+                    f"{num_shots:,} x {num_bits} {np.dtype(dtype).name}",
+                    *(["-"] * (3 - len(sizes)) + sizes),
+                )
+
+
+if __name__ == "__main__":
+    main()
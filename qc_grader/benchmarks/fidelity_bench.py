@@ -0,0 +1,66 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time and peak memory of the lab3 ex2 mirror circuit fidelity check."""
+
+import math
+
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector, state_fidelity
+
+from qc_grader.benchmarks import best_time, peak_memory, print_row
+from qc_grader.grader.fidelity import zero_state_fidelity
+
+_STEPS = 4
+# The dense check needs 32 * 2**n bytes, so larger sizes are skipped.
+_LEGACY_MAX_QUBITS = 20
+
+
+def _mirror_ising(num_qubits: int, angle: float) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(_STEPS):
+        circuit.rx(angle, range(num_qubits))
+        for start in (0, 1):
+            for qubit in range(start, num_qubits - 1, 2):
+                circuit.cz(qubit, qubit + 1)
+        circuit.barrier()
+    return circuit.compose(circuit.inverse())  # type: ignore
+
+
+def _legacy_fidelity(circuit: QuantumCircuit) -> float:
+    """The dense check grade_lab3_ex2 did before."""
+    zero = Statevector.from_label("0" * circuit.num_qubits)
+    return float(state_fidelity(Statevector(circuit), zero))
+
+
+def _row(label: str, fidelity) -> list[str]:
+    seconds = best_time(fidelity, repeat=3)
+    peak = peak_memory(fidelity)
+    return [f"{seconds * 1e3:.1f}", f"{peak / 1e6:.1f}"]
+
+
+def main() -> None:
+    print_row(f"mirror ising, {_STEPS} steps", "time (ms)", "peak (MB)")
+    for num_qubits in (10, 20, 30, 50, 100):
+        for label, angle in [("rx(pi/8)", math.pi / 8), ("rx(pi/2)", math.pi / 2)]:
+            circuit = _mirror_ising(num_qubits, angle)
+            if num_qubits <= _LEGACY_MAX_QUBITS:
+                print_row(
+                    f"{num_qubits} qubits {label}, dense",
+                    *_row(label, lambda: _legacy_fidelity(circuit)),
+                )
+            print_row(
+                f"{num_qubits} qubits {label}, tiered",
+                *_row(label, lambda: zero_state_fidelity(circuit)),
+            )
+
+
+if __name__ == "__main__":
+    main()
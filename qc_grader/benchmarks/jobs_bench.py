@@ -0,0 +1,80 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Latency of fetching the four lab4b ex4 job results plus the bonus job."""
+
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.challenges.qgss_2026.lab4b_partition import exp_values
+from qc_grader.grader.jobs import clear_job_results, job_result, job_results
+
+# A typical round trip for `job.result()` of a finished job.
+_FETCH_SECONDS = 0.25
+
+
+class _DelayedJob:
+    """Stands in for a finished `RuntimeJobV2` whose result takes a while to download."""
+
+    def __init__(self, job_id: str, num_evs: int):
+        self._job_id = job_id
+        evs = np.random.default_rng(seed=0).uniform(-1, 1, num_evs)
+        self._result = [SimpleNamespace(data=SimpleNamespace(evs=evs))]
+
+    def job_id(self) -> str:
+        return self._job_id
+
+    def result(self):
+        time.sleep(_FETCH_SECONDS)
+        return self._result
+
+
+def _legacy_exp_map(job) -> dict[int, float]:
+    """The per-element dict grade_lab4b_ex4 built for every job before."""
+    node_exp_map = {}
+    idx = 0
+    for pub_result in job.result():
+        for ev in pub_result.data.evs:
+            node_exp_map[idx] = float(ev)
+            idx += 1
+    return node_exp_map
+
+
+def main() -> None:
+    jobs = [_DelayedJob(f"job-{i}", 1_600) for i in range(4)]
+    bonus = jobs[0]
+
+    def serial() -> None:
+        for job in jobs:
+            _legacy_exp_map(job)
+        _legacy_exp_map(bonus)
+
+    def cold() -> None:
+        clear_job_results()
+        for result in job_results(jobs):
+            exp_values(result)
+        exp_values(job_result(bonus))
+
+    def warm() -> None:
+        for result in job_results(jobs):
+            exp_values(result)
+        exp_values(job_result(bonus))
+
+    print_row(f"ex4 + bonus ({_FETCH_SECONDS * 1e3:.0f} ms/fetch)", "time (ms)")
+    print_row("serial, uncached", f"{best_time(serial, repeat=3) * 1e3:.0f}")
+    print_row("concurrent, cold cache", f"{best_time(cold, repeat=3) * 1e3:.0f}")
+    print_row("concurrent, warm cache", f"{best_time(warm, repeat=3) * 1e3:.2f}")
+
+
+if __name__ == "__main__":
+    main()
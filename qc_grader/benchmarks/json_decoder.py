@@ -0,0 +1,88 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Reading answers written by `to_json`, as the grading server does, for `stub_server`."""
+
+import json
+from fractions import Fraction
+from io import BytesIO
+from typing import Any, Callable
+from uuid import UUID
+
+import numpy
+from networkx import Graph
+from qiskit import qpy
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Operator, Pauli, SparsePauliOp, Statevector
+
+from qc_grader.custom_encoder.bitstrings import BitstringMatrix
+
+
+def _load_circuit(payload: dict) -> Any:
+    with BytesIO(payload["qc"].encode("ISO-8859-1")) as container:
+        return qpy.load(container)[0]
+
+
+def _load_npy_str(data: str) -> numpy.ndarray:
+    with BytesIO(data.encode("ISO-8859-1")) as container:
+        return numpy.load(container, allow_pickle=False)
+
+
+def load_bitstring_matrix(payload: dict) -> numpy.ndarray:
+    """Rebuild the array from the JSON object `to_json` writes for a `BitstringMatrix`."""
+    counts = payload["counts"]
+    return BitstringMatrix(
+        _load_npy_str(payload["packed"]),
+        tuple(payload["shape"]),
+        numpy.dtype(payload["dtype"]),
+        None if counts is None else _load_npy_str(counts),
+    ).to_array()
+
+
+def _load_graph(payload: dict) -> Graph:
+    graph = Graph()
+    graph.add_nodes_from(payload["nodes"])
+    graph.add_edges_from(payload["edges"])
+    return graph
+
+
+_LOADERS: dict[str, Callable[[dict], Any]] = {
+    "numpy.ndarray": lambda payload: _load_npy_str(payload["ndarray"]),
+    "BitstringMatrix": load_bitstring_matrix,
+    "numpy.complex128": lambda payload: numpy.complex128(
+        complex(payload["re"], payload["im"])
+    ),
+    "complex": lambda payload: complex(payload["re"], payload["im"]),
+    "Fraction": lambda payload: Fraction(payload["numerator"], payload["denominator"]),
+    "Parameter": lambda payload: Parameter(payload["name"], uuid=UUID(payload["uuid"])),
+    "TwoLocal": _load_circuit,
+    "QuantumCircuit": _load_circuit,
+    "Statevector": lambda payload: Statevector(payload["data"]),
+    "Operator": lambda payload: Operator(payload["data"]),
+    "Pauli": lambda payload: Pauli(payload["label"]),
+    "SparsePauliOp": lambda payload: SparsePauliOp.from_list(payload["op"]),
+    "Graph": _load_graph,
+    "dict_keys": lambda payload: payload["items"],
+}
+
+
+def _object_hook(payload: dict) -> Any:
+    loader = _LOADERS.get(payload.get("__class__", ""))
+    return payload if loader is None else loader(payload)
+
+
+def from_json(data: str) -> Any:
+    """Decode the output of `to_json`.
+
+    Primitive results and distributions stay the JSON objects they were written as,
+    since they cannot be rebuilt from what is sent, and so do NumPy scalars other than
+    complex numbers.
+    """
+    return json.loads(data, object_hook=_object_hook)
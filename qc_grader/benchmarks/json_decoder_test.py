@@ -0,0 +1,111 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import json
+from fractions import Fraction
+
+import networkx as nx
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.primitives import EstimatorResult
+from qiskit.quantum_info import Operator, Pauli, SparsePauliOp, Statevector
+
+from qc_grader.custom_encoder import to_json
+from qc_grader.custom_encoder.bitstrings import BitstringMatrix
+from qc_grader.benchmarks.json_decoder import from_json, load_bitstring_matrix
+
+_X = Parameter("x")
+
+
+def _circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.rz(_X, 1)
+    circuit.cx(0, 1)
+    return circuit
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [1, "two", 3.0, None],
+        np.complex128(1 + 2j),
+        1 - 2j,
+        Fraction(1, 3),
+        _X,
+        _circuit(),
+        Statevector.from_label("01"),
+        Operator(np.eye(4)),
+        Pauli("XZ"),
+        SparsePauliOp(["XZ", "YY"], [1, 2j]),  # type: ignore
+    ],
+)
+def test_round_trip(value):
+    assert from_json(to_json(value)) == value
+
+
+def test_arrays_round_trip():
+    array = np.arange(12, dtype=np.int16).reshape(3, 4)
+    samples = np.random.default_rng(0).random((20, 7)) < 0.5
+
+    decoded = from_json(
+        to_json({"array": array, "samples": BitstringMatrix.from_array(samples)})
+    )
+
+    np.testing.assert_array_equal(decoded["array"], array)
+    assert decoded["array"].dtype == array.dtype
+    np.testing.assert_array_equal(decoded["samples"], samples)
+
+
+def test_graph_and_keys():
+    graph = nx.path_graph(3)
+    graph[0][1]["weight"] = 5
+
+    decoded = from_json(to_json([graph, {"a": 1, "b": 2}.keys()]))
+
+    assert sorted(decoded[0].edges(data=True)) == sorted(graph.edges(data=True))
+    assert decoded[1] == ["a", "b"]
+
+
+def test_other_objects_stay_json():
+    decoded = from_json(to_json(EstimatorResult(np.array([0.5]), [{"shots": 10}])))
+    assert decoded["__class__"] == "EstimatorResult"
+    assert decoded["metadata"] == [{"shots": 10}]
+    np.testing.assert_array_equal(decoded["values"], [0.5])
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.random.default_rng(0).integers(0, 2, (50, 80)),
+        np.random.default_rng(1).random((40, 2, 13)) < 0.25,
+        np.array([1, 0, 1], dtype=np.uint8),
+        np.zeros((0, 9), dtype=bool),
+    ],
+)
+def test_bitstring_matrix_round_trip(array):
+    result = json.loads(to_json(BitstringMatrix.from_array(array)))
+
+    assert result["__class__"] == "BitstringMatrix"
+    loaded = load_bitstring_matrix(result)
+    assert loaded.dtype == array.dtype
+    np.testing.assert_array_equal(loaded, array)
+
+
+def test_bitstring_matrix_deduplicates_rows():
+    rows = np.array([[1, 0, 1], [0, 0, 1], [1, 0, 1], [1, 0, 1]], dtype=bool)
+
+    matrix = BitstringMatrix.from_array(rows, deduplicate=True)
+    loaded = load_bitstring_matrix(json.loads(to_json(matrix)))
+
+    np.testing.assert_array_equal(matrix.counts, [1, 3])
+    np.testing.assert_array_equal(loaded, rows[[1, 0, 2, 3]])
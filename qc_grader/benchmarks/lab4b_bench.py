@@ -0,0 +1,66 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Grader-side checks of the QGSS 2026 lab4b bonus exercise."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.challenges.qgss_2026.lab4b_partition import (
+    exp_map_matches,
+    exp_values,
+    set_matches,
+    split_by_bits,
+)
+
+
+def _legacy_check(numbers, best_bits, result_bonus, result) -> None:
+    """The list- and dict-based checks grade_lab4b_exbonus used before."""
+    node_exp_map = {}
+    idx = 0
+    for pub_result in result:
+        for ev in pub_result.data.evs:
+            node_exp_map[idx] = float(ev)
+            idx += 1
+    assert result_bonus["exp_map"] == node_exp_map
+    set0 = [int(numbers[i]) for i in range(len(numbers)) if best_bits[i] == 1]
+    set1 = [int(numbers[i]) for i in range(len(numbers)) if best_bits[i] == 0]
+    assert set0 == result_bonus["set0"] and set1 == result_bonus["set1"]
+
+
+def _check(numbers, best_bits, result_bonus, result) -> None:
+    assert exp_map_matches(result_bonus["exp_map"], exp_values(result))
+    set0, set1 = split_by_bits(numbers, best_bits)
+    assert set_matches(set0, result_bonus["set0"])
+    assert set_matches(set1, result_bonus["set1"])
+
+
+def main() -> None:
+    print_row("exbonus checks", "impl", "time (ms)")
+    rng = np.random.default_rng(seed=3)
+    for size in (1_600, 10_000, 100_000, 1_000_000):
+        numbers = rng.integers(1, 10_000, size).tolist()
+        best_bits = rng.integers(0, 2, size).tolist()
+        evs = rng.uniform(-1, 1, size)
+        result = [SimpleNamespace(data=SimpleNamespace(evs=evs))]
+        result_bonus = {
+            "set0": [n for n, bit in zip(numbers, best_bits) if bit == 1],
+            "set1": [n for n, bit in zip(numbers, best_bits) if bit == 0],
+            "exp_map": {i: np.float64(ev) for i, ev in enumerate(evs)},
+        }
+        for impl, check in [("legacy", _legacy_check), ("numpy", _check)]:
+            seconds = best_time(lambda: check(numbers, best_bits, result_bonus, result))
+            print_row(f"{size:,} numbers", impl, f"{seconds * 1e3:.2f}")
+
+
+if __name__ == "__main__":
+    main()
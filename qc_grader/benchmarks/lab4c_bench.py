@@ -0,0 +1,76 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Grader-side compute of the QGSS 2026 lab4c graders."""
+
+import time
+from pathlib import Path
+
+import numpy as np
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.challenges.qgss_2026 import lab4c
+from qc_grader.challenges.qgss_2026.lab4c import _diag_coulomb_depth2q
+from qc_grader.grader.backends import get_fake_backend, get_preset_pass_manager
+from qc_grader.grader.fixtures import load_npy_fixture
+
+# Alpha orbitals on the first 26 qubits of a heavy-hex row, beta orbitals on the next.
+_LAYOUT = tuple(range(52))
+_OTHER_LAYOUT = tuple(range(52, 104))
+
+
+def _clear_caches() -> None:
+    _diag_coulomb_depth2q.cache_clear()
+    get_preset_pass_manager.cache_clear()
+    get_fake_backend.cache_clear()
+
+
+def main() -> None:
+    print_row("grade_lab4c_ex1b depth", "time (ms)")
+    for num_pairs in (24, 26):
+        _clear_caches()
+        start = time.perf_counter()
+        _diag_coulomb_depth2q(_LAYOUT, num_pairs, 42)
+        cold = time.perf_counter() - start
+
+        # A new layout reuses the backend but needs a new pass manager and transpile.
+        start = time.perf_counter()
+        _diag_coulomb_depth2q(_OTHER_LAYOUT, num_pairs, 42)
+        new_layout = time.perf_counter() - start
+
+        warm = best_time(lambda: _diag_coulomb_depth2q(_LAYOUT, num_pairs, 42))
+
+        print_row(f"{num_pairs} pairs, cold", f"{cold * 1e3:.1f}")
+        print_row(f"{num_pairs} pairs, new layout", f"{new_layout * 1e3:.1f}")
+        print_row(f"{num_pairs} pairs, repeated layout", f"{warm * 1e3:.3f}")
+
+    print()
+    print_row("grade_lab4c_ex3b fixtures", "time (us)")
+    utils = Path(lab4c.__file__).parent / "utils"
+    np_load = best_time(
+        lambda: (
+            np.load(utils / "lab4c_test_samples.npy"),
+            np.load(utils / "lab4c_test_occ.npy"),
+        ),
+        repeat=100,
+    )
+    registry = best_time(
+        lambda: (
+            load_npy_fixture(lab4c._FIXTURES_PACKAGE, "utils/lab4c_test_samples.npy"),
+            load_npy_fixture(lab4c._FIXTURES_PACKAGE, "utils/lab4c_test_occ.npy"),
+        ),
+        repeat=100,
+    )
+    print_row("np.load per call", f"{np_load * 1e6:.1f}")
+    print_row("load_npy_fixture, repeated", f"{registry * 1e6:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time of preparing Qiskit Runtime options for an answer payload."""
+
+import json
+from dataclasses import asdict
+from typing import Any
+
+from qiskit_ibm_runtime.options import EstimatorOptions, SamplerOptions
+from qiskit_ibm_runtime.options.utils import Unset
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.grader.options import (
+    diff_options,
+    get_option,
+    options_to_dict,
+    sanitize_for_json,
+)
+
+
+def _legacy_sanitize_for_json(value: Any) -> Any:
+    """The `json.dumps`-probing implementation lab4b used before the per-type cache."""
+    if value is None:
+        return None
+    type_name = type(value).__name__
+    if type_name == "UnsetType" or repr(value) == "Unset":
+        return None
+    if isinstance(value, dict):
+        return {k: _legacy_sanitize_for_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        sanitized = [_legacy_sanitize_for_json(item) for item in value]
+        return sanitized if isinstance(value, list) else tuple(sanitized)
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _configured_options() -> tuple[SamplerOptions, EstimatorOptions]:
+    sampler = SamplerOptions()
+    sampler.dynamical_decoupling.enable = True  # type: ignore
+    sampler.dynamical_decoupling.sequence_type = "XY4"  # type: ignore
+    sampler.twirling.enable_gates = True  # type: ignore
+    sampler.environment.job_tags = ["qgss", "lab4b"]  # type: ignore
+
+    estimator = EstimatorOptions()
+    estimator.resilience.zne_mitigation = True  # type: ignore
+    estimator.resilience.zne.noise_factors = (1, 3, 5)  # type: ignore
+    estimator.resilience.zne.amplifier = "gate_folding"  # type: ignore
+    estimator.resilience.measure_mitigation = True  # type: ignore
+
+    return sampler, estimator
+
+
+def _options_trees() -> dict[str, Any]:
+    sampler, estimator = _configured_options()
+    return {
+        "SamplerOptions": asdict(sampler),
+        "EstimatorOptions": asdict(estimator),
+        "options_list (4 x Estimator)": [asdict(estimator)] * 4,
+    }
+
+
+_LAB3_EX1_PATHS = [
+    "dynamical_decoupling.enable",
+    "dynamical_decoupling.sequence_type",
+    "twirling.enable_gates",
+    "twirling.strategy",
+    "twirling.num_randomizations",
+    "resilience.measure_mitigation",
+    "resilience.zne_mitigation",
+    "resilience.zne.noise_factors",
+    "resilience.zne.amplifier",
+    "resilience.pec_mitigation",
+    "resilience.pec.max_overhead",
+]
+
+
+def _read_with_asdict(options: EstimatorOptions) -> list[Any]:
+    values = []
+    for path in _LAB3_EX1_PATHS:
+        value: Any = asdict(options)
+        for name in path.split("."):
+            value = value[name]
+        values.append(value)
+    return values
+
+
+def _legacy_dict_contains(full_dict: dict, subset_dict: dict) -> bool:
+    """The recursive check lab4b ex2 and ex4 used before `diff_options`."""
+    for key, value in subset_dict.items():
+        if key not in full_dict:
+            return False
+        if isinstance(value, dict) and isinstance(full_dict[key], dict):
+            if not _legacy_dict_contains(full_dict[key], value):
+                return False
+        elif full_dict[key] != value:
+            return False
+    return True
+
+
+def _set_options(value: Any) -> Any:
+    """Only the options that were set, like `job.inputs["options"]` of a runtime job."""
+    if not isinstance(value, dict):
+        return value
+    return {
+        k: _set_options(v)
+        for k, v in value.items()
+        if v is not Unset and not (isinstance(v, dict) and not _set_options(v))
+    }
+
+
+def bench_compare_options() -> None:
+    print_row("job options vs expected", "asdict (us)", "legacy (us)", "diff (us)")
+    for expected in _configured_options():
+        job_options = _set_options(options_to_dict(expected))
+        assert _legacy_dict_contains(asdict(expected), job_options)
+        assert not diff_options(expected, job_options)
+        # grade_lab4b_ex2/ex4 converted the expected options with `asdict` before.
+        with_asdict = best_time(
+            lambda: _legacy_dict_contains(asdict(expected), job_options), repeat=200
+        )
+        legacy = best_time(
+            lambda: _legacy_dict_contains(options_to_dict(expected), job_options),
+            repeat=200,
+        )
+        diff = best_time(lambda: diff_options(expected, job_options), repeat=200)
+        print_row(
+            type(expected).__name__,
+            f"{with_asdict * 1e6:.1f}",
+            f"{legacy * 1e6:.1f}",
+            f"{diff * 1e6:.1f}",
+        )
+
+
+def main() -> None:
+    _, estimator = _configured_options()
+    print_row("EstimatorOptions", "asdict (us)", "direct (us)", "speedup")
+    to_dict = best_time(lambda: asdict(estimator), repeat=200)
+    direct = best_time(lambda: options_to_dict(estimator), repeat=200)
+    print_row(
+        "full tree",
+        f"{to_dict * 1e6:.1f}",
+        f"{direct * 1e6:.1f}",
+        f"{to_dict / direct:.1f}x",
+    )
+    # lab3 ex1 called asdict once per options object; here once per field read.
+    to_dict = best_time(lambda: _read_with_asdict(estimator), repeat=50) / len(
+        _LAB3_EX1_PATHS
+    )
+    direct = best_time(
+        lambda: [get_option(estimator, path) for path in _LAB3_EX1_PATHS], repeat=200
+    ) / len(_LAB3_EX1_PATHS)
+    print_row(
+        "one field",
+        f"{to_dict * 1e6:.1f}",
+        f"{direct * 1e6:.1f}",
+        f"{to_dict / direct:.0f}x",
+    )
+
+    print()
+    print_row("options tree", "legacy (us)", "cached (us)", "speedup")
+    for label, tree in _options_trees().items():
+        assert sanitize_for_json(tree) == _legacy_sanitize_for_json(tree)
+        legacy = best_time(lambda: _legacy_sanitize_for_json(tree), repeat=200)
+        cached = best_time(lambda: sanitize_for_json(tree), repeat=200)
+        print_row(
+            label,
+            f"{legacy * 1e6:.1f}",
+            f"{cached * 1e6:.1f}",
+            f"{legacy / cached:.1f}x",
+        )
+
+    print()
+    bench_compare_options()
+
+
+if __name__ == "__main__":
+    main()
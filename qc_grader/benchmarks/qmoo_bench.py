@@ -0,0 +1,182 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Grader-side compute of the R2P 2026 lab_qmoo graders."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+from moocore import hypervolume
+
+from qc_grader.benchmarks import best_time, peak_memory, print_row
+from qc_grader.challenges.common.r2p_2026 import qmoo_files
+from qc_grader.challenges.common.r2p_2026.cut_values import CutValueEngine
+from qc_grader.challenges.common.r2p_2026.pareto import ParetoFrontCache
+from qc_grader.grader.archive import ResultArchiver
+
+_NUM_NODES = 80
+_NUM_OBJECTIVES = 3
+# The dense evaluation needs several (num_samples, num_nodes) int64 temporaries.
+_MAX_DENSE_SAMPLES = 100_000
+
+
+def _problem_graphs() -> list[nx.Graph]:
+    rng = np.random.default_rng(seed=42)
+    graphs = []
+    for seed in range(_NUM_OBJECTIVES):
+        graph = nx.random_regular_graph(3, _NUM_NODES, seed=seed)
+        for u, v in graph.edges:
+            graph[u][v]["weight"] = int(rng.integers(1, 100))
+        graphs.append(graph)
+    return graphs
+
+
+def _dense_cut_values(graphs: list[nx.Graph], samples: np.ndarray) -> np.ndarray:
+    """The dense implementation grade_lab_qmoo_ex4 used before CutValueEngine."""
+    adj_m = [nx.adjacency_matrix(graph).toarray() for graph in graphs]
+    return np.stack(
+        [np.sum((samples @ adj) * (1 - samples), axis=1) for adj in adj_m], axis=1
+    )
+
+
+def _samples(num_samples: int) -> np.ndarray:
+    rng = np.random.default_rng(seed=1)
+    return rng.integers(0, 2, (num_samples, _NUM_NODES), dtype=np.int64)
+
+
+def bench_cut_values() -> None:
+    graphs = _problem_graphs()
+    print_row("cut values (80 nodes, 3 objectives)", "impl", "time (ms)", "peak (MB)")
+    for num_samples in (1_000, 10_000, 100_000, 1_000_000):
+        samples = _samples(num_samples)
+        impls = [("sparse", lambda: CutValueEngine(graphs).evaluate(samples))]
+        if num_samples <= _MAX_DENSE_SAMPLES:
+            impls.insert(0, ("dense", lambda: _dense_cut_values(graphs, samples)))
+        for impl, evaluate in impls:
+            seconds = best_time(evaluate, repeat=3)
+            peak = peak_memory(evaluate)
+            print_row(
+                f"{num_samples:,} samples",
+                impl,
+                f"{seconds * 1e3:.1f}",
+                f"{peak / 1e6:.1f}",
+            )
+
+
+def _write_instance(directory: Path, graphs: list[nx.Graph]) -> None:
+    for i, graph in enumerate(graphs):
+        data = nx.node_link_data(graph, edges="links")
+        (directory / f"problem_graph_{i}.json").write_text(json.dumps(data))
+    (directory / "angles.json").write_text(json.dumps([[0.1] * 4, [0.2] * 4]))
+    (directory / "upper_bounds.json").write_text(json.dumps([1000] * _NUM_OBJECTIVES))
+    (directory / "lower_bounds.json").write_text(json.dumps([0] * _NUM_OBJECTIVES))
+
+
+def bench_load_problem() -> None:
+    print_row("load_problem (80 nodes, 3 graphs)", "time (ms)")
+    with tempfile.TemporaryDirectory() as directory:
+        _write_instance(Path(directory), _problem_graphs())
+        dirfn = f"{directory}/"
+
+        def cold() -> None:
+            qmoo_files._INSTANCES.clear()
+            qmoo_files.load_problem(dirfn, False)
+
+        print_row("cold, JSON", f"{best_time(cold) * 1e3:.2f}")
+        warm = best_time(lambda: qmoo_files.load_problem(dirfn, False))
+        print_row("warm, in-process cache", f"{warm * 1e3:.3f}")
+
+
+def bench_hypervolume() -> None:
+    graphs = _problem_graphs()
+    print_row("hypervolume (3 objectives)", "impl", "time (ms)")
+    for num_samples in (100_000, 1_000_000):
+        fis = CutValueEngine(graphs).evaluate(_samples(num_samples))
+        ref = np.zeros(_NUM_OBJECTIVES)
+
+        def cold() -> None:
+            ParetoFrontCache().hypervolume(fis, ref)
+
+        cache = ParetoFrontCache()
+        cache.hypervolume(fis, ref)
+
+        def resubmitted() -> None:
+            cache.hypervolume(fis, ref)
+
+        # Each call appends another 1,000 shots to the previous submission.
+        tail = fis[:3_000] + 1
+        appended = iter([np.concatenate([fis, tail[: 1_000 * i]]) for i in range(1, 4)])
+
+        def extended() -> None:
+            cache.hypervolume(next(appended), ref)
+
+        rows = [
+            ("moocore, all points", lambda: hypervolume(fis, ref=ref, maximise=True)),
+            ("front cache, cold", cold),
+            ("front cache, same points", resubmitted),
+            ("front cache, 1,000 appended", extended),
+        ]
+        for impl, run in rows:
+            seconds = best_time(run, repeat=3)
+            print_row(f"{num_samples:,} samples", impl, f"{seconds * 1e3:.1f}")
+
+
+def bench_archive_samples() -> None:
+    samples = _samples(100_000)
+    print_row("archive 100,000 samples", "blocking (ms)", "written (ms)", "size (MB)")
+    with tempfile.TemporaryDirectory() as directory:
+        path = f"{directory}/samples.npz"
+
+        def savez_compressed() -> None:
+            np.savez_compressed(path, array=samples)
+
+        seconds = best_time(savez_compressed, repeat=3)
+        size = Path(path).stat().st_size
+        print_row(
+            "np.savez_compressed", f"{seconds * 1e3:.1f}", "-", f"{size / 1e6:.2f}"
+        )
+
+        for compresslevel in (1, 0, None):
+            archiver = ResultArchiver(compresslevel=compresslevel)
+            written: list[str] = []
+            blocking = best_time(
+                lambda: written.append(archiver.save_array(path, samples)), repeat=3
+            )
+            archiver.flush()
+
+            def save_and_flush() -> None:
+                archiver.save_array(path, samples)
+                archiver.flush()
+
+            total = best_time(save_and_flush, repeat=3)
+            size = Path(written[-1]).stat().st_size
+            print_row(
+                f"ResultArchiver(compresslevel={compresslevel})",
+                f"{blocking * 1e3:.1f}",
+                f"{total * 1e3:.1f}",
+                f"{size / 1e6:.2f}",
+            )
+
+
+def main() -> None:
+    bench_cut_values()
+    print()
+    bench_load_problem()
+    print()
+    bench_hypervolume()
+    print()
+    bench_archive_samples()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+A local stand-in for the grading server and IAM, for offline load testing.
+
+`python -m qc_grader.benchmarks.stub_server` serves on `http://127.0.0.1:5000`, where
+`DEV=1` points the client. Set `QC_IAM_URL` to the same address and `QC_API_KEY` to
+anything to get tokens from it too. It accepts every answer the client can encode,
+and can add latency, errors and a payload limit.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator
+from urllib.parse import parse_qs, unquote
+
+import jwt
+
+from qc_grader.benchmarks.json_decoder import from_json
+
+_DEFAULT_PORT = 5000
+_TOKEN_SECONDS = 3600
+_REASONS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    413: "Request Entity Too Large",
+    503: "Service Unavailable",
+}
+# Read request bodies in chunks of this many bytes.
+_CHUNK_BYTES = 1 << 16
+
+
+@dataclass
+class StubConfig:
+    # Seconds each grading request takes, plus up to `jitter` more at random.
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Seconds each IAM token request takes.
+    iam_latency: float = 0.0
+    # Fraction of grading requests answered by a proxy error page.
+    error_rate: float = 0.0
+    # Fraction of answers graded as passed.
+    pass_rate: float = 1.0
+    # Largest request body accepted, like the limit set in front of the real server.
+    max_body_bytes: int = 25 * 1024 * 1024
+    # Whether to decode answers with `from_json`, which costs as much as on the server.
+    decode: bool = True
+    seed: int | None = None
+
+
+@dataclass
+class _Response:
+    status: int
+    body: bytes = b""
+    content_type: str = "application/json"
+
+    @classmethod
+    def json(cls, status: int, value: Any) -> "_Response":
+        return cls(status, json.dumps(value).encode())
+
+    @classmethod
+    def text(
+        cls, status: int, text: str, content_type: str = "text/plain"
+    ) -> "_Response":
+        return cls(status, text.encode(), content_type)
+
+
+@dataclass
+class _User:
+    # Scores by challenge, lab and exercise.
+    scores: dict[str, dict[str, dict[str, int]]] = field(default_factory=dict)
+    teams: dict[str, str] = field(default_factory=dict)
+
+
+class StubGradingServer:
+    """Serves the grading endpoints and IAM token endpoint on asyncio streams.
+
+    `stats` counts requests by route and status, e.g. `"submissions 200"`.
+    """
+
+    def __init__(
+        self,
+        config: StubConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or StubConfig()
+        self.host = host
+        self.port = port
+        self.stats: Counter[str] = Counter()
+        self.bytes_received = 0
+        self._random = random.Random(self.config.seed)
+        self._signing_key = secrets.token_bytes(32)
+        self._users_by_token: dict[str, str] = {}
+        self._users: dict[str, _User] = {}
+        self._server: asyncio.base_events.Server | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, backlog=1024
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while request_line := await reader.readline():
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length") or 0)
+                self.bytes_received += length
+                if length > self.config.max_body_bytes:
+                    # Read the body anyway, so the client sees the response rather than
+                    # a connection reset while it is still sending.
+                    await self._discard(reader, length)
+                    response = _Response.text(
+                        413,
+                        "<html><body><h1>413 Request Entity Too Large</h1></body></html>",
+                        "text/html",
+                    )
+                else:
+                    body = await reader.readexactly(length)
+                    response = await self._dispatch(method, target, headers, body)
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._write(writer, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _discard(reader: asyncio.StreamReader, length: int) -> None:
+        while length > 0:
+            chunk = await reader.read(min(length, _CHUNK_BYTES))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b"", length)
+            length -= len(chunk)
+
+    @staticmethod
+    async def _write(
+        writer: asyncio.StreamWriter, response: _Response, keep_alive: bool
+    ) -> None:
+        reason = _REASONS.get(response.status, "")
+        head = (
+            f"HTTP/1.1 {response.status} {reason}\r\n"
+            f"Content-Type: {response.content_type}\r\n"
+            f"Content-Length: {len(response.body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + response.body)
+        await writer.drain()
+
+    async def _dispatch(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> _Response:
+        path = unquote(target.split("?", 1)[0])
+        parts = path.strip("/").split("/")
+
+        if method == "POST" and path == "/identity/token":
+            route, response = "token", await self._token(body)
+        elif method == "POST" and parts[0] == "submissions" and len(parts) == 4:
+            route, response = (
+                "submissions",
+                await self._grading(
+                    headers,
+                    # ty does not follow the unpacking of a list into str arguments.
+                    lambda user: self._submit(user, *parts[1:], body),  # type: ignore
+                ),
+            )
+        elif method == "GET" and parts[0] == "progress" and len(parts) == 2:
+            route, response = (
+                "progress",
+                await self._grading(
+                    headers, lambda user: self._progress(user, parts[1])
+                ),
+            )
+        elif method == "POST" and path == "/register-team":
+            route, response = (
+                "register-team",
+                await self._grading(
+                    headers, lambda user: self._register_team(user, body)
+                ),
+            )
+        else:
+            route, response = "unknown", _Response.text(404, "Not found")
+
+        self.stats[f"{route} {response.status}"] += 1
+        return response
+
+    async def _token(self, body: bytes) -> _Response:
+        form = parse_qs(body.decode())
+        api_key = form.get("apikey", [""])[0]
+        if not api_key:
+            return _Response.json(400, {"errorMessage": "Provided API key is empty"})
+        await asyncio.sleep(self.config.iam_latency)
+
+        now = int(time.time())
+        access_token = jwt.encode(
+            {
+                "sub": api_key,
+                "iat": now,
+                "exp": now + _TOKEN_SECONDS,
+                "jti": secrets.token_hex(8),
+            },
+            self._signing_key,
+            algorithm="HS256",
+        )
+        self._users_by_token[access_token] = api_key
+        return _Response.json(
+            200,
+            {
+                "access_token": access_token,
+                "refresh_token": "not-supported",
+                "token_type": "Bearer",
+                "expires_in": _TOKEN_SECONDS,
+                "expiration": now + _TOKEN_SECONDS,
+            },
+        )
+
+    async def _grading(
+        self, headers: dict[str, str], handle: Callable[[_User], Awaitable[_Response]]
+    ) -> _Response:
+        token = headers.get("authorization", "").removeprefix("Bearer ")
+        user = self._users_by_token.get(token)
+        if user is None:
+            return _Response.text(401, "Invalid or expired token")
+
+        config = self.config
+        await asyncio.sleep(config.latency + self._random.random() * config.jitter)
+        if self._random.random() < config.error_rate:
+            return _Response.text(
+                503,
+                "<html><body><h1>503 Service Unavailable</h1></body></html>",
+                "text/html",
+            )
+        return await handle(self._users.setdefault(user, _User()))
+
+    def _decode(self, body: bytes) -> tuple[str, Any]:
+        answer_json = json.loads(body)["answer"]
+        return answer_json, from_json(answer_json) if self.config.decode else None
+
+    async def _submit(
+        self, user: _User, challenge: str, lab: str, exercise: str, body: bytes
+    ) -> _Response:
+        try:
+            # Decoding large answers, e.g. circuits with qpy, would block every other
+            # connection if it ran on the event loop.
+            answer_json, answer = await asyncio.get_running_loop().run_in_executor(
+                None, self._decode, body
+            )
+        except Exception as e:
+            return _Response.text(400, f"Could not read your answer: {e}")
+
+        passed = self._random.random() < self.config.pass_rate
+        score = 1 if passed else 0
+        user.scores.setdefault(challenge, {}).setdefault(lab, {})[exercise] = score
+        received = type(answer).__name__ if self.config.decode else "an answer"
+        return _Response.json(
+            200,
+            {
+                "passed": passed,
+                "score": score,
+                "msg": f"The stub server received {received} "
+                f"({len(answer_json)} bytes).",
+            },
+        )
+
+    async def _progress(self, user: _User, challenge: str) -> _Response:
+        labs = user.scores.get(challenge, {})
+        per_lab = [
+            {
+                "name": lab,
+                "score_total": sum(exercises.values()),
+                "num_exercises_passed": sum(1 for s in exercises.values() if s > 0),
+                "num_exercises": len(exercises),
+                "per_exercise": [
+                    {"name": name, "score": score, "passed": score > 0}
+                    for name, score in exercises.items()
+                ],
+            }
+            for lab, exercises in labs.items()
+        ]
+        return _Response.json(
+            200,
+            {
+                "challenge_aggregate": {
+                    "score_total": sum(lab["score_total"] for lab in per_lab),
+                    "num_exercises_passed": sum(
+                        lab["num_exercises_passed"] for lab in per_lab
+                    ),
+                    "num_exercises": sum(lab["num_exercises"] for lab in per_lab),
+                },
+                "per_lab": per_lab,
+            },
+        )
+
+    async def _register_team(self, user: _User, body: bytes) -> _Response:
+        try:
+            request = json.loads(body)
+            user.teams[request["challenge_name"]] = request["team_name"]
+        except (ValueError, KeyError, TypeError):
+            return _Response.text(400, "Expected a challenge_name and team_name")
+        return _Response(204)
+
+
+@contextlib.contextmanager
+def serve_in_background(
+    config: StubConfig | None = None, host: str = "127.0.0.1", port: int = 0
+) -> Iterator[StubGradingServer]:
+    """Run a `StubGradingServer` on an event loop in a background thread."""
+    server = StubGradingServer(config, host, port)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+        loop.run_until_complete(server.close())
+        # Connections kept alive by clients are still waiting for a request.
+        connections = asyncio.all_tasks(loop)
+        for task in connections:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*connections, return_exceptions=True))
+        loop.close()
+
+    thread = threading.Thread(target=run, name="qc-grader-stub-server", daemon=True)
+    thread.start()
+    started.wait()
+    try:
+        yield server
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+
+async def _serve(config: StubConfig, host: str, port: int) -> None:
+    server = StubGradingServer(config, host, port)
+    await server.start()
+    print(f"Stub grading server listening on {server.url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+        print(f"Requests: {dict(server.stats)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m qc_grader.benchmarks.stub_server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=_DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--iam-latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--pass-rate", type=float, default=1.0)
+    parser.add_argument("--max-body-mb", type=float, default=25.0)
+    parser.add_argument("--no-decode", action="store_true")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        iam_latency=args.iam_latency,
+        error_rate=args.error_rate,
+        pass_rate=args.pass_rate,
+        max_body_bytes=int(args.max_body_mb * 1024 * 1024),
+        decode=not args.no_decode,
+        seed=args.seed,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(config, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import requests
+from qiskit import QuantumCircuit
+
+from qc_grader.benchmarks.stub_server import StubConfig, serve_in_background
+from qc_grader.grader.api import send_request
+from qc_grader.grader.grade import _check_progress, _join_team, grade_answer
+
+
+@contextmanager
+def _client_of(config: StubConfig):
+    with (
+        serve_in_background(config) as server,
+        patch.dict(os.environ, {"QC_API_KEY": "student"}),
+        patch("qc_grader.grader.auth.IAM_BASE_URL", server.url),
+        patch("qc_grader.grader.api.GRADER_BASE_URL", server.url),
+    ):
+        yield server
+
+
+def test_grading_through_the_client(capsys):
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    with _client_of(StubConfig(seed=1)) as server:
+        grade_answer(qc, "lab1", "ex1", "ch1")
+        assert "received QuantumCircuit" in capsys.readouterr().out
+        grade_answer(np.zeros((3, 4), dtype=bool), "lab1", "ex2", "ch1")
+        assert "received ndarray" in capsys.readouterr().out
+
+        _join_team("team", "ch1")
+        _check_progress("ch1")
+        out = capsys.readouterr().out
+        assert "Failed" not in out
+        assert "2/2" in out
+
+    assert server.stats == {
+        "token 200": 4,
+        "submissions 200": 2,
+        "register-team 204": 1,
+        "progress 200": 1,
+    }
+
+
+def test_failures():
+    config = StubConfig(max_body_bytes=100, error_rate=0.5, seed=0)
+    with _client_of(config) as server:
+        with pytest.raises(Exception, match="413 Request Entity Too Large"):
+            send_request("/submissions/ch1/lab1/ex1", {"answer": "x" * 200})
+
+        errors = 0
+        for _ in range(20):
+            try:
+                send_request("/progress/ch1", method="GET")
+            except Exception as e:
+                assert str(e) == "503 Service Unavailable"
+                errors += 1
+        assert 0 < errors < 20
+        assert server.stats["progress 503"] == errors
+
+        response = requests.get(f"{server.url}/progress/ch1")
+        assert response.status_code == 401
+
+
+def test_decoding_does_not_block_other_requests():
+    decoding = threading.Event()
+    done = threading.Event()
+    # Whether the progress request was answered while the answer was being decoded.
+    answered = []
+
+    def slow_from_json(data):
+        decoding.set()
+        answered.append(done.wait(5))
+
+    with (
+        _client_of(StubConfig()),
+        patch("qc_grader.benchmarks.stub_server.from_json", slow_from_json),
+        ThreadPoolExecutor(1) as workers,
+    ):
+        submission = workers.submit(
+            send_request, "/submissions/ch1/lab1/ex1", {"answer": "1"}
+        )
+        assert decoding.wait(5)
+        send_request("/progress/ch1", method="GET")
+        done.set()
+        submission.result()
+    assert answered == [True]
@@ -0,0 +1,368 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Times of the client's hot paths, compared with stored baselines.
+
+`python -m qc_grader.benchmarks.suite` exits with status 1 if any case got more than
+`--threshold` times slower than its baseline in `baselines.json`. `--save` stores the
+current times as the new baselines, which should be done on the machine the check
+runs on. `--filter` runs only the cases whose names contain it.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from unittest.mock import patch
+
+import networkx as nx
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import QFTGate, TwoLocal
+from qiskit.primitives import (
+    EstimatorResult,
+    PrimitiveResult,
+    PubResult,
+    SamplerResult,
+)
+from qiskit.primitives.containers import DataBin
+from qiskit.quantum_info import Operator, Pauli, SparsePauliOp, Statevector
+from qiskit.result import ProbDistribution, QuasiDistribution
+from qiskit_ibm_runtime.options import SamplerOptions
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.benchmarks.stub_server import StubConfig, serve_in_background
+from qc_grader.challenges.common.r2p_2026.cut_values import CutValueEngine
+from qc_grader.challenges.common.r2p_2026.pareto import ParetoFrontCache
+from qc_grader.challenges.qgss_2026 import lab4c
+from qc_grader.custom_encoder import to_json
+from qc_grader.custom_encoder.bitstrings import BitstringMatrix
+from qc_grader.custom_encoder.serializer import circuit_to_bytes
+from qc_grader.grader.auth import get_access_token
+from qc_grader.grader.grade import (
+    ProgressResponse,
+    determine_progress_response,
+    grade_answer,
+)
+from qc_grader.grader.options import options_to_dict, sanitize_for_json
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+# A case regresses when it takes this many times its baseline.
+DEFAULT_THRESHOLD = 1.75
+# Fast cases are called in a loop that takes at least this long, to time them stably.
+_MIN_LOOP_SECONDS = 0.05
+
+Cases = dict[str, Callable[[], Any]]
+
+
+def _to_json_cases() -> Cases:
+    rng = np.random.default_rng(seed=42)
+    x = Parameter("x")
+    quasi = QuasiDistribution({i: 1 / 1024 for i in range(1024)}, shots=4096)
+    values = {
+        "ndarray float64 (1k,)": rng.random(1_000),
+        "ndarray float64 (1M,)": rng.random(1_000_000),
+        "BitstringMatrix (100k, 52)": BitstringMatrix.from_array(
+            rng.random((100_000, 52)) < 0.5
+        ),
+        "complex128 x1k": [np.complex128(v) for v in rng.random(1_000)],
+        "complex x1k": [complex(v, -v) for v in rng.random(1_000)],
+        "Fraction x1k": [Fraction(i, 7) for i in range(1_000)],
+        "Parameter x1k": [x] * 1_000,
+        "TwoLocal (10q, 3 reps)": TwoLocal(10, "ry", "cz", reps=3),
+        "QuantumCircuit (5q, 10 gates)": QuantumCircuit(5).compose(
+            QFTGate(5).definition
+        ),
+        "QuantumCircuit (50q, 10k gates)": _random_circuit(50, 10_000, rng),
+        "SamplerResult (10 x 1k)": SamplerResult([quasi] * 10, [{}] * 10),
+        "EstimatorResult (1k values)": EstimatorResult(rng.random(1_000), [{}] * 1_000),
+        "PrimitiveResult (1k evs)": PrimitiveResult(
+            [PubResult(DataBin(evs=rng.random(1_000), shape=(1_000,)))]
+        ),
+        "QuasiDistribution (1k)": quasi,
+        "ProbDistribution (1k)": ProbDistribution(
+            {i: 1 / 1024 for i in range(1024)}, shots=4096
+        ),
+        "Statevector (16q)": Statevector.from_label("0" * 16),
+        "Operator (8q)": Operator(np.eye(2**8)),
+        "Pauli (100q)": Pauli("XYZI" * 25),
+        "SparsePauliOp (10k x 20q)": SparsePauliOp(
+            ["".join(rng.choice(list("IXYZ"), 20)) for _ in range(10_000)]
+        ),
+        "Graph (1k nodes)": nx.random_regular_graph(3, 1_000, seed=0),
+        "dict_keys x10k": dict.fromkeys(range(10_000)).keys(),
+    }
+    return {
+        f"to_json {name}": lambda v=value: to_json(v) for name, value in values.items()
+    }
+
+
+def _random_circuit(
+    num_qubits: int, num_gates: int, rng: np.random.Generator
+) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(num_gates // 2):
+        a, b = rng.choice(num_qubits, 2, replace=False)
+        circuit.rz(float(rng.random()), int(a))
+        circuit.cz(int(a), int(b))
+    return circuit
+
+
+def _progress_document(num_labs: int, num_exercises: int) -> ProgressResponse:
+    return {
+        "challenge_aggregate": {
+            "score_total": num_labs * num_exercises,
+            "num_exercises_passed": num_labs * num_exercises // 2,
+            "num_exercises": num_labs * num_exercises,
+        },
+        "per_lab": [
+            {
+                "name": f"lab{lab}",
+                "score_total": num_exercises,
+                "num_exercises_passed": num_exercises // 2,
+                "num_exercises": num_exercises,
+                "per_exercise": [
+                    {"name": f"ex{exercise}", "score": 1, "passed": exercise % 2 == 0}
+                    for exercise in range(num_exercises)
+                ],
+            }
+            for lab in range(num_labs)
+        ],
+    }
+
+
+def _client_cases() -> Cases:
+    rng = np.random.default_rng(seed=42)
+    large_circuit = _random_circuit(50, 10_000, rng)
+    sampler_options = SamplerOptions()
+    sampler_options.dynamical_decoupling.enable = True  # type: ignore
+    options = [options_to_dict(sampler_options)] * 10
+    progress = _progress_document(20, 50)
+    return {
+        "circuit_to_bytes (50q, 10k gates)": lambda: circuit_to_bytes(large_circuit),
+        "sanitize_for_json (10 options)": lambda: sanitize_for_json(options),
+        "progress response (20 labs x 50)": (
+            lambda: determine_progress_response(progress)
+        ),
+        "progress response (one lab)": (
+            lambda: determine_progress_response(progress, lab_name="lab19")
+        ),
+    }
+
+
+def _grader_cases() -> Cases:
+    rng = np.random.default_rng(seed=1)
+    graphs = []
+    for seed in range(3):
+        graph = nx.random_regular_graph(3, 80, seed=seed)
+        for u, v in graph.edges:
+            graph[u][v]["weight"] = int(rng.integers(1, 100))
+        graphs.append(graph)
+    samples = rng.integers(0, 2, (100_000, 80), dtype=np.int64)
+    fis = CutValueEngine(graphs).evaluate(samples)
+    ref = np.zeros(3)
+
+    def ex1b_depth() -> None:
+        # Keep the cached pass manager, but transpile again.
+        lab4c._diag_coulomb_depth2q.cache_clear()
+        lab4c._diag_coulomb_depth2q(tuple(range(52)), 24, 42)
+
+    return {
+        "lab4c ex1b depth (24 pairs)": ex1b_depth,
+        "qmoo cut values (100k samples)": lambda: CutValueEngine(graphs).evaluate(
+            samples
+        ),
+        "qmoo hypervolume (100k samples)": lambda: ParetoFrontCache().hypervolume(
+            fis, ref
+        ),
+    }
+
+
+@contextlib.contextmanager
+def _stub_server() -> Iterator[None]:
+    """Point the client at a local server that passes every answer."""
+    with serve_in_background(StubConfig(decode=False)) as server:
+        with (
+            patch.dict(os.environ, {"QC_API_KEY": "bench"}),
+            patch("qc_grader.grader.auth.IAM_BASE_URL", server.url),
+        ):
+            token = get_access_token()
+        with (
+            patch("qc_grader.grader.api.GRADER_BASE_URL", server.url),
+            # Time grading rather than a token request per call.
+            patch("qc_grader.grader.api.get_access_token", return_value=token),
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            yield
+
+
+def _end_to_end_cases() -> Cases:
+    rng = np.random.default_rng(seed=42)
+    samples = rng.random((100_000, 52)) < 0.5
+    return {
+        "grade_answer (3 ints)": lambda: grade_answer(
+            [1, 2, 3], "lab1", "ex1", "bench"
+        ),
+        "grade_answer (100k, 52) bools": lambda: grade_answer(
+            samples, "lab1", "ex1", "bench"
+        ),
+    }
+
+
+def _loop(fn: Callable[[], Any]) -> tuple[Callable[[], None], int]:
+    """Return a loop calling `fn` enough times to take a stable time, and the count."""
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+    number = max(1, int(_MIN_LOOP_SECONDS / max(first, 1e-9)))
+
+    def loop() -> None:
+        for _ in range(number):
+            fn()
+
+    return loop, number
+
+
+def _calibration() -> None:
+    """A fixed workload whose time tracks how fast the machine is running right now."""
+    json.dumps([{"a": i, "b": [i * 0.5] * 4, "c": str(i)} for i in range(2_000)])
+
+
+@dataclass(frozen=True)
+class Timing:
+    seconds: float
+    # Time of `_calibration` alongside, to tell the case apart from the machine.
+    calibration_seconds: float
+
+    @property
+    def relative(self) -> float:
+        return self.seconds / self.calibration_seconds
+
+
+def _time(fn: Callable[[], Any], rounds: int = 5) -> Timing:
+    loop, number = _loop(fn)
+    calibration_loop, calibration_number = _loop(_calibration)
+    # Alternate, so that both best times come from when the machine ran fastest.
+    seconds = calibration_seconds = float("inf")
+    for _ in range(rounds):
+        calibration_seconds = min(calibration_seconds, best_time(calibration_loop, 1))
+        seconds = min(seconds, best_time(loop, 1))
+    return Timing(seconds / number, calibration_seconds / calibration_number)
+
+
+def run(name_filter: str = "") -> dict[str, Timing]:
+    """Time every case whose name contains `name_filter`."""
+    results = {}
+    with _stub_server():
+        cases = {
+            **_to_json_cases(),
+            **_client_cases(),
+            **_grader_cases(),
+            **_end_to_end_cases(),
+        }
+        for name, fn in cases.items():
+            if name_filter in name:
+                results[name] = _time(fn)
+    return results
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> dict[str, Timing]:
+    if not path.exists():
+        return {}
+    return {
+        name: Timing(**timing)
+        for name, timing in json.loads(path.read_text())["cases"].items()
+    }
+
+
+def save_baselines(results: dict[str, Timing], path: Path = BASELINES_PATH) -> None:
+    """Store `results` as the baselines, keeping those of cases that did not run."""
+    baselines = {**load_baselines(path), **results}
+    document = {
+        "machine": f"{platform.machine()}, {os.cpu_count()} CPUs, "
+        f"Python {platform.python_version()}",
+        "cases": {name: asdict(baselines[name]) for name in sorted(baselines)},
+    }
+    # Write atomically, so an interrupted run does not lose the old baselines.
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False
+    ) as file:
+        file.write(json.dumps(document, indent=2) + "\n")
+    os.replace(file.name, path)
+
+
+def slowdown(timing: Timing, baseline: Timing) -> float:
+    """Return how many times slower `timing` is than `baseline` on the same machine.
+
+    Both are measured relative to the calibration workload, which takes out most of
+    the difference between machines, and between runs on a machine whose speed varies.
+    """
+    return timing.relative / baseline.relative
+
+
+def regressions(
+    results: dict[str, Timing], baselines: dict[str, Timing], threshold: float
+) -> list[str]:
+    """Return the names of cases more than `threshold` times slower than baseline."""
+    return [
+        name
+        for name, timing in results.items()
+        if name in baselines and slowdown(timing, baselines[name]) > threshold
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m qc_grader.benchmarks.suite")
+    parser.add_argument("--save", action="store_true", help="store new baselines")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--filter", default="", help="only run cases matching this")
+    args = parser.parse_args(argv)
+
+    results = run(args.filter)
+    baselines = load_baselines()
+    slower = regressions(results, baselines, args.threshold)
+
+    print_row("case", "baseline (ms)", "now (ms)", "slowdown")
+    for name, timing in results.items():
+        baseline = baselines.get(name)
+        print_row(
+            name,
+            f"{baseline.seconds * 1e3:.3f}" if baseline else "-",
+            f"{timing.seconds * 1e3:.3f}",
+            (f"{slowdown(timing, baseline):.2f}" if baseline else "new")
+            + (" !" if name in slower else ""),
+        )
+
+    if args.save:
+        save_baselines(results)
+        print(f"\nSaved {len(results)} baselines to {BASELINES_PATH}")
+        return 0
+    if slower:
+        print(
+            f"\n{len(slower)} case(s) took more than {args.threshold:g} times "
+            f"their baseline: {', '.join(slower)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
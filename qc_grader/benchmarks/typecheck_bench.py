@@ -0,0 +1,66 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time `@typechecked` spends on large answers under each type check policy."""
+
+from typing import Any, Callable, Sequence
+
+from qiskit.quantum_info import SparsePauliOp
+from typeguard import CollectionCheckStrategy, typechecked
+
+from qc_grader.benchmarks import best_time, print_row
+from qc_grader.grader import set_typecheck_policy
+
+_NUM_PAIRS = 100_000
+_NUM_COUNTS = 100_000
+_NUM_OPERATORS = 1_000
+
+
+# Graders annotated like lab4c ex1a, a sampler result and lab4b's observables.
+@typechecked(collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS)
+def _grade_pairs(alpha_beta_indices: Sequence[Sequence[int]]) -> None:
+    pass
+
+
+@typechecked
+def _grade_counts(counts: dict[str, int]) -> None:
+    pass
+
+
+@typechecked
+def _grade_operators(observables: list[SparsePauliOp]) -> None:
+    pass
+
+
+def main() -> None:
+    pairs = [[i, i + 1] for i in range(_NUM_PAIRS)]
+    counts = {format(i, "017b"): i for i in range(_NUM_COUNTS)}
+    operators = [SparsePauliOp("Z" * 20)] * _NUM_OPERATORS
+    cases: list[tuple[Callable[[Any], None], Any]] = [
+        (_grade_pairs, pairs),
+        (_grade_counts, counts),
+        (_grade_operators, operators),
+    ]
+
+    print_row("policy", "pairs (ms)", "counts (ms)", "operators (ms)")
+    for policy in (None, "full", "first", "sampled"):
+        set_typecheck_policy(policy)
+        print_row(
+            policy or "grader's own",
+            *(
+                f"{best_time(lambda: grade(answer)) * 1e3:.3f}"
+                for grade, answer in cases
+            ),
+        )
+    set_typecheck_policy(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from qc_grader.challenges.common.r2p_2026.cut_values import CutValueEngine
+
+
+def _weighted_graphs(num_nodes: int, num_objectives: int) -> list[nx.Graph]:
+    rng = np.random.default_rng(seed=7)
+    graphs = []
+    for seed in range(num_objectives):
+        graph = nx.random_regular_graph(3, num_nodes, seed=seed)
+        for u, v in graph.edges:
+            graph[u][v]["weight"] = int(rng.integers(1, 10))
+        graphs.append(graph)
+    return graphs
+
+
+def test_cut_values_match_dense_evaluation():
+    graphs = _weighted_graphs(20, 3)
+    samples = np.random.default_rng(seed=1).integers(0, 2, (37, 20))
+
+    # Small chunks so several chunks, including a partial one, are evaluated.
+    result = CutValueEngine(graphs, chunk_elements=600).evaluate(samples)
+
+    expected = np.stack(
+        [
+            np.sum((samples @ adj) * (1 - samples), axis=1)
+            for adj in (nx.adjacency_matrix(g).toarray() for g in graphs)
+        ],
+        axis=1,
+    )
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_cut_values_rejects_wrong_width():
+    engine = CutValueEngine(_weighted_graphs(10, 2))
+
+    with pytest.raises(ValueError, match="num_samples, 10"):
+        engine.evaluate(np.zeros((4, 11)))
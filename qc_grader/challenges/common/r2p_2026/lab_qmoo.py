@@ -8,22 +8,26 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-import pickle
 from datetime import datetime
 from typing import Any, Callable
 
-import networkx as nx
 import numpy as np
-from moocore import hypervolume
 from qiskit import QuantumCircuit
 from typeguard import check_type, typechecked
 
+from qc_grader.grader.archive import get_archiver
+from qc_grader.grader.candidates import evaluate
 from qc_grader.grader.grade import grade_answer
 
+from .cut_values import CutValueEngine
+from .pareto import ParetoFrontCache
 from .qmoo_files import load_problem
 
 _LAB = "lab_qmoo"
 
+# Resubmissions usually repeat or extend the previous samples.
+_PARETO_FRONTS = ParetoFrontCache()
+
 
 def _create_grade_function(challenge: str):
     """Create a grade function for a specific challenge."""
@@ -40,26 +44,25 @@ def _create_grade_lab_qmoo_ex1(_grade):
     @typechecked
     def grade_lab_qmoo_ex1(gen_cvecs: Callable) -> None:
         samples = []
-        for _ in range(3):
-            for n in [10, 100, 1000]:
-                v = gen_cvecs(n_samples=n)
-                check_type(v, np.array)
-                if v.shape != (n, 3):
-                    print(
-                        "Wrong shape generated for",
-                        n,
-                        "samples, shape=",
-                        v.shape,
-                        "expected=",
-                        (n, 3),
-                    )
-                    continue
-
-                if not np.issubdtype(v.dtype, np.number):
-                    print("Numpy array includes non-numbers!")
-                    continue
-
-                samples.append(v)
+        for evaluation in evaluate(gen_cvecs, [10, 100, 1000] * 3, "n_samples"):
+            n, v = evaluation.input, evaluation.value
+            check_type(v, np.array)
+            if v.shape != (n, 3):
+                print(
+                    "Wrong shape generated for",
+                    n,
+                    "samples, shape=",
+                    v.shape,
+                    "expected=",
+                    (n, 3),
+                )
+                continue
+
+            if not np.issubdtype(v.dtype, np.number):
+                print("Numpy array includes non-numbers!")
+                continue
+
+            samples.append(v)
 
         answer_dict = {"samples": samples}
         _grade(answer_dict, "ex1")
@@ -117,28 +120,19 @@ def _create_grade_lab_qmoo_ex4(_grade):
         fn_hvs = f"results/3_regular_static_80q/hvs_{timestamp}.npz"
         fn_params = f"results/3_regular_static_80q/params_{timestamp}.npz"
         fn_job = f"results/3_regular_static_80q/job_{timestamp}.npz"
-        np.savez_compressed(fn_samples, array=samples)
-        np.savez_compressed(fn_hvs, array=np.array(user_hv))
-        pickle.dump(params, open(fn_params, "wb"))
-        pickle.dump(job_ids, open(fn_job, "wb"))
+        # Written in the background, so grading doesn't wait on compression.
+        archiver = get_archiver()
+        archiver.save_array(fn_samples, samples)
+        archiver.save_array(fn_hvs, np.array(user_hv))
+        archiver.save_pickle(fn_params, params)
+        archiver.save_pickle(fn_job, job_ids)
 
         moo_graphs, _, upper, lower = load_problem(
             "./instances/3_regular_static_80q/", False
         )
-        n_obj = len(moo_graphs)
-
-        adj_m = [nx.adjacency_matrix(moo_graphs[i]).toarray() for i in range(n_obj)]
-        post_samples = samples
-
-        fis = np.stack(
-            [
-                np.sum((post_samples @ adj_m[i]) * (1 - post_samples), axis=1)
-                for i in range(n_obj)
-            ],
-            axis=1,
-        )
+        fis = CutValueEngine(moo_graphs).evaluate(samples)
 
-        hv = hypervolume(fis, ref=lower, maximise=True)
+        hv = _PARETO_FRONTS.hypervolume(fis, ref=lower)
 
         if abs(hv - user_hv) > 1000:
             print(
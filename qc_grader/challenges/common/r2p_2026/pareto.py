@@ -0,0 +1,143 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import hashlib
+
+import numpy as np
+from moocore import hypervolume
+
+# Bounds the temporaries of the filters below to a few MB.
+_CHUNK_ELEMENTS = 1 << 20
+# Highest-scoring points whose front is used to discard most of the rest up front.
+_PILOT_ROWS = 256
+_BLOCK_ROWS = 128
+
+
+def _weakly_dominated(front: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Mask of the `points` that some row of `front` is at least as good as everywhere."""
+    if len(front) > len(points):
+        # Few points against a large front: compare them with every front row at once.
+        dominated = np.zeros(len(points), dtype=bool)
+        rows = max(1, _CHUNK_ELEMENTS // len(points))
+        for start in range(0, len(front), rows):
+            chunk = front[start : start + rows]
+            covers = chunk[:, :1] >= points[:, 0]
+            for j in range(1, points.shape[1]):
+                covers &= chunk[:, j : j + 1] >= points[:, j]
+            dominated |= covers.any(axis=0)
+        return dominated
+
+    # Many points against a small front: walk the front, dropping covered points as
+    # we go. Strong front points come first, since they cover the most.
+    dominated = np.ones(len(points), dtype=bool)
+    front = front[np.argsort(-front.sum(axis=1))]
+    for start in range(0, len(points), _CHUNK_ELEMENTS // points.shape[1]):
+        columns = points[start : start + _CHUNK_ELEMENTS // points.shape[1]].T.copy()
+        alive = np.arange(start, start + columns.shape[1])
+        for point in front:
+            if len(alive) == 0:
+                break
+            covered = columns[0] <= point[0]
+            for column, value in zip(columns[1:], point[1:]):
+                covered &= column <= value
+            alive = alive[~covered]
+            columns = columns[:, ~covered]
+        dominated[alive] = False
+    return dominated
+
+
+def _sorted_front(points: np.ndarray) -> np.ndarray:
+    # In descending lexicographic order no point can dominate one before it, so the
+    # front only ever grows and each block is checked against the front so far.
+    points = points[np.lexsort(points.T[::-1])[::-1]]
+    front = points[:0]
+    for start in range(0, len(points), _BLOCK_ROWS):
+        block = points[start : start + _BLOCK_ROWS]
+        block = block[~_weakly_dominated(front, block)]
+        if len(block) > 1:
+            # Drop block points covered by an earlier point of the same block.
+            covers = np.triu(np.ones((len(block), len(block)), dtype=bool), k=1)
+            for j in range(points.shape[1]):
+                covers &= block[:, j : j + 1] >= block[:, j]
+            block = block[~covers.any(axis=0)]
+        front = np.concatenate([front, block])
+    return front
+
+
+def nondominated(points: np.ndarray, maximise: bool = True) -> np.ndarray:
+    """Return the distinct non-dominated rows of `points`, in no particular order.
+
+    The hypervolume of the result equals that of `points`. The cost grows with the
+    number of points times the size of the front, which is small for sampled cuts.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if not maximise:
+        return -nondominated(-points)
+    if len(points) <= _PILOT_ROWS:
+        return _sorted_front(points)
+
+    # The front of the best few points already dominates most of the others.
+    pilot = np.argpartition(-points.sum(axis=1), _PILOT_ROWS)[:_PILOT_ROWS]
+    pilot_front = _sorted_front(points[pilot])
+    rest = np.ones(len(points), dtype=bool)
+    rest[pilot] = False
+    rest = points[rest]
+    survivors = rest[~_weakly_dominated(pilot_front, rest)]
+    return _sorted_front(np.concatenate([pilot_front, survivors]))
+
+
+class ParetoFrontCache:
+    """Keeps the front and hypervolume of the last points it was given.
+
+    When the previous points are a prefix of the new ones, e.g. an identical
+    resubmission or one with more shots appended, only the appended points are
+    merged into the previous front. Anything else is reduced from scratch.
+    """
+
+    def __init__(self):
+        self._num_points = 0
+        # Digest of the shape and bytes of the last points.
+        self._digest = b""
+        self._front: np.ndarray | None = None
+        self._hypervolumes: dict[tuple, float] = {}
+
+    def front(self, points: np.ndarray) -> np.ndarray:
+        """Return the non-dominated rows of `points`, maximising every column."""
+        points = np.ascontiguousarray(points, dtype=np.float64)
+
+        front = None
+        hasher = hashlib.blake2b(repr(points.shape[1:]).encode())
+        if self._front is not None and len(points) >= self._num_points:
+            hasher.update(points[: self._num_points].data)
+            if hasher.digest() == self._digest:
+                tail = points[self._num_points :]
+                front = self._front
+                if len(tail):
+                    front = nondominated(np.concatenate([front, tail]))
+                hasher.update(tail.data)
+        if front is None:
+            hasher = hashlib.blake2b(repr(points.shape[1:]).encode())
+            hasher.update(points.data)
+            front = nondominated(points)
+
+        if self._front is None or not np.array_equal(front, self._front):
+            self._hypervolumes = {}
+        self._num_points = len(points)
+        self._digest = hasher.digest()
+        self._front = front
+        return front
+
+    def hypervolume(self, points: np.ndarray, ref) -> float:
+        """The hypervolume of `points` with respect to `ref`, maximising every column."""
+        front = self.front(points)
+        key = tuple(np.asarray(ref, dtype=np.float64).ravel())
+        if key not in self._hypervolumes:
+            self._hypervolumes[key] = hypervolume(front, ref=ref, maximise=True)
+        return self._hypervolumes[key]
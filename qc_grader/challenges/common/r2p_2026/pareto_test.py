@@ -0,0 +1,99 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import moocore
+import numpy as np
+import pytest
+
+from qc_grader.challenges.common.r2p_2026 import pareto
+from qc_grader.challenges.common.r2p_2026.pareto import ParetoFrontCache, nondominated
+
+
+def _sorted_rows(points: np.ndarray) -> np.ndarray:
+    return points[np.lexsort(points.T[::-1])]
+
+
+def _expected_front(points: np.ndarray, maximise: bool = True) -> np.ndarray:
+    front = points[
+        moocore.is_nondominated(points, maximise=maximise, keep_weakly=False)
+    ]
+    return _sorted_rows(np.unique(front, axis=0))
+
+
+@pytest.mark.parametrize("num_points", [0, 1, 50, 3000])
+@pytest.mark.parametrize("maximise", [True, False])
+def test_nondominated_matches_moocore(num_points, maximise):
+    # Small integers, so there are plenty of ties and duplicate rows.
+    points = np.random.default_rng(num_points).integers(0, 20, (num_points, 3))
+
+    result = nondominated(points, maximise=maximise)
+
+    np.testing.assert_array_equal(
+        _sorted_rows(result), _expected_front(points.astype(float), maximise)
+    )
+
+
+def test_nondominated_keeps_mutually_nondominated_points():
+    points = np.random.default_rng(3).random((1000, 3))
+    points /= points.sum(axis=1, keepdims=True)
+
+    assert len(nondominated(points)) == 1000
+
+
+def test_cache_matches_hypervolume_of_all_points():
+    points = np.random.default_rng(5).integers(0, 1000, (5000, 3)).astype(float)
+    cache = ParetoFrontCache()
+
+    result = cache.hypervolume(points, ref=[0, 0, 0])
+
+    assert result == pytest.approx(
+        moocore.hypervolume(points, ref=[0, 0, 0], maximise=True)
+    )
+
+
+def test_cache_merges_appended_points_into_previous_front(monkeypatch):
+    rng = np.random.default_rng(6)
+    first = rng.integers(0, 1000, (5000, 3)).astype(float)
+    extended = np.concatenate([first, rng.integers(0, 1100, (10, 3))])
+    cache = ParetoFrontCache()
+    cache.hypervolume(first, ref=[0, 0, 0])
+
+    reduced = []
+
+    def counting_nondominated(points):
+        reduced.append(len(points))
+        return nondominated(points)
+
+    monkeypatch.setattr(pareto, "nondominated", counting_nondominated)
+    hv = cache.hypervolume(extended, ref=[0, 0, 0])
+    repeated = cache.hypervolume(extended, ref=[0, 0, 0])
+
+    assert reduced == [len(nondominated(first)) + 10]
+    assert hv == repeated
+    assert hv == pytest.approx(
+        moocore.hypervolume(extended, ref=[0, 0, 0], maximise=True)
+    )
+
+
+def test_cache_recomputes_when_points_change():
+    rng = np.random.default_rng(7)
+    first = rng.integers(0, 1000, (500, 3)).astype(float)
+    second = first.copy()
+    second[0] = [2000, 2000, 2000]
+    cache = ParetoFrontCache()
+
+    cache.hypervolume(first, ref=[0, 0, 0])
+    shorter = cache.hypervolume(first[:100], ref=[0, 0, 0])
+    changed = cache.hypervolume(second, ref=[0, 0, 0])
+
+    assert shorter == pytest.approx(
+        moocore.hypervolume(first[:100], ref=[0, 0, 0], maximise=True)
+    )
+    assert changed == 2000**3
@@ -8,12 +8,58 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import copy
 import glob
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
 import networkx as nx
 
 
-def load_problem(dirfn, printtxt=True):
+class ProblemInstance(NamedTuple):
+    graphs: list[nx.Graph]
+    angles: Any
+    upper: Any
+    lower: Any
+
+
+_JSON_NAMES = ("angles.json", "upper_bounds.json", "lower_bounds.json")
+
+# Keyed by directory, holding the file signature the instance was parsed from.
+_INSTANCES: dict[str, tuple[tuple, ProblemInstance]] = {}
+
+
+def _file_stat(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _signature(dirfn: str) -> tuple:
+    """Names, mtimes and sizes of every file the instance is parsed from."""
+    paths = sorted(glob.glob(dirfn + "problem_graph_*.json"))
+    paths += [dirfn + name for name in _JSON_NAMES]
+    return tuple((os.path.basename(path), _file_stat(path)) for path in paths)
+
+
+def _read_json(path: str) -> Any:
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def _read_graph(path: str) -> nx.Graph:
+    data = _read_json(path)
+    # Handle NetworkX 3.0+ compatibility: convert 'links' to 'edges'
+    if "links" in data and "edges" not in data:
+        data["edges"] = data.pop("links")
+    return nx.node_link_graph(data)
+
+
+def _parse_problem(dirfn: str, printtxt: bool) -> ProblemInstance | None:
     graphsfn = dirfn + "problem_graph_*.json"
     anglefn = dirfn + "angles.json"
     upperfn = dirfn + "upper_bounds.json"
@@ -23,43 +69,61 @@ def load_problem(dirfn, printtxt=True):
         print("loading", graphsfn)
 
     try:
-        graphs = []
         num_graphs = len(glob.glob(graphsfn))
-        for i in range(num_graphs):
-            f = dirfn + f"problem_graph_{i}.json"
-
-            with open(f, "r") as file:
-                data = json.load(file)
-                # Handle NetworkX 3.0+ compatibility: convert 'links' to 'edges'
-                if "links" in data and "edges" not in data:
-                    data["edges"] = data.pop("links")
-                graphs.append(nx.node_link_graph(data))
+        paths = [dirfn + f"problem_graph_{i}.json" for i in range(num_graphs)]
+        # The graph files are independent, so overlap their reads.
+        with ThreadPoolExecutor(max_workers=min(8, max(1, num_graphs))) as pool:
+            graphs = list(pool.map(_read_graph, paths))
         if len(graphs) != num_graphs:
             raise Exception
 
     except Exception as e:
         print("Wasn't able to load graphs from " + graphsfn + ", error:" + str(e))
-        return None, None, None, None
+        return None
     try:
-        angles = json.load(open(anglefn, "r"))
+        angles = _read_json(anglefn)
         if len(angles) == 0:
             raise Exception
     except Exception as e:
         print("Wasn't able to load QAOA angles from " + anglefn + ", error:" + str(e))
-        return None, None, None, None
+        return None
     try:
-        upper = json.load(open(upperfn, "r"))
+        upper = _read_json(upperfn)
         if len(upper) == 0:
             raise Exception
     except Exception as e:
         print("Wasn't able to load upper bounds from " + upperfn + ", error:" + str(e))
-        return None, None, None, None
+        return None
 
     try:
-        lower = json.load(open(lowerfn, "r"))
+        lower = _read_json(lowerfn)
         if len(lower) == 0:
             raise Exception
     except Exception as e:
         print("Wasn't able to load lower bounds from " + lowerfn + ", error:" + str(e))
-        return None, None, None, None
-    return graphs, angles, upper, lower
+        return None
+    return ProblemInstance(graphs, angles, upper, lower)
+
+
+def load_problem(dirfn, printtxt=True):
+    """Load the graphs, QAOA angles and bounds of the problem instance in `dirfn`.
+
+    Instances are parsed once per process and reparsed only when a file in `dirfn`
+    changes. Each call returns its own copies, so callers may modify them.
+    """
+    signature = _signature(dirfn)
+    cached = _INSTANCES.get(dirfn)
+    if cached is not None and cached[0] == signature:
+        instance = cached[1]
+    else:
+        instance = _parse_problem(dirfn, printtxt)
+        if instance is None:
+            return None, None, None, None
+        _INSTANCES[dirfn] = (signature, instance)
+
+    return (
+        [graph.copy() for graph in instance.graphs],
+        copy.deepcopy(instance.angles),
+        copy.deepcopy(instance.upper),
+        copy.deepcopy(instance.lower),
+    )
@@ -0,0 +1,92 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
+
+from qc_grader.challenges.common.r2p_2026 import qmoo_files
+from qc_grader.challenges.common.r2p_2026.qmoo_files import load_problem
+
+
+def write_instance(directory: Path, num_nodes: int = 12, num_graphs: int = 3) -> None:
+    """Write a problem instance in the layout `load_problem` expects."""
+    for i in range(num_graphs):
+        graph = nx.random_regular_graph(3, num_nodes, seed=i)
+        for u, v in graph.edges:
+            graph[u][v]["weight"] = (u + v) % 7 + 1
+        data = nx.node_link_data(graph, edges="links")
+        (directory / f"problem_graph_{i}.json").write_text(json.dumps(data))
+    (directory / "angles.json").write_text(json.dumps({"gamma": [0.1], "beta": [0.2]}))
+    (directory / "upper_bounds.json").write_text(json.dumps([10, 11, 12]))
+    (directory / "lower_bounds.json").write_text(json.dumps([0, 0.5, 1]))
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    with patch.dict(qmoo_files._INSTANCES, clear=True):
+        yield
+
+
+def _edges(graph: nx.Graph) -> set:
+    return {(min(u, v), max(u, v), w) for u, v, w in graph.edges(data="weight")}
+
+
+def test_load_problem_parses_once(tmp_path):
+    write_instance(tmp_path)
+    dirfn = f"{tmp_path}/"
+
+    graphs, angles, upper, lower = load_problem(dirfn, False)
+
+    assert len(graphs) == 3
+    assert angles == {"gamma": [0.1], "beta": [0.2]}
+    assert (upper, lower) == ([10, 11, 12], [0, 0.5, 1])
+    with patch.object(qmoo_files, "_parse_problem") as parse:
+        again, *_ = load_problem(dirfn, False)
+    parse.assert_not_called()
+    assert _edges(again[0]) == _edges(graphs[0])
+
+
+def test_load_problem_returns_copies(tmp_path):
+    write_instance(tmp_path)
+    dirfn = f"{tmp_path}/"
+    graphs, angles, upper, _ = load_problem(dirfn, False)
+    graphs[0].remove_node(0)
+    angles["gamma"].append(0.5)
+    upper.append(13)
+
+    graphs, angles, upper, _ = load_problem(dirfn, False)
+    assert 0 in graphs[0]
+    assert angles == {"gamma": [0.1], "beta": [0.2]}
+    assert upper == [10, 11, 12]
+
+
+def test_load_problem_reparses_changed_files(tmp_path):
+    write_instance(tmp_path)
+    dirfn = f"{tmp_path}/"
+    load_problem(dirfn, False)
+
+    (tmp_path / "upper_bounds.json").write_text(json.dumps([20, 21, 22, 23]))
+    os.utime(tmp_path / "upper_bounds.json", ns=(0, 0))
+
+    _, _, upper, _ = load_problem(dirfn, False)
+    assert upper == [20, 21, 22, 23]
+
+
+def test_load_problem_missing_bounds(tmp_path, capsys):
+    write_instance(tmp_path)
+    (tmp_path / "lower_bounds.json").unlink()
+
+    assert load_problem(f"{tmp_path}/", False) == (None, None, None, None)
+    assert "Wasn't able to load lower bounds" in capsys.readouterr().out
@@ -15,6 +15,8 @@ QGSS 2026 Lab 2 - Grading Functions
 from typing import Any, Callable, TypedDict
 from typeguard import typechecked
 
+from qc_grader.grader.candidates import evaluate
+from qc_grader.grader.circuits import circuit_metrics
 from qc_grader.grader.grade import grade_answer
 
 from qiskit import QuantumCircuit
@@ -45,7 +47,7 @@ def grade_lab2_ex1(
 def _too_large_circuit(
     circuit: QuantumCircuit, max_qubits: int = 20, max_depth: int = 100
 ) -> bool:
-    return circuit.num_qubits > max_qubits or circuit.depth() > max_depth
+    return circuit.num_qubits > max_qubits or circuit_metrics(circuit).depth > max_depth
 
 
 @typechecked
@@ -55,11 +57,11 @@ def grade_lab2_ex2(repeated_x_circuit: Callable[[int], QuantumCircuit]) -> None:
     """
     test_ns = [0, 1, 2, 3, 5, 10]
     repeated_x_dict = dict()
-    for n in test_ns:
-        circuit = repeated_x_circuit(n)
+    for evaluation in evaluate(repeated_x_circuit, test_ns):
+        n, circuit = evaluation.input, evaluation.value
         if _too_large_circuit(circuit):
             raise ValueError(
-                f"Circuit for n={n} is too large (num_qubits={circuit.num_qubits}, depth={circuit.depth()}) compared to the expected answer."
+                f"Circuit for n={n} is too large (num_qubits={circuit.num_qubits}, depth={circuit_metrics(circuit).depth}) compared to the expected answer."
             )
         repeated_x_dict[n] = circuit
 
@@ -74,11 +76,11 @@ def grade_lab2_ex3(repeated_x_meas_x_circuit: Callable[[int], QuantumCircuit]) -
     """
     test_ns = [0, 1, 2, 3, 5, 10]
     repeated_x_meas_x_dict = dict()
-    for n in test_ns:
-        circuit = repeated_x_meas_x_circuit(n)
+    for evaluation in evaluate(repeated_x_meas_x_circuit, test_ns):
+        n, circuit = evaluation.input, evaluation.value
         if _too_large_circuit(circuit):
             raise ValueError(
-                f"Circuit for n={n} is too large (num_qubits={circuit.num_qubits}, depth={circuit.depth()}). Please optimize your circuit."
+                f"Circuit for n={n} is too large (num_qubits={circuit.num_qubits}, depth={circuit_metrics(circuit).depth}). Please optimize your circuit."
             )
         repeated_x_meas_x_dict[n] = circuit
 
@@ -193,7 +195,12 @@ def grade_lab2_ex6(build_circuit: Callable[[int], QuantumCircuit]) -> None:
     Grade Exercise 6: Check the full dynamic circuit construction.
     """
     test_num_qubits = [4, 6, 8, 10, 12, 20]
-    answer_dict = {"build_circuit": {str(n): build_circuit(n) for n in test_num_qubits}}
+    answer_dict = {
+        "build_circuit": {
+            str(evaluation.input): evaluation.value
+            for evaluation in evaluate(build_circuit, test_num_qubits)
+        }
+    }
     _grade(answer_dict, "ex6")
 
 
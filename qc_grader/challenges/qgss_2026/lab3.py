@@ -4,26 +4,27 @@
 QGSS 2026 Lab 3 - Grading Functions
 """
 
-from dataclasses import asdict
 import math
+import time
+from collections import OrderedDict
 from typing import Any, TypedDict, cast
 
+import samplomatic
 from qiskit import QuantumCircuit
 from samplomatic.samplex import Samplex
 from samplomatic.tensor_interface import TensorInterface
 from typeguard import typechecked
 
-from qiskit.circuit import BoxOp
-from qiskit.quantum_info import (
-    PauliLindbladMap,
-    SparsePauliOp,
-    Statevector,
-    state_fidelity,
-)
+from qiskit.quantum_info import PauliLindbladMap, SparsePauliOp
 from qiskit_ibm_runtime import QuantumProgram
 from qiskit_ibm_runtime.options import EstimatorOptions
 
+from qc_grader.grader.boxes import unroll_boxes
+from qc_grader.grader.candidates import evaluate
+from qc_grader.grader.circuits import circuit_facts, circuit_fingerprint
+from qc_grader.grader.fidelity import zero_state_fidelity
 from qc_grader.grader.grade import grade_answer
+from qc_grader.grader.options import get_option, sanitize_for_json
 
 _CHALLENGE = "qgss_2026"
 _LAB = "lab3"
@@ -34,6 +35,41 @@ def _grade(answer: Any, exercise: str) -> None:
     grade_answer(answer, lab=_LAB, exercise=exercise, challenge=_CHALLENGE)
 
 
+# Whether `samplomatic.build` succeeded, its error and how long it took, by circuit
+# fingerprint, for the most recently built circuits.
+_MAX_BUILDS = 8
+_BUILDS: OrderedDict[str, tuple[bool, str | None, float]] = OrderedDict()
+
+
+def _build(circuit: QuantumCircuit) -> tuple[bool, str | None, float, bool]:
+    """Check that `samplomatic.build` accepts `circuit`.
+
+    Returns whether it did, its error, the seconds it took and whether that was cached.
+    The build is time-boxed like the calls of `evaluate`, by `QC_GRADER_CALL_TIMEOUT`,
+    and otherwise runs on this thread. Builds that time out are not cached, so a larger
+    limit takes effect on the next run.
+    """
+    key = circuit_fingerprint(circuit)
+    if key in _BUILDS:
+        _BUILDS.move_to_end(key)
+        return *_BUILDS[key], True
+
+    start = time.perf_counter()
+    try:
+        next(evaluate(samplomatic.build, [circuit]))
+    except TimeoutError as exc:
+        return False, f"{type(exc).__name__}: {exc}", time.perf_counter() - start, False
+    except Exception as exc:
+        outcome = (False, f"{type(exc).__name__}: {exc}", time.perf_counter() - start)
+    else:
+        outcome = (True, None, time.perf_counter() - start)
+
+    _BUILDS[key] = outcome
+    while len(_BUILDS) > _MAX_BUILDS:
+        _BUILDS.popitem(last=False)
+    return *outcome, False
+
+
 class Lab3Ex1OptionsDict(TypedDict):
     dd: EstimatorOptions
     pt: EstimatorOptions
@@ -47,37 +83,38 @@ def grade_lab3_ex1(options_dict: Lab3Ex1OptionsDict) -> None:
     """
     Grade Exercise 1
     """
-    dd = asdict(options_dict["dd"])
-    pt = asdict(options_dict["pt"])
-    trex = asdict(options_dict["trex"])
-    zne = asdict(options_dict["zne"])
-    pec = asdict(options_dict["pec"])
+    dd = options_dict["dd"]
+    pt = options_dict["pt"]
+    trex = options_dict["trex"]
+    zne = options_dict["zne"]
+    pec = options_dict["pec"]
 
     answer_dict = {
         "dd": {
-            "enable": dd["dynamical_decoupling"]["enable"],
-            "sequence_type": dd["dynamical_decoupling"]["sequence_type"],
+            "enable": get_option(dd, "dynamical_decoupling.enable"),
+            "sequence_type": get_option(dd, "dynamical_decoupling.sequence_type"),
         },
         "pt": {
-            "enable_gates": pt["twirling"]["enable_gates"],
-            "strategy": pt["twirling"]["strategy"],
-            "num_randomizations": pt["twirling"]["num_randomizations"],
+            "enable_gates": get_option(pt, "twirling.enable_gates"),
+            "strategy": get_option(pt, "twirling.strategy"),
+            "num_randomizations": get_option(pt, "twirling.num_randomizations"),
         },
         "trex": {
-            "measure_mitigation": trex["resilience"]["measure_mitigation"],
+            "measure_mitigation": get_option(trex, "resilience.measure_mitigation"),
         },
         "zne": {
-            "zne_mitigation": zne["resilience"]["zne_mitigation"],
-            "noise_factors": list(zne["resilience"]["zne"]["noise_factors"]),
-            "amplifier": zne["resilience"]["zne"]["amplifier"],
+            "zne_mitigation": get_option(zne, "resilience.zne_mitigation"),
+            "noise_factors": list(get_option(zne, "resilience.zne.noise_factors")),
+            "amplifier": get_option(zne, "resilience.zne.amplifier"),
         },
         "pec": {
-            "pec_mitigation": pec["resilience"]["pec_mitigation"],
-            "max_overhead": pec["resilience"]["pec"]["max_overhead"],
+            "pec_mitigation": get_option(pec, "resilience.pec_mitigation"),
+            "max_overhead": get_option(pec, "resilience.pec.max_overhead"),
         },
     }
 
-    _grade(answer_dict, "ex1")
+    # Options the user left `Unset` are sent as None.
+    _grade(sanitize_for_json(answer_dict), "ex1")
 
 
 @typechecked
@@ -89,81 +126,46 @@ def grade_lab3_ex2(
     """
     Grade Exercise 2
     """
-    op_counts: dict[str, int] = {}
-    rx_angles: list[float] = []
-    has_barriers = False
-    for inst in ising_ex2.data:
-        name = inst.operation.name
-        op_counts[name] = op_counts.get(name, 0) + 1
-        if name == "rx":
-            rx_angles.append(float(inst.operation.params[0]))
-        elif name == "barrier":
-            has_barriers = True
-
-    has_measure = any(inst.operation.name == "measure" for inst in mirror_ex2.data)
+    ising_facts = circuit_facts(ising_ex2)
+    rx_angles = [float(params[0]) for params in ising_facts.op_params.get("rx", [])]
+
     try:
         mirror_no_meas = cast(
-            QuantumCircuit, mirror_ex2.remove_final_measurements(inplace=False)
+            QuantumCircuit,
+            unroll_boxes(mirror_ex2).remove_final_measurements(inplace=False),
         )
-        sv = Statevector(mirror_no_meas)
-        zero = Statevector.from_label("0" * mirror_ex2.num_qubits)
-        fidelity = float(state_fidelity(sv, zero))
-    except Exception:
+        fidelity = zero_state_fidelity(mirror_no_meas)
+    except Exception as err:
+        print(f"Could not compute the fidelity of mirror_ex2: {err}")
         fidelity = 0.0
 
-    box_insts = [
-        inst for inst in boxed_circuit_ex2 if isinstance(inst.operation, BoxOp)
-    ]
-
-    def _has_measure(inst: Any) -> bool:
-        return any(sub.operation.name == "measure" for sub in inst.operation.body.data)
-
-    gate_boxes = [b for b in box_insts if not _has_measure(b)]
-    twirl = sum(
-        1
-        for b in gate_boxes
-        if any(
-            type(annotation).__name__ == "Twirl"
-            for annotation in b.operation.annotations
-        )
-    )
-    inject = sum(
-        1
-        for b in gate_boxes
-        if any(
-            type(annotation).__name__ == "InjectNoise"
-            for annotation in b.operation.annotations
-        )
-    )
-
-    build_ok = False
-    build_err = None
-    if box_insts:
-        try:
-            import importlib
+    boxes = circuit_facts(boxed_circuit_ex2).boxes
+    gate_boxes = [box for box in boxes if not box.has_measure]
+    twirl = sum(1 for box in gate_boxes if "Twirl" in box.annotations)
+    inject = sum(1 for box in gate_boxes if "InjectNoise" in box.annotations)
 
-            samplomatic = importlib.import_module("samplomatic")
-            samplomatic.build(boxed_circuit_ex2)
-            build_ok = True
-        except Exception as exc:
-            build_err = f"{type(exc).__name__}: {exc}"
+    build_ok, build_err, build_seconds, build_cached = False, None, 0.0, False
+    if boxes:
+        build_ok, build_err, build_seconds, build_cached = _build(boxed_circuit_ex2)
 
     facts = {
-        "ising_num_qubits": int(ising_ex2.num_qubits),
-        "ising_op_counts": op_counts,
+        "ising_num_qubits": int(ising_facts.num_qubits),
+        "ising_op_counts": ising_facts.op_counts,
         "ising_rx_all_pi8": bool(
             rx_angles and all(abs(angle - _PI_8) < 1e-9 for angle in rx_angles)
         ),
-        "ising_has_barriers": has_barriers,
-        "mirror_has_measure": has_measure,
+        "ising_has_barriers": "barrier" in ising_facts.op_counts,
+        "mirror_has_measure": circuit_facts(mirror_ex2).has_measure,
         "mirror_zero_state_fidelity": fidelity,
         "boxed_num_qubits": int(boxed_circuit_ex2.num_qubits),
-        "num_boxes": len(box_insts),
+        "num_boxes": len(boxes),
         "num_gate_boxes": len(gate_boxes),
         "num_gate_boxes_twirl": twirl,
         "num_gate_boxes_inject": inject,
         "build_ok": build_ok,
         "build_err": build_err,
+        "build_seconds": build_seconds,
+        "build_cached": build_cached,
     }
 
     _grade(facts, "ex2")
@@ -245,7 +247,7 @@ def grade_lab3_ex5(
     """
 
     boxed_num_qubits = int(boxed.num_qubits)
-    boxed_num_boxes = sum(1 for inst in boxed if isinstance(inst.operation, BoxOp))
+    boxed_num_boxes = len(circuit_facts(boxed).boxes)
 
     backward_dict_sparse = {
         key: pl_map.to_sparse_list() for key, pl_map in backward_bound.items()
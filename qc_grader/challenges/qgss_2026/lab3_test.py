@@ -0,0 +1,104 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Unit tests for the lab3 samplomatic build check.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from qiskit import QuantumCircuit
+from samplomatic import Twirl
+
+from qc_grader.challenges.qgss_2026 import lab3
+
+
+@pytest.fixture(autouse=True)
+def _fresh_builds():
+    lab3._BUILDS.clear()
+    yield
+    lab3._BUILDS.clear()
+
+
+def _boxed(angle: float = 0.5) -> QuantumCircuit:
+    circuit = QuantumCircuit(2, 2)
+    circuit.rx(angle, 0)
+    with circuit.box([Twirl()]):
+        circuit.cz(0, 1)
+    with circuit.box([Twirl()]):
+        circuit.measure([0, 1], [0, 1])
+    return circuit
+
+
+def test_build_is_cached_for_equal_circuits():
+    with patch.object(lab3.samplomatic, "build") as build:
+        first = lab3._build(_boxed())
+        second = lab3._build(_boxed())
+
+    build.assert_called_once()
+    assert first[:2] == (True, None) and not first[3]
+    assert second == (*first[:3], True)
+
+
+def test_build_errors_are_cached_and_reported():
+    with patch.object(lab3.samplomatic, "build", side_effect=ValueError("bad box")):
+        assert lab3._build(_boxed())[:2] == (False, "ValueError: bad box")
+        assert lab3._build(_boxed())[3]
+
+
+def test_different_circuits_are_built_separately():
+    with patch.object(lab3.samplomatic, "build") as build:
+        lab3._build(_boxed(0.5))
+        lab3._build(_boxed(0.25))
+
+    assert build.call_count == 2
+
+
+def test_circuits_changed_in_place_are_built_again():
+    circuit = _boxed()
+    with patch.object(lab3.samplomatic, "build") as build:
+        lab3._build(circuit)
+        circuit.data[0] = circuit.data[0].replace(params=[0.25])
+        assert not lab3._build(circuit)[3]
+
+    assert build.call_count == 2
+
+
+def test_builds_that_time_out_are_not_cached(monkeypatch):
+    monkeypatch.setenv("QC_GRADER_CALL_TIMEOUT", "0.05")
+    with patch.object(lab3.samplomatic, "build", side_effect=lambda _: time.sleep(0.5)):
+        ok, err, _, cached = lab3._build(_boxed())
+
+    assert not ok and not cached
+    assert err is not None and err.startswith("TimeoutError")
+    assert not lab3._BUILDS
+
+
+def test_builds_run_on_the_callers_thread_without_a_timeout(monkeypatch):
+    monkeypatch.delenv("QC_GRADER_CALL_TIMEOUT", raising=False)
+    threads = []
+    with patch.object(
+        lab3.samplomatic,
+        "build",
+        side_effect=lambda _: threads.append(threading.current_thread()),
+    ):
+        lab3._build(_boxed())
+
+    assert threads == [threading.current_thread()]
+
+
+def test_real_build_accepts_a_boxed_circuit():
+    ok, err, seconds, cached = lab3._build(_boxed())
+
+    assert (ok, err, cached) == (True, None, False)
+    assert seconds > 0
@@ -13,9 +13,7 @@ QGSS 2026 Lab 4b - Grading Functions
 """
 
 from typeguard import typechecked, check_type
-from typing import Any, Callable, TypedDict, cast
-from dataclasses import asdict
-import json
+from typing import Any, Callable
 
 import numpy as np
 import networkx as nx
@@ -25,12 +23,26 @@ from qiskit_ibm_runtime.options import SamplerOptions, EstimatorOptions
 from qiskit_ibm_runtime import RuntimeJobV2
 from qiskit_ibm_runtime.fake_provider.local_runtime_job import LocalRuntimeJob
 
-# Redefined UnrollBoxes from qopt_best_practices.transpilation
-from qiskit.dagcircuit import DAGCircuit
-from qiskit.transpiler import TransformationPass
-from qiskit.converters import circuit_to_dag
-
+from qc_grader.grader.boxes import unroll_boxes
+from qc_grader.grader.candidates import evaluate
 from qc_grader.grader.grade import grade_answer
+from qc_grader.grader.jobs import job_result, job_results
+from qc_grader.grader.options import (
+    diff_options,
+    options_contain,
+    options_to_dict,
+    sanitize_for_json,
+)
+
+from .lab4b_partition import (
+    EMResults,
+    PartitionResult,
+    exp_map_matches,
+    exp_values,
+    find_best_result as _find_best_result,
+    set_matches,
+    split_by_bits,
+)
 
 _CHALLENGE = "qgss_2026"
 _LAB = "lab4b"
@@ -42,15 +54,7 @@ def _grade(answer: Any, exercise: str) -> None:
 
 def _dict_contains(full_dict: dict[str, Any], subset_dict: dict[str, Any]) -> bool:
     """Check if full_dict contains all key-value pairs from subset_dict (recursively)."""
-    for key, value in subset_dict.items():
-        if key not in full_dict:
-            return False
-        if isinstance(value, dict) and isinstance(full_dict[key], dict):
-            if not _dict_contains(full_dict[key], value):
-                return False
-        elif full_dict[key] != value:
-            return False
-    return True
+    return options_contain(full_dict, subset_dict)
 
 
 @typechecked
@@ -61,21 +65,6 @@ def grade_lab4b_ex1a(partition_graph: nx.Graph) -> None:
     _grade(partition_graph, "ex1a")
 
 
-class UnrollBoxes(TransformationPass):
-    """Remove Boxes."""
-
-    def run(self, dag: DAGCircuit):
-
-        for node in dag.topological_op_nodes():
-            if node.op.name != "box":
-                continue
-
-            box_circuit = node.op.params[0]
-            box_dag = circuit_to_dag(box_circuit)
-            dag.substitute_node_with_dag(node, box_dag)
-        return dag
-
-
 @typechecked
 def grade_lab4b_ex1b(
     partition_hamiltonian: SparsePauliOp, circuit: QuantumCircuit
@@ -83,51 +72,12 @@ def grade_lab4b_ex1b(
     """
     Grade Exercise 1b: From graph to Hamiltonian and quantum circuit.
     """
-    # Check for any Box, since annotated_qaoa_ansatz (as suggested in the lab) introduces it
-    if any(instr.operation.name == "box" for instr in circuit.data):
-        circuit = UnrollBoxes()(circuit)
+    # annotated_qaoa_ansatz (as suggested in the lab) introduces boxes
+    circuit = unroll_boxes(circuit)
     answer_dict = {"partition_hamiltonian": partition_hamiltonian, "circuit": circuit}
     _grade(answer_dict, "ex1b")
 
 
-def sanitize_for_json(value: Any) -> Any:
-    """
-    Recursively sanitize a value to ensure it's JSON serializable.
-    Converts non-serializable items to None while preserving dictionary keys.
-
-    Args:
-        value: The value to sanitize (can be dict, list, or any other type)
-
-    Returns:
-        A JSON-serializable version of the value
-    """
-    # Handle None explicitly
-    if value is None:
-        return None
-
-    # Check for Unset types (backward compatibility)
-    type_name = type(value).__name__
-    if type_name == "UnsetType" or repr(value) == "Unset":
-        return None
-
-    # Handle dictionaries recursively
-    if isinstance(value, dict):
-        return {k: sanitize_for_json(v) for k, v in value.items()}
-
-    # Handle lists and tuples recursively
-    if isinstance(value, (list, tuple)):
-        sanitized = [sanitize_for_json(item) for item in value]
-        return sanitized if isinstance(value, list) else tuple(sanitized)
-
-    # Try to serialize the value to check if it's JSON-serializable
-    try:
-        json.dumps(value)
-        return value
-    except (TypeError, ValueError, OverflowError):
-        # If not serializable, return None
-        return None
-
-
 @typechecked
 def grade_lab4b_ex2a(
     options_v1: SamplerOptions,
@@ -136,7 +86,7 @@ def grade_lab4b_ex2a(
     Grade Exercise 2a: Error suppression techniques
     """
 
-    options_dict = sanitize_for_json(asdict(options_v1))
+    options_dict = sanitize_for_json(options_to_dict(options_v1))
     answer_dict = {
         "options_v1": options_dict,
     }
@@ -151,7 +101,7 @@ def grade_lab4b_ex2b(
     Grade Exercise 2b: Error suppression techniques
     """
 
-    options_dict = sanitize_for_json(asdict(options_v2))
+    options_dict = sanitize_for_json(options_to_dict(options_v2))
     answer_dict = {
         "options_v2": options_dict,
     }
@@ -170,7 +120,7 @@ def grade_lab4b_ex2c(
     Grade Exercise 2c: Error suppression techniques
     """
 
-    options_dict = sanitize_for_json(asdict(options_v3))
+    options_dict = sanitize_for_json(options_to_dict(options_v3))
     m3_quasis_v3 = {k: float(v) for k, v in m3_quasis_v3.items()}
     answer_dict = {
         "options": options_dict,
@@ -194,7 +144,7 @@ def grade_lab4b_ex2d(
     Grade Exercise 2c: Error suppression techniques
     """
 
-    options_dict = sanitize_for_json(asdict(options_v4))
+    options_dict = sanitize_for_json(options_to_dict(options_v4))
     m3_quasis_v4 = {k: float(v) for k, v in m3_quasis_v4.items()}
     answer_dict = {
         "options": options_dict,
@@ -220,19 +170,21 @@ def grade_lab4b_ex2(
     for i, (job, expected) in enumerate(zip(job_list, options_list), start=1):
         if isinstance(job, RuntimeJobV2):
             job_opts = job.inputs.get("options", {})
-            if not isinstance(job_opts, dict):
-                job_opts = asdict(job_opts)
-            exp_opts = asdict(expected)
-
-            if not _dict_contains(exp_opts, job_opts):
-                raise ValueError(f"job_v{i} options do not match expected options")
+            mismatches = diff_options(expected, job_opts)
+            if mismatches:
+                raise ValueError(
+                    f"job_v{i} options do not match expected options: "
+                    + "; ".join(mismatches)
+                )
         else:
             print(
                 f"⚠️ Warning: job_v{i} is not a RuntimeJobV2 instance. "
                 "You appear to be using a simulator, but this exercise is supposed to use a real hardware backend."
             )
     # Transform options_list elements into a dictionary with not UnsetType values
-    options_dicts = [sanitize_for_json(asdict(options)) for options in options_list]
+    options_dicts = [
+        sanitize_for_json(options_to_dict(options)) for options in options_list
+    ]
     answer_dict = {
         "options_list": options_dicts,
         "counts_list": counts_list,
@@ -256,12 +208,10 @@ def grade_lab4b_ex3a(
     """
     initial_qubits = [20, 40, 60, 80, 100, 120, 140, 160, 180, 200]
 
-    def _validate_and_reduce(qubit: int) -> int:
-        result = reduce_qubits_with_pce(qubit)
-        check_type(result, int)
-        return result
-
-    final_qubits = [_validate_and_reduce(qubit) for qubit in initial_qubits]
+    final_qubits = []
+    for evaluation in evaluate(reduce_qubits_with_pce, initial_qubits):
+        check_type(evaluation.value, int)
+        final_qubits.append(evaluation.value)
 
     answer_dict = {
         "initial_qubits": initial_qubits,
@@ -301,8 +251,7 @@ def grade_lab4b_ex3c(
     """
     Grade Exercise 3c: Implement Pauli Correlation Encoding: Cost Hamiltonian and QAOA ansatz
     """
-    if any(instr.operation.name == "box" for instr in circuit_pce.data):
-        circuit_pce = UnrollBoxes()(circuit_pce)
+    circuit_pce = unroll_boxes(circuit_pce)
     answer_dict = {
         "hamiltonian_pce": hamiltonian_pce,
         "circuit_pce": circuit_pce,
@@ -319,7 +268,7 @@ def grade_lab4b_ex4a(
     Grade Exercise 4a: Error mitigation techniques
     """
 
-    options_dict = sanitize_for_json(asdict(options_no_em))
+    options_dict = sanitize_for_json(options_to_dict(options_no_em))
     answer_dict = {
         "options_no_em": options_dict,
     }
@@ -334,7 +283,7 @@ def grade_lab4b_ex4b(
     Grade Exercise 4b: Error mitigation techniques
     """
 
-    options_dict = sanitize_for_json(asdict(options_trex))
+    options_dict = sanitize_for_json(options_to_dict(options_trex))
     answer_dict = {
         "options_trex": options_dict,
     }
@@ -349,7 +298,7 @@ def grade_lab4b_ex4c(
     Grade Exercise 4c: Error mitigation techniques
     """
 
-    options_dict = sanitize_for_json(asdict(options_zne))
+    options_dict = sanitize_for_json(options_to_dict(options_zne))
     answer_dict = {
         "options_zne": options_dict,
     }
@@ -364,78 +313,15 @@ def grade_lab4b_ex4d(
     Grade Exercise 4d: Error mitigation techniques
     """
 
-    options_dict = sanitize_for_json(asdict(options_pec))
+    options_dict = sanitize_for_json(options_to_dict(options_pec))
     answer_dict = {
         "options_pec": options_dict,
     }
     _grade(answer_dict, "ex4d")
 
 
-def _reconstruct_exp_map(job: RuntimeJobV2 | LocalRuntimeJob) -> dict[int, np.floating]:
-    result = job.result()
-    node_exp_map = {}
-    idx = 0
-    for pub_result in result:
-        evs = getattr(getattr(pub_result, "data", None), "evs", [])
-        for ev in evs:
-            node_exp_map[idx] = float(ev)
-            idx += 1
-    return node_exp_map
-
-
-PartitionResult = TypedDict(
-    "PartitionResult",
-    {
-        "loss": np.floating,
-        "par0": list[int] | set[int],
-        "par1": list[int] | set[int],
-        "par0_size": int,
-        "par1_size": int,
-        "best_cut": int | np.floating,
-        "best_index": int,
-        "set0": list[int] | set[int],
-        "set1": list[int] | set[int],
-        "difference": int | float,
-        "exp_map": dict[int, np.floating],
-    },
-)
-
-EMResults = TypedDict(
-    "EMResults",
-    {
-        "No EM": PartitionResult,
-        "TREX": PartitionResult,
-        "ZNE": PartitionResult,
-        "PEC": PartitionResult,
-    },
-)
-
-
-def _find_best_result(
-    results_dict: EMResults,
-) -> tuple[float, str | None, int | float | None]:
-    """
-    Find the best result from the results dictionary.
-
-    Returns:
-        A tuple of (best_difference, best_method, total_sum)
-    """
-
-    best_difference = float("inf")
-    best_method: str | None = None
-    total_sum: int | float | None = None
-
-    for method, result in results_dict.items():
-        # Type checker needs explicit cast to know result is PartitionResult
-        partition_result = cast(PartitionResult, result)
-        if total_sum is None:
-            total_sum = sum(partition_result["set0"]) + sum(partition_result["set1"])
-
-        if partition_result["difference"] < best_difference:
-            best_difference = partition_result["difference"]
-            best_method = method
-
-    return best_difference, best_method, total_sum
+def _reconstruct_exp_map(job: RuntimeJobV2 | LocalRuntimeJob) -> dict[int, float]:
+    return dict(enumerate(exp_values(job_result(job)).tolist()))
 
 
 @typechecked
@@ -450,24 +336,27 @@ def grade_lab4b_ex4(
     required_keys = ["No EM", "TREX", "ZNE", "PEC"]
     # Compare job options with expected options
 
-    for i, (job, expected, key) in enumerate(
-        zip(job_list, estimator_options_list, required_keys), start=1
+    # Each result is a request to the runtime service, so fetch them all at once.
+    num_jobs = min(len(job_list), len(estimator_options_list), len(required_keys))
+    job_result_list = job_results(job_list[:num_jobs])
+
+    for i, (job, expected, key, result) in enumerate(
+        zip(job_list, estimator_options_list, required_keys, job_result_list), start=1
     ):
-        reconstructed_exp_map = _reconstruct_exp_map(job)
         stored_exp_map = results_dict.get(key, {}).get("exp_map")
-        if stored_exp_map != reconstructed_exp_map:
+        if not exp_map_matches(stored_exp_map, exp_values(result)):
             raise ValueError(
                 f"results_dict['{key}']['exp_map'] does not match the expectation map reconstructed from its estimator job"
             )
 
         if isinstance(job, RuntimeJobV2):
             job_opts = job.inputs.get("options", {})
-            if not isinstance(job_opts, dict):
-                job_opts = asdict(job_opts)
-            expected = asdict(expected)
-
-            if not _dict_contains(expected, job_opts):
-                raise ValueError(f"job_{key} options do not match expected options")
+            mismatches = diff_options(expected, job_opts)
+            if mismatches:
+                raise ValueError(
+                    f"job_{key} options do not match expected options: "
+                    + "; ".join(mismatches)
+                )
         else:
             print(
                 f"⚠️ Warning: job_v{key} is not a RuntimeJobV2 instance. "
@@ -475,7 +364,8 @@ def grade_lab4b_ex4(
             )
     # Transform options_list elements into a dictionary with not UnsetType values
     estimator_options_dicts = [
-        sanitize_for_json(asdict(options)) for options in estimator_options_list
+        sanitize_for_json(options_to_dict(options))
+        for options in estimator_options_list
     ]
     # Check 4: results has a best value which has a difference smaller than 5% of the total sum
     best_difference, best_method, total_sum = _find_best_result(results_dict)
@@ -531,27 +421,23 @@ def grade_lab4b_exbonus(
     if qpu_usage_seconds is None or qpu_usage_seconds <= 0:
         raise ValueError("job_bonus should report QPU usage greater than 0 seconds")
 
-    reconstructed_exp_map = _reconstruct_exp_map(job_bonus)
-    stored_exp_map = result_bonus.get("exp_map")
-    if stored_exp_map != reconstructed_exp_map:
+    values = exp_values(job_result(job_bonus))
+    if not exp_map_matches(result_bonus.get("exp_map"), values):
         raise ValueError(
             "result_bonus['exp_map'] does not match the expectation map reconstructed from its estimator job"
         )
     if len(numbers_bonus) != 1600:
         raise ValueError("The length of numbers_bonus should be 1600")
     # Convert refined bit assignment back to number sets
-    set0 = [
-        int(numbers_bonus[i]) for i in range(len(numbers_bonus)) if best_bits[i] == 1
-    ]
-    set1 = [
-        int(numbers_bonus[i]) for i in range(len(numbers_bonus)) if best_bits[i] == 0
-    ]
+    set0, set1 = split_by_bits(numbers_bonus, best_bits)
     # Check that these set0 and set1 match the results_bonus
-    if set0 != result_bonus["set0"] or set1 != result_bonus["set1"]:
+    if not set_matches(set0, result_bonus["set0"]) or not set_matches(
+        set1, result_bonus["set1"]
+    ):
         raise ValueError(
             "best_bits does not reconstruct set0 and set1 from results_bonus"
         )
-    reconstructed_exp_map = {int(k): float(v) for k, v in stored_exp_map.items()}
+    reconstructed_exp_map = dict(enumerate(values.tolist()))
 
     answer_dict = {
         "set0": result_bonus["set0"],
@@ -0,0 +1,136 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+QGSS 2026 Lab 4b - Number partitioning results
+"""
+
+from typing import Any, Iterable, TypedDict, cast
+
+import numpy as np
+
+PartitionResult = TypedDict(
+    "PartitionResult",
+    {
+        "loss": np.floating,
+        "par0": list[int] | set[int],
+        "par1": list[int] | set[int],
+        "par0_size": int,
+        "par1_size": int,
+        "best_cut": int | np.floating,
+        "best_index": int,
+        "set0": list[int] | set[int],
+        "set1": list[int] | set[int],
+        "difference": int | float,
+        "exp_map": dict[int, np.floating],
+    },
+)
+
+EMResults = TypedDict(
+    "EMResults",
+    {
+        "No EM": PartitionResult,
+        "TREX": PartitionResult,
+        "ZNE": PartitionResult,
+        "PEC": PartitionResult,
+    },
+)
+
+
+def exp_values(result: Iterable[Any]) -> np.ndarray:
+    """Concatenate the expectation values of every pub result into one float array."""
+    evs = [
+        np.asarray(getattr(getattr(pub_result, "data", None), "evs", []), dtype=float)
+        for pub_result in result
+    ]
+    if not evs:
+        return np.empty(0)
+    return np.concatenate([ev.ravel() for ev in evs])
+
+
+def _equal(items: list[Any], values: np.ndarray) -> bool:
+    """Whether `items == values.tolist()`, compared as arrays when `items` are numbers."""
+    try:
+        array = np.asarray(items)
+    except ValueError:
+        array = None
+    if array is not None and array.dtype.kind in "biuf" and array.shape == values.shape:
+        return bool(np.array_equal(array, values))
+    return items == values.tolist()
+
+
+def exp_map_matches(exp_map: Any, values: np.ndarray) -> bool:
+    """Whether `exp_map == dict(enumerate(values.tolist()))`."""
+    if not isinstance(exp_map, dict) or len(exp_map) != len(values):
+        return False
+    try:
+        items = [exp_map[i] for i in range(len(values))]
+    except KeyError:
+        return False
+    return _equal(items, values)
+
+
+def _total(values: list[int] | set[int]) -> int | float:
+    array = np.asarray(list(values) if isinstance(values, set) else values)
+    total = array.sum() if array.size else 0
+    return total.item() if isinstance(total, np.generic) else total
+
+
+def find_best_result(
+    results_dict: EMResults,
+) -> tuple[float, str | None, int | float | None]:
+    """
+    Find the best result from the results dictionary.
+
+    Returns:
+        A tuple of (best_difference, best_method, total_sum)
+    """
+    if not results_dict:
+        return float("inf"), None, None
+
+    methods = list(results_dict)
+    results = [cast(PartitionResult, results_dict[method]) for method in methods]
+    differences = np.array([result["difference"] for result in results])
+
+    # Ties go to the first method, and NaN differences are never the best.
+    candidates = np.flatnonzero(differences < float("inf"))
+    best = candidates[np.argmin(differences[candidates])] if len(candidates) else None
+
+    first = results[0]
+    total_sum = _total(first["set0"]) + _total(first["set1"])
+    if best is None:
+        return float("inf"), None, total_sum
+    return results[best]["difference"], methods[best], total_sum
+
+
+def split_by_bits(
+    numbers: list[int] | np.ndarray, bits: list[int] | np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split `numbers` into those whose bit is 1 and those whose bit is 0.
+
+    Raises:
+        IndexError: If there are fewer bits than numbers.
+    """
+    numbers = np.asarray(numbers)
+    bits = np.asarray(bits)
+    if len(bits) < len(numbers):
+        raise IndexError(
+            f"Expected at least {len(numbers)} bits, but only got {len(bits)}"
+        )
+    bits = bits[: len(numbers)]
+    numbers = numbers.astype(np.int64, copy=False)
+    return numbers[bits == 1], numbers[bits == 0]
+
+
+def set_matches(values: np.ndarray, expected: Any) -> bool:
+    """Whether `values.tolist() == expected`, i.e. `expected` is a list of them in order."""
+    if not isinstance(expected, list) or len(expected) != len(values):
+        return False
+    return _equal(expected, values)
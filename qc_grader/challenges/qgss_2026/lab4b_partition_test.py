@@ -0,0 +1,101 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from qc_grader.challenges.qgss_2026.lab4b_partition import (
+    exp_map_matches,
+    exp_values,
+    find_best_result,
+    set_matches,
+    split_by_bits,
+)
+
+
+def _pub_result(evs):
+    return SimpleNamespace(data=SimpleNamespace(evs=evs))
+
+
+def test_exp_values_concatenates_pub_results():
+    result = [_pub_result([1.0, 2.0]), _pub_result(np.array([3.0])), object()]
+
+    np.testing.assert_array_equal(exp_values(result), [1.0, 2.0, 3.0])
+    assert exp_values([]).shape == (0,)
+
+
+@pytest.mark.parametrize(
+    "exp_map,expected",
+    [
+        ({0: np.float64(1.0), 1: 2.5}, True),
+        ({1: 2.5, 0: 1}, True),
+        ({np.int64(0): 1.0, np.int64(1): 2.5}, True),
+        ({0: 1.0, 1: 2.5, 2: 0.0}, False),
+        ({0: 1.0, 2: 2.5}, False),
+        ({0: 1.0, 1: 2.6}, False),
+        ({0: "1.0", 1: 2.5}, False),
+        ({0: [1.0], 1: 2.5}, False),
+        ([1.0, 2.5], False),
+        (None, False),
+    ],
+)
+def test_exp_map_matches_like_dict_equality(exp_map, expected):
+    values = np.array([1.0, 2.5])
+
+    assert exp_map_matches(exp_map, values) is expected
+    if isinstance(exp_map, dict):
+        assert (exp_map == dict(enumerate(values.tolist()))) is expected
+
+
+def test_exp_map_with_nan_never_matches():
+    assert not exp_map_matches({0: float("nan")}, np.array([float("nan")]))
+
+
+def test_split_by_bits():
+    set0, set1 = split_by_bits([10, 20, 30, 40.9], [1, 0, 2, 1, 1, 1])  # type: ignore
+
+    assert set0.tolist() == [10, 40]
+    assert set1.tolist() == [20]
+
+
+def test_split_by_bits_too_few_bits():
+    with pytest.raises(IndexError):
+        split_by_bits([10, 20, 30], [1, 0])
+
+
+@pytest.mark.parametrize(
+    "expected,matches",
+    [([10, 30], True), ([10.0, 30.0], True), ([30, 10], False), ({10, 30}, False)],
+)
+def test_set_matches_like_list_equality(expected, matches):
+    assert set_matches(np.array([10, 30]), expected) is matches
+
+
+def test_find_best_result_with_sets_and_nan():
+    results_dict = {
+        "No EM": {"set0": {1, 2}, "set1": {3}, "difference": float("nan")},
+        "TREX": {"set0": [1, 2], "set1": [3], "difference": 4},
+        "ZNE": {"set0": [1, 2], "set1": [3], "difference": 4.0},
+    }
+
+    best_difference, best_method, total_sum = find_best_result(results_dict)  # type: ignore
+
+    assert (best_difference, best_method, total_sum) == (4, "TREX", 6)
+    assert type(best_difference) is int
+    assert type(total_sum) is int
+
+
+def test_find_best_result_without_finite_differences():
+    results_dict = {"No EM": {"set0": [], "set1": [], "difference": float("inf")}}
+
+    assert find_best_result(results_dict) == (float("inf"), None, 0)  # type: ignore
+    assert find_best_result({}) == (float("inf"), None, None)  # type: ignore
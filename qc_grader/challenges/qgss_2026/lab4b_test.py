@@ -35,6 +35,15 @@ from qc_grader.challenges.qgss_2026.lab4b import (
     grade_lab4b_exbonus,
     sanitize_for_json,
 )
+from qc_grader.grader.jobs import clear_job_results
+
+
+@pytest.fixture(autouse=True)
+def _fresh_job_results():
+    # The mock jobs below share job ids, so don't let results leak between tests.
+    clear_job_results()
+    yield
+    clear_job_results()
 
 
 # ------------------------------------------------------------------------------------------------------
@@ -645,6 +654,35 @@ def test_grade_lab4b_ex4_stored_exp_map_none_raises_error() -> None:
             grade_lab4b_ex4(options_list, mock_results_dict, job_list)  # type: ignore
 
 
+def test_grade_lab4b_ex4_options_mismatch_names_option() -> None:
+    """Test that an options mismatch reports which option differed."""
+    mock_job = Mock(spec=RuntimeJobV2)
+    mock_job.job_id.return_value = "ex4-job"
+    mock_job.inputs = {"options": {"resilience": {"zne_mitigation": True}}}
+    mock_pub_result = Mock()
+    mock_pub_result.data.evs = [1.0, 2.0]
+    mock_job.result.return_value = [mock_pub_result]
+    base_result = _create_base_result()
+
+    results_dict = {
+        "No EM": base_result,
+        "TREX": {**base_result, "difference": 10.0},
+        "ZNE": {**base_result, "difference": 15.0},
+        "PEC": {**base_result, "difference": 20.0},
+    }
+
+    options_list = [EstimatorOptions() for _ in range(4)]
+    job_list = [mock_job] * 4
+
+    with patch("qc_grader.challenges.qgss_2026.lab4b.grade_answer"):
+        with pytest.raises(
+            ValueError,
+            match="job_No EM options do not match expected options: "
+            "resilience.zne_mitigation: expected Unset, got True",
+        ):
+            grade_lab4b_ex4(options_list, results_dict, job_list)  # type: ignore
+
+
 # ------------------------------------------------------------------------------------------------------
 # Tests for _extract_qpu_usage_seconds
 # ------------------------------------------------------------------------------------------------------
@@ -13,18 +13,20 @@ QGSS 2026 Lab 4c - Grading Functions
 """
 
 from collections.abc import Callable
-from pathlib import Path
+from functools import lru_cache
 from typing import Any, Sequence, Optional
 from typeguard import typechecked, CollectionCheckStrategy
 
 import numpy as np
-from qiskit import QuantumCircuit, generate_preset_pass_manager
-from qiskit_ibm_runtime.fake_provider import FakeMiami
+from qiskit import QuantumCircuit
 
+from qc_grader.grader.backends import get_preset_pass_manager
+from qc_grader.grader.fixtures import load_npy_fixture
 from qc_grader.grader.grade import grade_answer
 
 _CHALLENGE = "qgss_2026"
 _LAB = "lab4c"
+_FIXTURES_PACKAGE = "qc_grader.challenges.qgss_2026"
 
 
 def _grade(answer: Any, exercise: str) -> None:
@@ -44,6 +46,58 @@ def grade_lab4c_ex1a(
     _grade(alpha_beta_indices, "ex1a")
 
 
+# Test alpha-beta pair layout
+_DIAG_COULOMB_ANGLES = np.array(
+    [
+        -1.52450963e00,
+        -1.51845886e00,
+        -7.65931488e-01,
+        -2.66798027e-02,
+        -1.51732558e-02,
+        5.37571952e-02,
+        3.61501255e-03,
+        4.62304337e-02,
+        1.78404672e-02,
+        8.64710024e-04,
+        1.54544066e-02,
+        -3.54207910e-02,
+        -3.57567660e-02,
+        1.64312367e-03,
+        2.00627775e-02,
+        -3.87242902e-02,
+        -2.46880320e-02,
+        -7.29545064e-03,
+        2.91340124e-03,
+        1.36074778e-02,
+        -4.85994184e-03,
+        -2.85536083e-02,
+        -4.15798626e-02,
+        -7.68232453e-01,
+        -1.51392432e00,
+        -1.47923619e00,
+    ]
+)
+
+
+@lru_cache(maxsize=256)
+def _diag_coulomb_depth2q(
+    initial_layout: tuple[int, ...], num_pairs: int, seed: Optional[int]
+) -> int:
+    """Transpile the alpha-beta pair test circuit on FakeMiami and return its 2q depth."""
+    diag_coulomb = QuantumCircuit(52)
+    for i in range(num_pairs):
+        diag_coulomb.cp(_DIAG_COULOMB_ANGLES[i], i, i + 26)
+
+    pm = get_preset_pass_manager(
+        "FakeMiami",
+        optimization_level=1 if num_pairs == 24 else 3,
+        initial_layout=initial_layout,
+        seed_transpiler=seed,
+    )
+    isa_circuit = pm.run(diag_coulomb)
+    return isa_circuit.depth(filter_function=lambda x: x.operation.num_qubits == 2)
+
+
 @typechecked(collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS)
 def grade_lab4c_ex1b(
     initial_layout: Sequence[int],
@@ -57,53 +111,13 @@ def grade_lab4c_ex1b(
         initial_layout: A list of qubit layout
     """
 
-    backend = FakeMiami()
     num_pairs = len(alpha_beta_indices)
-
-    # Test alpha-beta pair layout
-    angles = np.array(
-        [
-            -1.52450963e00,
-            -1.51845886e00,
-            -7.65931488e-01,
-            -2.66798027e-02,
-            -1.51732558e-02,
-            5.37571952e-02,
-            3.61501255e-03,
-            4.62304337e-02,
-            1.78404672e-02,
-            8.64710024e-04,
-            1.54544066e-02,
-            -3.54207910e-02,
-            -3.57567660e-02,
-            1.64312367e-03,
-            2.00627775e-02,
-            -3.87242902e-02,
-            -2.46880320e-02,
-            -7.29545064e-03,
-            2.91340124e-03,
-            1.36074778e-02,
-            -4.85994184e-03,
-            -2.85536083e-02,
-            -4.15798626e-02,
-            -7.68232453e-01,
-            -1.51392432e00,
-            -1.47923619e00,
-        ]
-    )
-
-    diag_coulomb = QuantumCircuit(52)
-    for i in range(num_pairs):
-        diag_coulomb.cp(angles[i], i, i + 26)
-
-    pm = generate_preset_pass_manager(
-        backend=backend,
-        optimization_level=1 if num_pairs == 24 else 3,
-        initial_layout=initial_layout,
-        seed_transpiler=seed,
-    )
-    isa_circuit = pm.run(diag_coulomb)
-    depth2q = isa_circuit.depth(filter_function=lambda x: x.operation.num_qubits == 2)
+    layout = tuple(int(qubit) for qubit in initial_layout)
+    if seed is None:
+        # Unseeded layout and routing are random, so the result can't be reused.
+        depth2q = _diag_coulomb_depth2q.__wrapped__(layout, num_pairs, seed)
+    else:
+        depth2q = _diag_coulomb_depth2q(layout, num_pairs, seed)
 
     _grade((initial_layout, (num_pairs, depth2q)), "ex1b")
 
@@ -184,9 +198,8 @@ def grade_lab4c_ex3b(
     probs = np.array([1 / num_samples] * num_samples)
     num_orbitals = 12
     num_elec = (6, 6)
-    _utils = Path(__file__).parent / "utils"
-    samples = np.load(_utils / "lab4c_test_samples.npy")
-    occs = np.load(_utils / "lab4c_test_occ.npy")
+    samples = load_npy_fixture(_FIXTURES_PACKAGE, "utils/lab4c_test_samples.npy")
+    occs = load_npy_fixture(_FIXTURES_PACKAGE, "utils/lab4c_test_occ.npy")
 
     recovered_bitstrings, _ = recover_configurations(
         samples,
@@ -0,0 +1,74 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Compact encoding of 0/1 sample matrices."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy
+
+
+@dataclass(frozen=True)
+class BitstringMatrix:
+    """A 0/1 array with each row bit-packed by `numpy.packbits`.
+
+    A row is everything past the first axis, so `(shots, 2, 13)` arrays pack 26 bits
+    per row. With `counts`, `packed` holds the distinct rows in sorted order and
+    `counts` how often each occurred, which keeps every row but not their order.
+    """
+
+    packed: numpy.ndarray
+    shape: tuple[int, ...]
+    dtype: numpy.dtype
+    counts: numpy.ndarray | None = None
+
+    @classmethod
+    def from_array(cls, array: Any, deduplicate: bool = False) -> "BitstringMatrix":
+        """Pack `array`, raising `ValueError` if it holds anything but 0 and 1."""
+        array = numpy.asarray(array)
+        if array.ndim == 0:
+            raise ValueError("Expected an array with at least one dimension")
+        if array.dtype.kind not in "biu":
+            raise ValueError(f"Expected a bool or integer array, got {array.dtype}")
+        if array.dtype.kind != "b" and ((array != 0) & (array != 1)).any():
+            raise ValueError("Expected an array of only 0 and 1")
+
+        if array.ndim > 1:
+            rows = array.reshape(len(array), int(numpy.prod(array.shape[1:])))
+        else:
+            rows = array[None, :]
+        packed = numpy.packbits(rows, axis=1)
+        counts = None
+        if deduplicate:
+            packed, counts = numpy.unique(packed, axis=0, return_counts=True)
+            counts = counts.astype(numpy.min_scalar_type(counts.max(initial=0)))
+        return cls(packed, array.shape, array.dtype, counts)
+
+    def to_array(self) -> numpy.ndarray:
+        """Unpack into an array of the original shape and dtype."""
+        num_bits = int(numpy.prod(self.shape[1:] or self.shape))
+        rows = numpy.unpackbits(self.packed, axis=1, count=num_bits)
+        if self.counts is not None:
+            rows = numpy.repeat(rows, self.counts, axis=0)
+        return rows.astype(self.dtype, copy=False).reshape(self.shape)
+
+
+def pack_bitstrings(value: Any, deduplicate: bool = False) -> Any:
+    """Return `value` as a `BitstringMatrix` if it is a 0/1 array, else unchanged.
+
+    No grader sends these yet: the grading server has to decode them first.
+    """
+    if not isinstance(value, numpy.ndarray) or value.ndim == 0 or value.size == 0:
+        return value
+    try:
+        return BitstringMatrix.from_array(value, deduplicate)
+    except ValueError:
+        return value
@@ -10,6 +10,7 @@
 
 
 import json
+from collections import Counter
 from fractions import Fraction
 from typing import Any
 
@@ -23,10 +24,16 @@ import numpy
 from networkx import Graph
 
 from . import serializer
+from .bitstrings import BitstringMatrix
 
 
-def to_json(obj: Any) -> str:
-    return json.dumps(obj, skipkeys=True, cls=GraderJSONEncoder)
+def to_json(obj: Any, type_counts: Counter[str] | None = None) -> str:
+    """Encode `obj`, counting the objects converted by type name in `type_counts`."""
+    if type_counts is None:
+        return json.dumps(obj, skipkeys=True, cls=GraderJSONEncoder)
+    return json.dumps(
+        obj, skipkeys=True, cls=_CountingJSONEncoder, type_counts=type_counts
+    )
 
 
 class GraderJSONEncoder(json.JSONEncoder):
@@ -40,6 +47,8 @@ class GraderJSONEncoder(json.JSONEncoder):
                 return serializer.dump_numpy_bool(o)
             case numpy.ndarray.__name__:
                 return serializer.dump_numpy_ndarray(o)
+            case BitstringMatrix.__name__:
+                return serializer.dump_bitstring_matrix(o)
             case numpy.complex128.__name__:
                 return serializer.dump_numpy_complex(o)
             case complex.__name__:
@@ -76,3 +85,13 @@ class GraderJSONEncoder(json.JSONEncoder):
                 return serializer.dump_dict_keys(o)
             case _:
                 return json.JSONEncoder.default(self, o)
+
+
+class _CountingJSONEncoder(GraderJSONEncoder):
+    def __init__(self, *, type_counts: Counter[str], **kwargs: Any):
+        super().__init__(**kwargs)
+        self.type_counts = type_counts
+
+    def default(self, o: Any) -> Any:
+        self.type_counts[type(o).__name__] += 1
+        return super().default(o)
@@ -9,11 +9,15 @@
 # that they have been altered from the originals.
 
 import json
+from collections import Counter
+from io import BytesIO
 
 import numpy as np
 import pytest
+from qiskit.circuit import Parameter
 
 from qc_grader.custom_encoder import to_json
+from qc_grader.custom_encoder.bitstrings import BitstringMatrix, pack_bitstrings
 
 # ------------------------------------------------------------------------------------------------------
 # Std lib
@@ -55,6 +59,67 @@ def test_numpy_ndarray():
     assert "ndarray" in result
 
 
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(12, dtype=np.int64).reshape(3, 4),
+        np.asfortranarray(np.arange(12, dtype=np.float64).reshape(3, 4)),
+        np.arange(24, dtype=np.float32).reshape(4, 6)[:, ::2],
+        np.array(3.5),
+        np.zeros((0, 3)),
+        np.array([True, False, True]),
+        np.arange(5, dtype=">u2"),
+        np.array([(1, 2.0)], dtype=[("a", "<i4"), ("b", "<f8")]),
+    ],
+)
+def test_numpy_ndarray_matches_numpy_save(array):
+    with BytesIO() as container:
+        np.save(container, array, allow_pickle=False)
+        expected = container.getvalue().decode("ISO-8859-1")
+
+    result = json.loads(to_json(array))
+    assert result["ndarray"] == expected
+
+    loaded = np.load(BytesIO(result["ndarray"].encode("ISO-8859-1")))
+    np.testing.assert_array_equal(loaded, array)
+
+
+def test_numpy_ndarray_object_dtype_rejected():
+    with pytest.raises(ValueError, match="Object arrays"):
+        to_json(np.array([{}, None], dtype=object))
+
+
+def test_bitstring_matrix():
+    result = json.loads(to_json(BitstringMatrix.from_array(np.eye(3, dtype=bool))))
+
+    assert result["__class__"] == "BitstringMatrix"
+    assert result["shape"] == [3, 3]
+    assert result["dtype"] == "|b1"
+    assert result["counts"] is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [np.array([0, 2, 1]), np.array([0.0, 1.0]), np.array(1), [0, 1], "0101"],
+)
+def test_pack_bitstrings_leaves_other_values(value):
+    assert pack_bitstrings(value) is value
+
+
 def test_numpy_complex128():
     result = json.loads(to_json(np.complex128(1 + 2j)))
     assert result == {"__class__": "numpy.complex128", "re": 1.0, "im": 2.0}
+
+
+def test_type_counts():
+    value = {"a": np.arange(2), "b": [1j, 2j, np.complex128(3j)]}
+    counts = Counter()
+
+    assert to_json(value, counts) == to_json(value)
+    assert counts == {"ndarray": 1, "complex": 2, "complex128": 1}
+
+
+def test_parameter():
+    x = Parameter("x")
+    result = json.loads(to_json(x))
+    assert result == {"__class__": "Parameter", "name": "x", "uuid": str(x.uuid)}
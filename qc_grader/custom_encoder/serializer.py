@@ -20,8 +20,11 @@ from qiskit.primitives import SamplerResult, EstimatorResult, PrimitiveResult
 from qiskit.quantum_info import Operator, Pauli, SparsePauliOp, Statevector
 from qiskit.result import ProbDistribution, QuasiDistribution
 import numpy
+from numpy.lib import format as npy_format
 from networkx import Graph
 
+from .bitstrings import BitstringMatrix
+
 
 def circuit_to_bytes(qc: Union[TwoLocal, QuantumCircuit]) -> bytes:
     with BytesIO() as container:
@@ -43,11 +46,57 @@ def dump_numpy_bool(obj: numpy.bool_):
     return {"__class__": "numpy.bool)", "float": bool(obj)}
 
 
-def dump_numpy_ndarray(obj: numpy.ndarray):
+def _npy_header(obj: numpy.ndarray) -> bytes | None:
+    """Return the `.npy` header `numpy.save` would write, or None if it needs v2+."""
     with BytesIO() as container:
-        numpy.save(container, obj, allow_pickle=False)
-        array = container.getvalue()
-    return {"__class__": "numpy.ndarray", "ndarray": array.decode("ISO-8859-1")}
+        try:
+            npy_format.write_array_header_1_0(
+                container, npy_format.header_data_from_array_1_0(obj)
+            )
+        except ValueError:
+            return None
+        return container.getvalue()
+
+
+def ndarray_to_npy_str(obj: numpy.ndarray) -> str:
+    """Encode an array as its `.npy` file contents, decoded as ISO-8859-1.
+
+    The output is identical to `numpy.save`, but the header and data are written
+    into a single preallocated buffer that is decoded directly, instead of going
+    through `BytesIO`. Arrays that are not contiguous are gathered by that same copy
+    rather than by a temporary contiguous one.
+    """
+    header = None
+    if not obj.dtype.hasobject and obj.dtype.itemsize > 0:
+        header = _npy_header(obj)
+
+    if header is None:
+        with BytesIO() as container:
+            numpy.save(container, obj, allow_pickle=False)
+            array = container.getvalue()
+        return array.decode("ISO-8859-1")
+
+    # `numpy.save` only writes Fortran order for arrays that are not also C-contiguous.
+    order = "F" if obj.flags.f_contiguous and not obj.flags.c_contiguous else "C"
+    buffer = bytearray(len(header) + obj.nbytes)
+    buffer[: len(header)] = header
+    data = numpy.frombuffer(buffer, dtype=obj.dtype, offset=len(header))
+    numpy.copyto(data.reshape(obj.shape, order=order), obj, casting="no")
+    return buffer.decode("ISO-8859-1")
+
+
+def dump_numpy_ndarray(obj: numpy.ndarray):
+    return {"__class__": "numpy.ndarray", "ndarray": ndarray_to_npy_str(obj)}
+
+
+def dump_bitstring_matrix(obj: BitstringMatrix):
+    return {
+        "__class__": "BitstringMatrix",
+        "shape": list(obj.shape),
+        "dtype": obj.dtype.str,
+        "packed": ndarray_to_npy_str(obj.packed),
+        "counts": None if obj.counts is None else ndarray_to_npy_str(obj.counts),
+    }
 
 
 def dump_numpy_complex(obj: numpy.complex128):
@@ -67,7 +116,7 @@ def dump_fraction(obj: Fraction):
 
 
 def dump_parameter(obj: Parameter):
-    return {"__class__": "Parameter", "name": obj.name, "uuid": str(obj._uuid)}
+    return {"__class__": "Parameter", "name": obj.name, "uuid": str(obj.uuid)}
 
 
 def dump_two_local(obj: TwoLocal):
@@ -7,3 +7,28 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
+
+from .archive import configure_archiver
+from .timings import disable_timings, enable_timings, last_timings
+from .tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    OtlpHttpSpanExporter,
+    disable_tracing,
+    enable_tracing,
+)
+from .typecheck import get_typecheck_policy, set_typecheck_policy
+
+__all__ = [
+    "FileSpanExporter",
+    "InMemorySpanExporter",
+    "OtlpHttpSpanExporter",
+    "configure_archiver",
+    "disable_timings",
+    "disable_tracing",
+    "enable_timings",
+    "enable_tracing",
+    "get_typecheck_policy",
+    "last_timings",
+    "set_typecheck_policy",
+]
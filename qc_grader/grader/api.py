@@ -15,26 +15,63 @@ import requests
 from qc_grader import __version__
 from qc_grader.grader.auth import get_access_token
 from qc_grader.grader.env import GRADER_BASE_URL
+from qc_grader.grader.timings import CallTimings, current_timings, phase
+from qc_grader.grader.tracing import set_attributes, traced
 
 
+def _body_size(request: requests.PreparedRequest) -> int:
+    # Requests sent with `json=` have a bytes body, and those without one None.
+    return len(request.body) if isinstance(request.body, (bytes, str)) else 0
+
+
+def _record_request(
+    timings: CallTimings, endpoint: str, response: requests.Response
+) -> None:
+    # `elapsed` runs until the response headers are in, so it covers connecting and
+    # the server grading, and the rest of the request is reading the body.
+    request_ns = timings.phases_ns.pop("request", 0)
+    waiting_ns = min(int(response.elapsed.total_seconds() * 1e9), request_ns)
+    timings.add("server", waiting_ns)
+    timings.add("download", request_ns - waiting_ns)
+    timings.endpoint = endpoint
+    timings.request_bytes += _body_size(response.request)
+    timings.response_bytes += len(response.content)
+
+
+@traced
 def send_request(
     endpoint: str,
     body: dict[str, Any] | None = None,
     method: str = "POST",
 ) -> dict[str, Any]:
+    with phase("auth"):
+        token = get_access_token()
     headers = {
         "Accept": "application/json",
         "Content-Type": "application/json",
         "X-Client-Version": __version__,
-        "Authorization": f"Bearer {get_access_token()}",
+        "Authorization": f"Bearer {token}",
     }
 
-    response = requests.request(
-        method, url=f"{GRADER_BASE_URL}{endpoint}", json=body, headers=headers
+    with phase("request"):
+        response = requests.request(
+            method, url=f"{GRADER_BASE_URL}{endpoint}", json=body, headers=headers
+        )
+    if timings := current_timings():
+        _record_request(timings, endpoint, response)
+    set_attributes(
+        {
+            "http.request.method": method,
+            "url.path": endpoint,
+            "http.response.status_code": response.status_code,
+            "http.request.body.size": _body_size(response.request),
+            "http.response.body.size": len(response.content),
+        }
     )
 
     if response.status_code == 200:
-        return response.json()
+        with phase("parse"):
+            return response.json()
 
     if response.status_code == 204:
         return {}
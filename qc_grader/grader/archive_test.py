@@ -0,0 +1,116 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import pickle
+
+import numpy as np
+import pytest
+
+from qc_grader.grader import archive
+from qc_grader.grader.archive import (
+    DEFAULT_COMPRESSLEVEL,
+    ResultArchiver,
+    _configured_compresslevel,
+    configure_archiver,
+    get_archiver,
+)
+
+
+@pytest.mark.parametrize("compresslevel", [0, 1, 9])
+def test_save_array_writes_npz(tmp_path, compresslevel):
+    samples = np.random.default_rng(0).integers(0, 2, (50, 80))
+    archiver = ResultArchiver(compresslevel=compresslevel)
+
+    path = archiver.save_array(str(tmp_path / "results" / "samples.npz"), samples)
+    archiver.flush()
+
+    with np.load(path) as archive:
+        np.testing.assert_array_equal(archive["array"], samples)
+    assert [p.name for p in (tmp_path / "results").iterdir()] == ["samples.npz"]
+
+
+def test_save_array_uncompressed_npy(tmp_path):
+    archiver = ResultArchiver(compresslevel=None)
+
+    path = archiver.save_array(str(tmp_path / "hvs.npz"), np.array(12.5))
+    archiver.flush()
+
+    assert path == str(tmp_path / "hvs.npy")
+    assert np.load(path) == 12.5
+
+
+def test_saved_values_are_snapshots(tmp_path):
+    samples = np.zeros(4, dtype=np.int64)
+    params = {"theta": [0.1]}
+    archiver = ResultArchiver()
+
+    array_path = archiver.save_array(str(tmp_path / "samples.npz"), samples)
+    pickle_path = archiver.save_pickle(str(tmp_path / "params.npz"), params)
+    samples[:] = 1
+    params["theta"].append(0.2)
+    archiver.flush()
+
+    with np.load(array_path) as archive:
+        np.testing.assert_array_equal(archive["array"], np.zeros(4))
+    with open(pickle_path, "rb") as file:
+        assert pickle.load(file) == {"theta": [0.1]}
+
+
+def test_failed_write_is_reported_and_cleaned_up(tmp_path, capsys):
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    archiver = ResultArchiver()
+
+    archiver.save_pickle(str(blocker / "job.npz"), ["job-id"])
+    archiver.save_pickle(str(tmp_path / "job.npz"), ["job-id"])
+    archiver.flush()
+
+    assert "Failed to save" in capsys.readouterr().out
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["job.npz", "not_a_directory"]
+
+
+def test_get_archiver_is_shared():
+    assert get_archiver() is get_archiver()
+
+
+@pytest.fixture
+def _default_archiver():
+    yield
+    configure_archiver()
+
+
+@pytest.mark.usefixtures("_default_archiver")
+def test_configure_archiver(tmp_path):
+    configure_archiver(compresslevel=None)
+    path = get_archiver().save_array(str(tmp_path / "hvs.npz"), np.array(12.5))
+    get_archiver().flush()
+    assert path.endswith(".npy")
+
+    configure_archiver(compresslevel=0)
+    assert get_archiver().compresslevel == 0
+    with pytest.raises(ValueError, match="Unknown compression level 10"):
+        configure_archiver(compresslevel=10)
+
+
+def test_compresslevel_from_env(monkeypatch, capsys):
+    monkeypatch.setenv("QC_GRADER_ARCHIVE_COMPRESSLEVEL", "0")
+    assert _configured_compresslevel() == 0
+    monkeypatch.setenv("QC_GRADER_ARCHIVE_COMPRESSLEVEL", "npy")
+    assert _configured_compresslevel() is None
+
+    monkeypatch.setenv("QC_GRADER_ARCHIVE_COMPRESSLEVEL", "fast")
+    assert _configured_compresslevel() == DEFAULT_COMPRESSLEVEL
+    assert "Ignoring QC_GRADER_ARCHIVE_COMPRESSLEVEL='fast'" in capsys.readouterr().out
+
+
+def test_shared_archiver_reads_the_env(monkeypatch):
+    monkeypatch.setenv("QC_GRADER_ARCHIVE_COMPRESSLEVEL", "npy")
+    monkeypatch.setattr(archive, "_archiver", None)
+    assert get_archiver().compresslevel is None
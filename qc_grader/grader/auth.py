@@ -16,6 +16,7 @@ from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 from qiskit_ibm_runtime import QiskitRuntimeService
 
 from qc_grader.grader.env import IAM_BASE_URL, IS_STAGING, IS_DEV
+from qc_grader.grader.tracing import traced
 
 _AUTH_ENV_VAR_NAME = "QC_API_KEY"
 
@@ -51,6 +52,7 @@ def read_api_key() -> str | None:
     return None
 
 
+@traced
 def get_access_token() -> str:
     api_key = read_api_key()
     if api_key is None:
@@ -0,0 +1,47 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Process-wide caches of fake backends and preset pass managers."""
+
+from functools import cache, lru_cache
+
+from qiskit import generate_preset_pass_manager
+from qiskit.transpiler import StagedPassManager
+from qiskit_ibm_runtime import fake_provider
+from qiskit_ibm_runtime.fake_provider.fake_backend import FakeBackendV2
+
+
+@cache
+def get_fake_backend(name: str) -> FakeBackendV2:
+    """Return a shared instance of the fake backend class `name`, e.g. `"FakeMiami"`.
+
+    The backend's `Target` is built here, so only the first call pays for parsing the
+    backend's JSON files.
+    """
+    backend = getattr(fake_provider, name)()
+    _ = backend.target
+    return backend
+
+
+@lru_cache(maxsize=64)
+def get_preset_pass_manager(
+    backend_name: str,
+    optimization_level: int,
+    initial_layout: tuple[int, ...] | None = None,
+    seed_transpiler: int | None = None,
+) -> StagedPassManager:
+    """Return a shared `generate_preset_pass_manager` for a fake backend."""
+    return generate_preset_pass_manager(
+        backend=get_fake_backend(backend_name),
+        optimization_level=optimization_level,
+        # None is the default, although the annotation leaves it out.
+        initial_layout=None if initial_layout is None else list(initial_layout),  # type: ignore
+        seed_transpiler=seed_transpiler,
+    )
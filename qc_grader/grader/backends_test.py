@@ -0,0 +1,24 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from qc_grader.grader.backends import get_fake_backend, get_preset_pass_manager
+
+
+def test_get_fake_backend_is_shared():
+    backend = get_fake_backend("FakeMiami")
+    assert backend is get_fake_backend("FakeMiami")
+    assert backend.num_qubits == 120
+
+
+def test_get_preset_pass_manager_keyed_by_arguments():
+    pm = get_preset_pass_manager("FakeMiami", 1, (0, 1), 7)
+    assert pm is get_preset_pass_manager("FakeMiami", 1, (0, 1), 7)
+    assert pm is not get_preset_pass_manager("FakeMiami", 1, (1, 0), 7)
+    assert pm is not get_preset_pass_manager("FakeMiami", 1, (0, 1), 8)
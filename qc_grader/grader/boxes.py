@@ -0,0 +1,57 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Replacing boxes by the ops in their bodies."""
+
+from typing import Sequence
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Clbit, Qubit
+
+
+def _inline(
+    unrolled: QuantumCircuit,
+    body: QuantumCircuit,
+    qubits: Sequence[Qubit],
+    clbits: Sequence[Clbit],
+) -> None:
+    """Append the instructions of `body`, applied to `qubits` and `clbits`."""
+    qubit_map = dict(zip(body.qubits, qubits))
+    clbit_map = dict(zip(body.clbits, clbits))
+    for instruction in body.data:
+        box_qubits = [qubit_map[qubit] for qubit in instruction.qubits]
+        box_clbits = [clbit_map[clbit] for clbit in instruction.clbits]
+        if instruction.name == "box":
+            _inline(unrolled, instruction.operation.body, box_qubits, box_clbits)
+        else:
+            # `append` validates and broadcasts every instruction again, which made
+            # unrolling 5x slower. ty does not see that `_append` takes a
+            # `CircuitInstruction`.
+            unrolled._append(instruction.replace(qubits=box_qubits, clbits=box_clbits))  # type: ignore
+    unrolled.global_phase += body.global_phase
+
+
+def unroll_boxes(circuit: QuantumCircuit) -> QuantumCircuit:
+    """Return `circuit` with every box, including nested ones, replaced by its body.
+
+    `circuit` itself is returned if it has no boxes. Otherwise the result shares its
+    operations with `circuit` rather than copying them.
+    """
+    if "box" not in circuit.count_ops():
+        return circuit
+
+    unrolled = circuit.copy_empty_like()
+    for instruction in circuit.data:
+        if instruction.name == "box":
+            body = instruction.operation.body
+            _inline(unrolled, body, instruction.qubits, instruction.clbits)
+        else:
+            unrolled._append(instruction)
+    return unrolled
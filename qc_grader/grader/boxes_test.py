@@ -0,0 +1,84 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import math
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import BoxOp, Parameter
+from samplomatic import Twirl
+
+from qc_grader.grader.boxes import unroll_boxes
+
+
+def test_unroll_boxes_returns_circuits_without_boxes_unchanged():
+    circuit = QuantumCircuit(2)
+    circuit.cx(0, 1)
+
+    assert unroll_boxes(circuit) is circuit
+
+
+def test_unroll_boxes_inlines_bodies_on_the_box_wires():
+    gamma = Parameter("gamma")
+    circuit = QuantumCircuit(3, 2)
+    circuit.h(range(3))
+    with circuit.box([Twirl()]):
+        circuit.rzz(gamma, 2, 0)
+    with circuit.box([Twirl()]):
+        circuit.measure([1, 2], [1, 0])
+
+    expected = QuantumCircuit(3, 2)
+    expected.h(range(3))
+    expected.rzz(gamma, 2, 0)
+    expected.measure([1, 2], [1, 0])
+
+    assert unroll_boxes(circuit) == expected
+
+
+def test_unroll_boxes_inlines_nested_boxes():
+    inner = QuantumCircuit(1, global_phase=math.pi / 4)
+    inner.x(0)
+    middle = QuantumCircuit(2)
+    middle.cx(1, 0)
+    middle.append(BoxOp(inner), [0])
+    outer = QuantumCircuit(3, global_phase=math.pi / 2)
+    outer.h(2)
+    outer.append(BoxOp(middle, annotations=[Twirl()]), [1, 2])
+
+    circuit = QuantumCircuit(4)
+    circuit.append(BoxOp(outer), [3, 1, 0])
+    circuit.z(0)
+
+    expected = QuantumCircuit(4, global_phase=3 * math.pi / 4)
+    expected.h(0)
+    expected.cx(0, 1)
+    expected.x(1)
+    expected.z(0)
+
+    assert unroll_boxes(circuit) == expected
+
+
+def test_unroll_boxes_reuses_boxes_appended_more_than_once():
+    body = QuantumCircuit(2)
+    body.cx(0, 1)
+    body.rz(0.5, 1)
+    with_box = QuantumCircuit(2)
+    with with_box.box():
+        with_box.compose(body, inplace=True)
+    box = with_box.data[0].operation
+
+    circuit = QuantumCircuit(3)
+    circuit.append(box, [0, 1])
+    circuit.append(box, [2, 0])
+
+    expected = QuantumCircuit(3)
+    expected.compose(body, [0, 1], inplace=True)
+    expected.compose(body, [2, 0], inplace=True)
+
+    assert unroll_boxes(circuit) == expected
@@ -0,0 +1,191 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Calling user-supplied functions over a list of test inputs."""
+
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Sequence, cast
+
+_TIMEOUT_ENV_VAR_NAME = "QC_GRADER_CALL_TIMEOUT"
+_PROCESSES_ENV_VAR_NAME = "QC_GRADER_PROCESSES"
+# Seconds worker processes may take to start and import the function to call.
+_STARTUP_TIMEOUT = 120.0
+
+
+@dataclass(frozen=True)
+class Evaluation:
+    input: Any
+    value: Any
+    # Wall time of the call itself, excluding any process start-up.
+    seconds: float
+
+
+def _timed_call(fn: Callable, keyword: str | None, arg: Any) -> tuple[Any, float]:
+    start = time.perf_counter()
+    value = fn(**{keyword: arg}) if keyword is not None else fn(arg)
+    return value, time.perf_counter() - start
+
+
+def _describe(fn: Callable, keyword: str | None, arg: Any) -> str:
+    name = getattr(fn, "__name__", repr(fn))
+    return f"{name}({keyword}={arg!r})" if keyword is not None else f"{name}({arg!r})"
+
+
+def _timeout_error(fn: Callable, keyword: str | None, arg: Any, timeout: float):
+    return TimeoutError(
+        f"{_describe(fn, keyword, arg)} did not return within {timeout:g} seconds. "
+        "Please check it for infinite loops."
+    )
+
+
+def _configured_timeout() -> float | None:
+    value = os.environ.get(_TIMEOUT_ENV_VAR_NAME)
+    timeout = float(value) if value else 0.0
+    return timeout if timeout > 0 else None
+
+
+def _configured_processes() -> int:
+    return int(os.environ.get(_PROCESSES_ENV_VAR_NAME) or 1)
+
+
+def _call(
+    fn: Callable, keyword: str | None, arg: Any, timeout: float | None
+) -> tuple[Any, float]:
+    if timeout is None:
+        return _timed_call(fn, keyword, arg)
+
+    outcome: dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            outcome["result"] = _timed_call(fn, keyword, arg)
+        except BaseException as error:
+            outcome["error"] = error
+
+    # A thread cannot be stopped, so a call that times out keeps running in the
+    # background, but the caller gets control back. Timeouts are opt-in for this
+    # reason.
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise _timeout_error(fn, keyword, arg, timeout)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def _can_send_to_processes(fn: Callable) -> bool:
+    # Workers import functions by module, which they cannot do for functions defined
+    # in a notebook.
+    if getattr(fn, "__module__", None) == "__main__":
+        return False
+    try:
+        pickle.dumps(fn)
+    except Exception:
+        return False
+    return True
+
+
+def _context() -> multiprocessing.context.BaseContext:
+    # Forking once Qiskit has started its Rust thread pool can deadlock the children.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _start_worker(pickled_fn: bytes, ready: threading.Barrier) -> None:
+    # Unpickling imports the module of the function, which may take a while.
+    pickle.loads(pickled_fn)
+    ready.wait()
+
+
+def _call_in_processes(
+    fn: Callable,
+    keyword: str | None,
+    inputs: Sequence[Any],
+    timeout: float | None,
+    processes: int,
+) -> list[tuple[Any, float]]:
+    context = _context()
+    processes = min(processes, len(inputs))
+    # Wait for every worker to be ready, so that starting them does not count
+    # towards the timeouts of the first calls.
+    ready = context.Barrier(processes + 1)
+    pool = context.Pool(
+        processes, initializer=_start_worker, initargs=(pickle.dumps(fn), ready)
+    )
+    try:
+        try:
+            ready.wait(_STARTUP_TIMEOUT)
+        except threading.BrokenBarrierError:
+            raise TimeoutError(
+                f"Worker processes did not start within {_STARTUP_TIMEOUT:g} seconds."
+            ) from None
+        pending = [pool.apply_async(_timed_call, (fn, keyword, arg)) for arg in inputs]
+        results = []
+        # The pool starts calls in order, so each one is already running by the time
+        # the previous result is in and waiting for it starts.
+        for arg, result in zip(inputs, pending):
+            try:
+                results.append(result.get(timeout))
+            except multiprocessing.TimeoutError:
+                # Only raised when there is a timeout to wait for.
+                raise _timeout_error(fn, keyword, arg, cast(float, timeout)) from None
+        return results
+    finally:
+        pool.terminate()
+
+
+def evaluate(
+    fn: Callable,
+    inputs: Sequence[Any],
+    keyword: str | None = None,
+    timeout: float | None = None,
+    processes: int | None = None,
+) -> Iterator[Evaluation]:
+    """Call `fn` with each of `inputs` and yield the results in the same order.
+
+    Each input is passed positionally, or as argument `keyword` if given. In this
+    process, each call is made on the caller's thread once the previous result has
+    been consumed, so callers can check each result before `fn` is called again. The
+    first exception raised, in order of `inputs`, is raised again here.
+
+    Args:
+        timeout: Seconds each call may take before `TimeoutError` is raised. By default
+            the `QC_GRADER_CALL_TIMEOUT` env var, or no limit. In this process, a call
+            that times out runs on a background thread that cannot be stopped, and keeps
+            running after the error.
+        processes: Number of worker processes to spread the calls over. By default the
+            `QC_GRADER_PROCESSES` env var, or 1 to call `fn` in this process. Functions
+            that cannot be imported by another process, such as those defined in a
+            notebook, are always called in this one. Timed-out workers are terminated.
+    """
+    if timeout is None:
+        timeout = _configured_timeout()
+    elif timeout <= 0:
+        timeout = None
+    if processes is None:
+        processes = _configured_processes()
+
+    if processes > 1 and len(inputs) > 1 and _can_send_to_processes(fn):
+        results = _call_in_processes(fn, keyword, inputs, timeout, processes)
+        for arg, (value, seconds) in zip(inputs, results):
+            yield Evaluation(arg, value, seconds)
+        return
+
+    for arg in inputs:
+        value, seconds = _call(fn, keyword, arg, timeout)
+        yield Evaluation(arg, value, seconds)
@@ -0,0 +1,124 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import os
+import threading
+import time
+
+import pytest
+
+from qc_grader.grader.candidates import evaluate
+
+
+def _square(n):
+    return n * n
+
+
+def _pid(n):
+    return os.getpid()
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _fail_on_three(n):
+    if n == 3:
+        raise ValueError("three")
+    return n
+
+
+def test_evaluate_returns_values_and_timings_in_input_order():
+    evaluations = list(evaluate(_square, [3, 1, 2]))
+
+    assert [evaluation.input for evaluation in evaluations] == [3, 1, 2]
+    assert [evaluation.value for evaluation in evaluations] == [9, 1, 4]
+    assert all(evaluation.seconds >= 0 for evaluation in evaluations)
+
+
+def test_evaluate_passes_inputs_by_keyword():
+    def gen(n_samples):
+        return [0] * n_samples
+
+    evaluations = list(evaluate(gen, [1, 2], keyword="n_samples"))
+
+    assert [evaluation.value for evaluation in evaluations] == [[0], [0, 0]]
+
+
+def test_evaluate_raises_the_first_error_in_input_order():
+    with pytest.raises(ValueError, match="three"):
+        list(evaluate(_fail_on_three, [1, 3, 5], processes=1))
+
+
+def test_evaluate_times_out_on_calls_that_do_not_return():
+    release = threading.Event()
+
+    def hangs(n):
+        release.wait()
+
+    start = time.perf_counter()
+    try:
+        with pytest.raises(TimeoutError, match=r"hangs\(1\) did not return within"):
+            list(evaluate(hangs, [1, 2], timeout=0.1))
+    finally:
+        release.set()
+    assert time.perf_counter() - start < 5
+
+
+def test_evaluate_reads_the_timeout_from_the_environment(monkeypatch):
+    monkeypatch.setenv("QC_GRADER_CALL_TIMEOUT", "0.05")
+
+    with pytest.raises(TimeoutError):
+        list(evaluate(_sleep, [1]))
+
+
+def test_evaluate_spreads_calls_over_processes():
+    evaluations = list(evaluate(_pid, range(4), processes=2))
+
+    assert os.getpid() not in {evaluation.value for evaluation in evaluations}
+    assert [evaluation.input for evaluation in evaluations] == [0, 1, 2, 3]
+
+
+def test_evaluate_terminates_processes_that_time_out():
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError, match=r"_sleep\(60\)"):
+        list(evaluate(_sleep, [0, 60], timeout=0.5, processes=2))
+    assert time.perf_counter() - start < 10
+
+
+def test_evaluate_calls_local_functions_in_this_process():
+    evaluations = list(evaluate(lambda n: os.getpid(), [1, 2], processes=2))
+
+    assert {evaluation.value for evaluation in evaluations} == {os.getpid()}
+
+
+def test_evaluate_raises_errors_from_processes():
+    with pytest.raises(ValueError, match="three"):
+        list(evaluate(_fail_on_three, [1, 3, 5], processes=2))
+
+
+def test_evaluate_calls_in_this_thread_without_a_timeout():
+    evaluations = list(evaluate(lambda n: threading.get_ident(), [1, 2]))
+
+    assert {evaluation.value for evaluation in evaluations} == {threading.get_ident()}
+
+
+def test_evaluate_calls_lazily_so_results_can_be_checked_as_they_come():
+    calls = []
+
+    def record(n):
+        calls.append(n)
+        return n
+
+    for evaluation in evaluate(record, [1, 2, 3]):
+        if evaluation.value == 2:
+            break
+    assert calls == [1, 2]
@@ -0,0 +1,243 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Size, depth and other facts about submitted circuits."""
+
+import hashlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import BoxOp, Store, SwitchCaseOp
+
+
+@dataclass(frozen=True)
+class CircuitMetrics:
+    num_qubits: int
+    num_clbits: int
+    depth: int
+    # Depth counting only instructions on exactly two qubits.
+    depth_2q: int
+    # Instructions other than directives such as barriers, like `QuantumCircuit.size()`.
+    size: int
+    num_multi_qubit_gates: int
+    # Like `QuantumCircuit.count_ops()`, most frequent first.
+    op_counts: dict[str, int]
+
+
+def _counts_2q(instruction) -> bool:
+    return len(instruction.qubits) == 2 and not getattr(
+        instruction.operation, "_directive", False
+    )
+
+
+def _compute_metrics(circuit: QuantumCircuit) -> CircuitMetrics:
+    # Follows `QuantumCircuit.depth()`: every instruction synchronises the wires it
+    # touches, and all but directives add a layer.
+    depths = dict.fromkeys(circuit.qubits, 0)
+    depths.update(dict.fromkeys(circuit.clbits, 0))
+    depths_2q = dict(depths)
+    counts: Counter[str] = Counter()
+    size = 0
+    num_multi_qubit_gates = 0
+    # Conditions, switches and stores also touch wires outside of their operands.
+    exact = True
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        counts[operation.name] += 1
+        if getattr(operation, "_condition", None) is not None or isinstance(
+            operation, (SwitchCaseOp, Store)
+        ):
+            exact = False
+        directive = getattr(operation, "_directive", False)
+        num_qubits = len(instruction.qubits)
+        if not directive:
+            size += 1
+            if num_qubits > 1:
+                num_multi_qubit_gates += 1
+
+        wires = instruction.qubits + instruction.clbits
+        if len(wires) == 1:
+            if not directive:
+                depths[wires[0]] += 1
+            continue
+        if not wires:
+            continue
+        depth = max(depths[wire] for wire in wires)
+        depth_2q = max(depths_2q[wire] for wire in wires)
+        if not directive:
+            depth += 1
+            if num_qubits == 2:
+                depth_2q += 1
+        for wire in wires:
+            depths[wire] = depth
+            depths_2q[wire] = depth_2q
+
+    if exact:
+        depth = max(depths.values(), default=0)
+        depth_2q = max(depths_2q.values(), default=0)
+    else:
+        depth = circuit.depth()
+        depth_2q = circuit.depth(_counts_2q)
+
+    return CircuitMetrics(
+        num_qubits=circuit.num_qubits,
+        num_clbits=circuit.num_clbits,
+        depth=depth,
+        depth_2q=depth_2q,
+        size=size,
+        num_multi_qubit_gates=num_multi_qubit_gates,
+        op_counts=dict(counts.most_common()),
+    )
+
+
+@dataclass(frozen=True)
+class BoxFacts:
+    # Type names of the box annotations, e.g. "Twirl" or "InjectNoise".
+    annotations: frozenset[str]
+    # Whether the body, or the body of a box nested in it, measures.
+    has_measure: bool
+
+
+@dataclass(frozen=True)
+class CircuitFacts:
+    num_qubits: int
+    # Op counts in order of first appearance, not looking inside boxes.
+    op_counts: dict[str, int]
+    # The parameters of every op that has any, by op name in circuit order.
+    op_params: dict[str, list[list[Any]]]
+    has_measure: bool
+    boxes: list[BoxFacts]
+
+
+# These read `CircuitInstruction.name` and `.params` rather than going through
+# `.operation`, which builds a Python object for every standard gate.
+
+
+def _has_measure(body: QuantumCircuit) -> bool:
+    for instruction in body.data:
+        if instruction.name == "measure":
+            return True
+        if instruction.name == "box" and _has_measure(instruction.operation.body):
+            return True
+    return False
+
+
+def _box_facts(box: BoxOp) -> BoxFacts:
+    return BoxFacts(
+        frozenset(type(annotation).__name__ for annotation in box.annotations),
+        _has_measure(box.body),
+    )
+
+
+def _compute_facts(circuit: QuantumCircuit) -> CircuitFacts:
+    op_counts: dict[str, int] = {}
+    op_params: dict[str, list[list[Any]]] = {}
+    boxes = []
+    for instruction in circuit.data:
+        name = instruction.name
+        op_counts[name] = op_counts.get(name, 0) + 1
+        if name == "box":
+            boxes.append(_box_facts(instruction.operation))
+        elif params := instruction.params:
+            op_params.setdefault(name, []).append(list(params))
+
+    return CircuitFacts(
+        num_qubits=circuit.num_qubits,
+        op_counts=op_counts,
+        op_params=op_params,
+        has_measure="measure" in op_counts,
+        boxes=boxes,
+    )
+
+
+def _hash_value(digest: Any, value: Any) -> None:
+    if isinstance(value, QuantumCircuit):
+        _hash_structure(digest, value)
+    elif isinstance(value, np.ndarray):
+        # `repr` elides the middle of large arrays, so hash every element.
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _hash_value(digest, item)
+        digest.update(b"]")
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b",")
+
+
+def _hash_structure(digest: Any, circuit: QuantumCircuit) -> None:
+    qubits = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    clbits = {clbit: i for i, clbit in enumerate(circuit.clbits)}
+    digest.update(
+        repr((circuit.num_qubits, circuit.num_clbits, circuit.global_phase)).encode()
+    )
+    for instruction in circuit.data:
+        name = instruction.name
+        digest.update(
+            repr(
+                (
+                    name,
+                    [qubits[qubit] for qubit in instruction.qubits],
+                    [clbits[clbit] for clbit in instruction.clbits],
+                )
+            ).encode()
+        )
+        if name == "box":
+            box = instruction.operation
+            digest.update(repr(box.annotations).encode())
+            _hash_structure(digest, box.body)
+        elif instruction.is_standard_gate():
+            _hash_value(digest, instruction.params)
+        else:
+            operation = instruction.operation
+            digest.update(type(operation).__name__.encode())
+            _hash_value(digest, instruction.params)
+            # Custom gates, e.g. from `QuantumCircuit.to_gate()`, are defined by their
+            # body rather than their parameters.
+            if not instruction.params and isinstance(
+                definition := getattr(operation, "definition", None), QuantumCircuit
+            ):
+                _hash_structure(digest, definition)
+        digest.update(b";")
+    digest.update(b"end;")
+
+
+def circuit_metrics(circuit: QuantumCircuit) -> CircuitMetrics:
+    """Return the metrics of `circuit`, computed in one pass over its instructions.
+
+    They are not cached, since circuits can be changed in place.
+    """
+    return _compute_metrics(circuit)
+
+
+def circuit_facts(circuit: QuantumCircuit) -> CircuitFacts:
+    """Return the op counts, parameters, measurements and boxes of `circuit`.
+
+    They are collected in one pass over its instructions and the bodies of its boxes,
+    and not cached, like `circuit_metrics`.
+    """
+    return _compute_facts(circuit)
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> str:
+    """Return a hash of the ops, wires, parameters and boxes of `circuit`.
+
+    Circuits built the same way get the same fingerprint, even as different objects,
+    and changing a circuit in place changes its fingerprint. It is not cached.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _hash_structure(digest, circuit)
+    return digest.hexdigest()
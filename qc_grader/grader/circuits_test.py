@@ -0,0 +1,175 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import CZGate
+from qiskit.circuit.random import random_circuit
+from samplomatic import InjectNoise, Twirl
+
+from qc_grader.grader.circuits import (
+    BoxFacts,
+    circuit_facts,
+    circuit_fingerprint,
+    circuit_metrics,
+)
+
+
+def _depth_2q(circuit: QuantumCircuit) -> int:
+    return circuit.depth(
+        lambda instruction: (
+            len(instruction.qubits) == 2 and not instruction.operation._directive
+        )
+    )
+
+
+def _with_barriers_and_measures() -> QuantumCircuit:
+    circuit = QuantumCircuit(4, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.barrier()
+    circuit.cx(2, 3)
+    circuit.ccx(0, 2, 3)
+    circuit.barrier(1, 2)
+    circuit.cx(1, 2)
+    circuit.measure([0, 3], [0, 1])
+    circuit.x(1)
+    return circuit
+
+
+@pytest.mark.parametrize(
+    "circuit",
+    [
+        QuantumCircuit(3),
+        _with_barriers_and_measures(),
+        random_circuit(6, 40, max_operands=3, measure=True, seed=1),
+        random_circuit(12, 80, max_operands=4, seed=2),
+    ],
+)
+def test_circuit_metrics_match_qiskit(circuit):
+    metrics = circuit_metrics(circuit)
+
+    assert metrics.num_qubits == circuit.num_qubits
+    assert metrics.num_clbits == circuit.num_clbits
+    assert metrics.depth == circuit.depth()
+    assert metrics.depth_2q == _depth_2q(circuit)
+    assert metrics.size == circuit.size()
+    assert metrics.op_counts == dict(circuit.count_ops())
+    assert metrics.num_multi_qubit_gates == circuit.num_nonlocal_gates()
+
+
+def test_circuit_metrics_follow_changes_in_place():
+    circuit = _with_barriers_and_measures()
+
+    circuit.cx(0, 3)
+    assert circuit_metrics(circuit).depth == circuit.depth()
+    assert "cz" not in circuit_metrics(circuit).op_counts
+
+    circuit.data[-1] = circuit.data[-1].replace(operation=CZGate())
+    assert circuit_metrics(circuit).op_counts["cz"] == 1
+    assert circuit_metrics(circuit).depth == circuit.depth()
+
+
+def _boxed() -> QuantumCircuit:
+    circuit = QuantumCircuit(3, 3)
+    with circuit.box([Twirl(), InjectNoise(ref="layer")]):
+        circuit.cz(0, 1)
+    with circuit.box([Twirl()]):
+        circuit.rx(0.5, 2)
+        with circuit.box():
+            circuit.measure(2, 2)
+    with circuit.box([Twirl()]):
+        circuit.measure(0, 0)
+    circuit.rx(0.25, 0)
+    return circuit
+
+
+def test_circuit_facts_describe_ops_and_boxes():
+    facts = circuit_facts(_boxed())
+
+    assert facts.num_qubits == 3
+    assert list(facts.op_counts.items()) == [("box", 3), ("rx", 1)]
+    assert facts.op_params == {"rx": [[0.25]]}
+    assert not facts.has_measure
+    assert facts.boxes == [
+        BoxFacts(frozenset({"Twirl", "InjectNoise"}), has_measure=False),
+        BoxFacts(frozenset({"Twirl"}), has_measure=True),
+        BoxFacts(frozenset({"Twirl"}), has_measure=True),
+    ]
+
+
+def test_circuit_facts_follow_changes_in_place():
+    circuit = _boxed()
+    assert not circuit_facts(circuit).has_measure
+
+    circuit.measure(1, 1)
+    assert circuit_facts(circuit).has_measure
+
+    theta = Parameter("theta")
+    circuit.rx(theta, 1)
+    assert circuit_facts(circuit).op_params["rx"][-1] == [theta]
+    circuit.assign_parameters({theta: 0.5}, inplace=True)
+    assert circuit_facts(circuit).op_params["rx"][-1] == [0.5]
+
+
+def test_circuit_fingerprint_depends_on_structure_not_identity():
+    circuit = _boxed()
+
+    assert circuit_fingerprint(circuit) == circuit_fingerprint(_boxed())
+    assert circuit_fingerprint(circuit) != circuit_fingerprint(
+        _with_barriers_and_measures()
+    )
+
+    changed = _boxed()
+    changed.data[-1] = changed.data[-1].replace(params=[0.5])
+    assert circuit_fingerprint(changed) != circuit_fingerprint(circuit)
+
+
+def test_circuit_fingerprint_follows_changes_in_place():
+    theta = Parameter("theta")
+    circuit = QuantumCircuit(1)
+    circuit.rx(theta, 0)
+    before = circuit_fingerprint(circuit)
+
+    circuit.assign_parameters({theta: 0.5}, inplace=True)
+    assert circuit_fingerprint(circuit) != before
+
+
+def test_circuit_fingerprint_hashes_every_element_of_array_params():
+    first, second = np.eye(64), np.eye(64)
+    second[30, 30] = second[31, 31] = 0
+    second[30, 31] = second[31, 30] = 1
+
+    def with_unitary(matrix):
+        circuit = QuantumCircuit(6)
+        circuit.unitary(matrix, range(6))
+        return circuit
+
+    assert circuit_fingerprint(with_unitary(first)) != circuit_fingerprint(
+        with_unitary(second)
+    )
+    assert circuit_fingerprint(with_unitary(first)) == circuit_fingerprint(
+        with_unitary(np.eye(64))
+    )
+
+
+def test_circuit_fingerprint_hashes_the_body_of_custom_gates():
+    def with_custom_gate(build):
+        body = QuantumCircuit(1, name="mine")
+        build(body)
+        circuit = QuantumCircuit(1)
+        circuit.append(body.to_gate(), [0])
+        return circuit
+
+    assert circuit_fingerprint(with_custom_gate(lambda c: c.x(0))) != (
+        circuit_fingerprint(with_custom_gate(lambda c: c.z(0)))
+    )
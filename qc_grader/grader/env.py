@@ -22,3 +22,7 @@ elif IS_DEV:
 else:
     GRADER_BASE_URL = "https://qac-grading.quantum.ibm.com"
     IAM_BASE_URL = "https://iam.cloud.ibm.com"
+
+# Point the client somewhere else, e.g. at `qc_grader.benchmarks.stub_server`.
+GRADER_BASE_URL = os.environ.get("QC_GRADER_URL", GRADER_BASE_URL).rstrip("/")
+IAM_BASE_URL = os.environ.get("QC_IAM_URL", IAM_BASE_URL).rstrip("/")
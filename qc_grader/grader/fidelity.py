@@ -0,0 +1,138 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Fidelity of circuit output states with the all-zero state, e.g. of mirror circuits."""
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info import Clifford, StabilizerState, Statevector
+
+# Largest circuit simulated as a dense statevector, which takes 16 * 2**n bytes.
+DENSE_MAX_QUBITS = 24
+# Largest bond dimension a matrix product state may grow to before it is given up on.
+MPS_MAX_BOND_DIMENSION = 256
+
+# Singular values this much smaller than the largest are numerically zero.
+_SVD_CUTOFF = 1e-12
+_SWAP = np.eye(4).reshape(2, 2, 2, 2).transpose(1, 0, 2, 3)
+
+
+def _clifford_fidelity(circuit: QuantumCircuit) -> float | None:
+    try:
+        clifford = Clifford(circuit)
+    except QiskitError:
+        return None
+    zeros = "0" * circuit.num_qubits
+    probabilities = StabilizerState(clifford).probabilities_dict_from_bitstring(zeros)
+    return float(probabilities.get(zeros, 0.0))
+
+
+class _MatrixProductState:
+    """`|0...0>` as one `(left, 2, right)` tensor per qubit, evolved without truncation."""
+
+    def __init__(self, num_qubits: int, max_bond_dimension: int):
+        zero = np.array([1, 0], dtype=complex).reshape(1, 2, 1)
+        self.tensors = [zero] * num_qubits
+        self.max_bond_dimension = max_bond_dimension
+
+    def apply_1q(self, matrix: np.ndarray, site: int) -> None:
+        self.tensors[site] = np.einsum("ps,asb->apb", matrix, self.tensors[site])
+
+    def _apply_adjacent(self, gate: np.ndarray, site: int) -> bool:
+        """Apply `gate[out_site, out_next, in_site, in_next]` to `site` and `site + 1`."""
+        theta = np.einsum("asb,btc->astc", self.tensors[site], self.tensors[site + 1])
+        theta = np.einsum("stuv,auvc->astc", gate, theta)
+        left, _, _, right = theta.shape
+        u, s, vh = np.linalg.svd(
+            theta.reshape(left * 2, 2 * right), full_matrices=False
+        )
+        bond = max(1, int(np.count_nonzero(s > s[0] * _SVD_CUTOFF)))
+        if bond > self.max_bond_dimension:
+            return False
+        self.tensors[site] = u[:, :bond].reshape(left, 2, bond)
+        self.tensors[site + 1] = (s[:bond, None] * vh[:bond]).reshape(bond, 2, right)
+        return True
+
+    def apply_2q(self, matrix: np.ndarray, first: int, second: int) -> bool:
+        """Apply a 2-qubit gate matrix in Qiskit's qubit order, False if it got too big."""
+        # Axes are (out second, out first, in second, in first) in little-endian order.
+        gate = matrix.reshape(2, 2, 2, 2)
+        if first < second:
+            gate = gate.transpose(1, 0, 3, 2)
+        low, high = sorted((first, second))
+
+        # Swap the higher qubit down next to the lower one and back again afterwards.
+        for site in range(high - 1, low, -1):
+            if not self._apply_adjacent(_SWAP, site):
+                return False
+        if not self._apply_adjacent(gate, low):
+            return False
+        for site in range(low + 1, high):
+            if not self._apply_adjacent(_SWAP, site):
+                return False
+        return True
+
+    def zero_amplitude(self) -> complex:
+        vector = np.ones(1, dtype=complex)
+        for tensor in self.tensors:
+            vector = vector @ tensor[:, 0, :]
+        return complex(vector[0])
+
+
+def _mps_fidelity(circuit: QuantumCircuit, max_bond_dimension: int) -> float | None:
+    index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    state = _MatrixProductState(circuit.num_qubits, max_bond_dimension)
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if getattr(operation, "_directive", False) or operation.name == "delay":
+            continue
+        sites = [index[qubit] for qubit in instruction.qubits]
+        if instruction.clbits or len(sites) > 2 or not hasattr(operation, "to_matrix"):
+            return None
+        try:
+            matrix = operation.to_matrix()
+        except Exception:
+            return None
+        if len(sites) == 1:
+            state.apply_1q(matrix, sites[0])
+        elif not state.apply_2q(matrix, *sites):
+            return None
+    return abs(state.zero_amplitude()) ** 2
+
+
+def zero_state_fidelity(
+    circuit: QuantumCircuit,
+    dense_max_qubits: int = DENSE_MAX_QUBITS,
+    max_bond_dimension: int = MPS_MAX_BOND_DIMENSION,
+) -> float:
+    """Return `|<0...0|U|0...0>|^2` for the unitary `U` of `circuit`.
+
+    Clifford circuits are simulated as stabilizer states. Other circuits are simulated
+    as matrix product states, unless they are too entangled or have gates on more than
+    two qubits, in which case circuits of at most `dense_max_qubits` qubits are
+    simulated as dense statevectors.
+
+    Raises:
+        ValueError: If the circuit is too large to simulate.
+    """
+    fidelity = _clifford_fidelity(circuit)
+    if fidelity is None:
+        fidelity = _mps_fidelity(circuit, max_bond_dimension)
+    if fidelity is None:
+        if circuit.num_qubits > dense_max_qubits:
+            raise ValueError(
+                f"Cannot simulate this {circuit.num_qubits}-qubit circuit: it is too "
+                "entangled for a matrix product state or has gates on more than two "
+                f"qubits, and statevectors are only used for up to {dense_max_qubits} "
+                "qubits"
+            )
+        fidelity = abs(Statevector(circuit).data[0]) ** 2
+    return min(float(fidelity), 1.0)
@@ -0,0 +1,86 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import math
+
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit.random import random_circuit
+from qiskit.quantum_info import Statevector, state_fidelity
+
+from qc_grader.grader.fidelity import (
+    _clifford_fidelity,
+    _mps_fidelity,
+    zero_state_fidelity,
+)
+
+
+def _ising(num_qubits: int, steps: int, angle: float = math.pi / 8) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(steps):
+        circuit.rx(angle, range(num_qubits))
+        for start in (0, 1):
+            for qubit in range(start, num_qubits - 1, 2):
+                circuit.cz(qubit, qubit + 1)
+        circuit.barrier()
+    return circuit
+
+
+def _mirror(circuit: QuantumCircuit) -> QuantumCircuit:
+    return circuit.compose(circuit.inverse())  # type: ignore
+
+
+def _dense_fidelity(circuit: QuantumCircuit) -> float:
+    zero = Statevector.from_label("0" * circuit.num_qubits)
+    return float(state_fidelity(Statevector(circuit), zero))
+
+
+@pytest.mark.parametrize(
+    "circuit",
+    [
+        _ising(6, 3),
+        _ising(6, 3, math.pi / 2),
+        _mirror(_ising(7, 2)),
+        random_circuit(7, 12, max_operands=2, seed=4),
+        random_circuit(5, 8, max_operands=3, seed=5),
+    ],
+)
+def test_zero_state_fidelity_matches_statevector(circuit):
+    assert zero_state_fidelity(circuit) == pytest.approx(_dense_fidelity(circuit))
+
+
+def test_clifford_circuits_are_simulated_as_stabilizer_states():
+    clifford = _ising(6, 3, math.pi / 2)
+
+    assert _clifford_fidelity(clifford) == pytest.approx(_dense_fidelity(clifford))
+    assert _clifford_fidelity(_ising(6, 3)) is None
+
+
+def test_non_adjacent_gates_are_simulated_as_matrix_product_states():
+    circuit = random_circuit(7, 12, max_operands=2, seed=6)
+
+    assert _mps_fidelity(circuit, 64) == pytest.approx(_dense_fidelity(circuit))
+
+
+def test_large_mirror_circuits_do_not_need_a_statevector():
+    mirror = _mirror(_ising(60, 4))
+
+    assert zero_state_fidelity(mirror, dense_max_qubits=0) == pytest.approx(1.0)
+
+
+def test_zero_state_fidelity_falls_back_to_statevectors():
+    circuit = _ising(6, 3)
+
+    assert _mps_fidelity(circuit, 1) is None
+    assert zero_state_fidelity(circuit, max_bond_dimension=1) == pytest.approx(
+        _dense_fidelity(circuit)
+    )
+    with pytest.raises(ValueError, match="too entangled"):
+        zero_state_fidelity(circuit, dense_max_qubits=5, max_bond_dimension=1)
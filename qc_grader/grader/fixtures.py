@@ -0,0 +1,40 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Read-only test data packaged with the challenges."""
+
+from functools import cache
+from importlib.resources import files
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+
+
+@cache
+def _load_npy(package: str, name: str) -> np.ndarray:
+    resource = files(package).joinpath(*name.split("/"))
+    if isinstance(resource, Path):
+        # `mmap_mode="r"` maps the file read-only instead of reading it into memory.
+        return np.load(resource, mmap_mode="r", allow_pickle=False).view(np.ndarray)
+
+    # Not on the filesystem, e.g. installed from a zipped wheel.
+    array = np.load(BytesIO(resource.read_bytes()), allow_pickle=False)
+    array.flags.writeable = False
+    return array
+
+
+def load_npy_fixture(package: str, name: str) -> np.ndarray:
+    """Load a `.npy` file shipped in `package`, e.g. `"utils/lab4c_test_samples.npy"`.
+
+    The file is read once per process. Every call returns a new read-only view, so
+    user functions can't modify the cached data.
+    """
+    return _load_npy(package, name).view()
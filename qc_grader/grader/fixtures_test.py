@@ -0,0 +1,58 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from qc_grader.grader.fixtures import load_npy_fixture
+
+_PACKAGE = "qc_grader.challenges.qgss_2026"
+_SAMPLES = "utils/lab4c_test_samples.npy"
+
+
+def test_load_npy_fixture_matches_np_load():
+    expected = np.load(
+        Path(__file__).parents[1] / "challenges" / "qgss_2026" / _SAMPLES
+    )
+
+    result = load_npy_fixture(_PACKAGE, _SAMPLES)
+
+    assert type(result) is np.ndarray
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_load_npy_fixture_is_read_only():
+    result = load_npy_fixture(_PACKAGE, _SAMPLES)
+
+    with pytest.raises(ValueError, match="read-only"):
+        result[0] = 0
+    with pytest.raises(ValueError):
+        result.flags.writeable = True
+    assert result is not load_npy_fixture(_PACKAGE, _SAMPLES)
+
+
+def test_load_npy_fixture_from_zip(tmp_path, monkeypatch):
+    with BytesIO() as container:
+        np.save(container, np.arange(6).reshape(2, 3))
+        data = container.getvalue()
+    archive = tmp_path / "fixtures.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("zipped_fixtures/__init__.py", "")
+        zf.writestr("zipped_fixtures/data/array.npy", data)
+    monkeypatch.syspath_prepend(str(archive))
+
+    result = load_npy_fixture("zipped_fixtures", "data/array.npy")
+
+    np.testing.assert_array_equal(result, np.arange(6).reshape(2, 3))
+    assert not result.flags.writeable
@@ -16,12 +16,15 @@ from typeguard import check_type, typechecked
 
 from qc_grader.custom_encoder import to_json
 from .api import send_request
+from .timings import current_timings, phase, recorded
+from .tracing import set_attributes, span, traced
 
 # ------------------------------------------------------------------------------------------------------
 # Teams
 # ------------------------------------------------------------------------------------------------------
 
 
+@recorded
 @typechecked
 def _join_team(team_name: str, challenge_name: str) -> None:
     """Register the user with the provided team, then print a confirmation."""
@@ -66,12 +69,20 @@ class GradeResponse(TypedDict):
 _MAX_ANSWER_BYTES = 20 * 1024 * 1024  # 20 MB
 
 
+@traced
+@recorded
 def grade_answer(answer: Any, lab: str, exercise: str, challenge: str) -> None:
     """Send the answer to the validate endpoint and print the result."""
 
+    set_attributes({"qc.challenge": challenge, "qc.lab": lab, "qc.exercise": exercise})
     print("Grading your answer. Please wait...\n")
     try:
-        answer_json_str = to_json(answer)
+        timings = current_timings()
+        with phase("encode"), span("to_json"):
+            answer_json_str = to_json(
+                answer, timings.encoded_types if timings else None
+            )
+            set_attributes({"qc.payload.bytes": len(answer_json_str)})
         # len() == byte count because json.dumps uses ensure_ascii=True (default), producing pure ASCII.
         if len(answer_json_str) > _MAX_ANSWER_BYTES:
             limit_mb = _MAX_ANSWER_BYTES / 1024 / 1024
@@ -85,7 +96,8 @@ def grade_answer(answer: Any, lab: str, exercise: str, challenge: str) -> None:
             f"/submissions/{challenge}/{lab}/{exercise}",
             body={"answer": answer_json_str},
         )
-        check_type(response, GradeResponse)
+        with phase("check_response"):
+            check_type(response, GradeResponse)
     except typeguard.TypeCheckError as e:
         print(
             "Server returned an unexpected response format. Try upgrading the "
@@ -151,6 +163,7 @@ class ProgressResponse(TypedDict):
     per_lab: list[LabSummary]
 
 
+@recorded
 @typechecked
 def _check_progress(challenge_name: str, lab_name: str | None = None) -> None:
     """Fetch the user's progress for a challenge and print a summary."""
@@ -158,7 +171,8 @@ def _check_progress(challenge_name: str, lab_name: str | None = None) -> None:
     print("Fetching your progress. Please wait...\n")
     try:
         response = send_request(f"/progress/{challenge_name}", method="GET")
-        check_type(response, ProgressResponse)
+        with phase("check_response"):
+            check_type(response, ProgressResponse)
     except typeguard.TypeCheckError as e:
         print(
             "Server returned an unexpected response format. Try upgrading the "
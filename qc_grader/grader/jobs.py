@@ -0,0 +1,80 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Fetching results of Qiskit Runtime jobs, once per job."""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Hashable, Sequence
+
+# Results are kept for the most recently fetched jobs only, since they can be large.
+_MAX_RESULTS = 16
+_MAX_WORKERS = 8
+
+_RESULTS: OrderedDict[Hashable, Any] = OrderedDict()
+_RESULTS_LOCK = threading.Lock()
+
+
+def _job_key(job: Any) -> Hashable | None:
+    try:
+        key = job.job_id()
+        hash(key)
+    except Exception:
+        return None
+    return key
+
+
+def job_result(job: Any) -> Any:
+    """Return `job.result()`, reusing the result of an earlier call for the same job id.
+
+    Only successful results are kept, so a failed fetch is retried next time.
+    """
+    key = _job_key(job)
+    if key is not None:
+        with _RESULTS_LOCK:
+            if key in _RESULTS:
+                _RESULTS.move_to_end(key)
+                return _RESULTS[key]
+
+    result = job.result()
+
+    if key is not None:
+        with _RESULTS_LOCK:
+            _RESULTS[key] = result
+            while len(_RESULTS) > _MAX_RESULTS:
+                _RESULTS.popitem(last=False)
+    return result
+
+
+def clear_job_results() -> None:
+    """Forget every cached job result."""
+    with _RESULTS_LOCK:
+        _RESULTS.clear()
+
+
+def job_results(jobs: Sequence[Any]) -> list[Any]:
+    """Return the result of every job in `jobs`, fetching them concurrently."""
+    # Fetch each distinct job once, even if it is listed several times.
+    unique: dict[Hashable, Any] = {}
+    keys = []
+    for job in jobs:
+        key = _job_key(job)
+        key = (key,) if key is not None else ("object", id(job))
+        unique.setdefault(key, job)
+        keys.append(key)
+
+    if len(unique) <= 1:
+        fetched = {key: job_result(job) for key, job in unique.items()}
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(unique))) as pool:
+            futures = {key: pool.submit(job_result, job) for key, job in unique.items()}
+            fetched = {key: future.result() for key, future in futures.items()}
+    return [fetched[key] for key in keys]
@@ -0,0 +1,76 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from qc_grader.grader.jobs import clear_job_results, job_result, job_results
+
+
+@pytest.fixture(autouse=True)
+def _fresh_job_results():
+    clear_job_results()
+    yield
+    clear_job_results()
+
+
+def _job(job_id, result=None):
+    job = Mock()
+    job.job_id.return_value = job_id
+    job.result.return_value = result if result is not None else f"result-{job_id}"
+    return job
+
+
+def test_job_result_is_fetched_once_per_job_id():
+    job = _job("abc")
+    same_id = _job("abc")
+
+    assert job_result(job) == "result-abc"
+    assert job_result(same_id) == "result-abc"
+    job.result.assert_called_once()
+    same_id.result.assert_not_called()
+
+
+def test_failed_fetch_is_retried():
+    job = _job("abc")
+    job.result.side_effect = [RuntimeError("timeout"), "result"]
+
+    with pytest.raises(RuntimeError):
+        job_result(job)
+    assert job_result(job) == "result"
+
+
+def test_jobs_without_usable_id_are_not_cached():
+    job = Mock()
+    job.job_id.return_value = ["unhashable"]
+    job.result.return_value = "result"
+
+    job_result(job)
+    job_result(job)
+
+    assert job.result.call_count == 2
+
+
+def test_job_results_fetches_concurrently_and_in_order():
+    barrier = threading.Barrier(3, timeout=5)
+    jobs = [_job(name) for name in "abc"]
+
+    def fetch(job_id):
+        # Only returns once all three fetches are in flight together.
+        barrier.wait()
+        return job_id
+
+    for job in jobs:
+        job.result.side_effect = lambda job_id=job.job_id(): fetch(job_id)
+
+    assert job_results([jobs[2], jobs[0], jobs[1], jobs[0]]) == ["c", "a", "b", "a"]
+    jobs[0].result.assert_called_once()
@@ -0,0 +1,189 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Helpers for turning Qiskit Runtime options into answer payloads."""
+
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Callable
+
+from qiskit_ibm_runtime.options.utils import Unset
+
+# How `sanitize_for_json` treats a value, decided once per type.
+_KEEP = 0
+_DROP = 1
+_DICT = 2
+_LIST = 3
+_TUPLE = 4
+
+_VERDICTS: dict[type, int] = {}
+
+
+def _verdict(cls: type) -> int:
+    verdict = _VERDICTS.get(cls)
+    if verdict is not None:
+        return verdict
+
+    # The name check keeps supporting `Unset` sentinels from other options modules.
+    if cls is type(Unset) or cls.__name__ == "UnsetType":
+        verdict = _DROP
+    elif issubclass(cls, dict):
+        verdict = _DICT
+    elif issubclass(cls, list):
+        verdict = _LIST
+    elif issubclass(cls, tuple):
+        verdict = _TUPLE
+    # These are exactly the leaf types `json.dumps` encodes without a `default`.
+    elif cls is type(None) or issubclass(cls, (str, int, float)):
+        verdict = _KEEP
+    else:
+        verdict = _DROP
+
+    _VERDICTS[cls] = verdict
+    return verdict
+
+
+def sanitize_for_json(value: Any) -> Any:
+    """
+    Recursively sanitize a value to ensure it's JSON serializable.
+    Converts non-serializable items and `Unset` to None while preserving dictionary keys.
+
+    Args:
+        value: The value to sanitize (can be dict, list, or any other type)
+
+    Returns:
+        A JSON-serializable version of the value
+    """
+    if value is Unset:
+        return None
+
+    verdict = _verdict(type(value))
+    if verdict == _KEEP:
+        return value
+    if verdict == _DICT:
+        return {k: sanitize_for_json(v) for k, v in value.items()}
+    if verdict == _LIST:
+        return [sanitize_for_json(item) for item in value]
+    if verdict == _TUPLE:
+        return tuple(sanitize_for_json(item) for item in value)
+    return None
+
+
+# ------------------------------------------------------------------------------------------------------
+# Field extraction
+# ------------------------------------------------------------------------------------------------------
+
+_ACCESSORS: dict[tuple[type, str], Callable[[Any], Any]] = {}
+_FIELD_NAMES: dict[type, tuple[str, ...] | None] = {}
+
+
+def get_option(options: Any, path: str) -> Any:
+    """Read a nested option by its dotted path, e.g. `"resilience.zne.noise_factors"`.
+
+    Unlike `dataclasses.asdict(options)[...]`, only the fields on the path are visited
+    and nothing is copied.
+    """
+    key = (type(options), path)
+    accessor = _ACCESSORS.get(key)
+    if accessor is None:
+        accessor = _ACCESSORS[key] = attrgetter(path)
+    return accessor(options)
+
+
+def _field_names(cls: type) -> tuple[str, ...] | None:
+    if cls not in _FIELD_NAMES:
+        if hasattr(cls, "__dataclass_fields__"):
+            _FIELD_NAMES[cls] = tuple(field.name for field in fields(cls))
+        else:
+            _FIELD_NAMES[cls] = None
+    return _FIELD_NAMES[cls]
+
+
+def options_to_dict(value: Any) -> Any:
+    """Convert an options dataclass to nested dicts, like `dataclasses.asdict`.
+
+    Leaf values are shared with `value` rather than deep-copied, so the result must
+    not be mutated.
+    """
+    names = _field_names(type(value))
+    if names is not None:
+        return {name: options_to_dict(getattr(value, name)) for name in names}
+    if isinstance(value, dict):
+        return {k: options_to_dict(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [options_to_dict(item) for item in value]
+    if isinstance(value, tuple):
+        items = [options_to_dict(item) for item in value]
+        return type(value)(*items) if hasattr(value, "_fields") else type(value)(items)
+    return value
+
+
+# ------------------------------------------------------------------------------------------------------
+# Comparison
+# ------------------------------------------------------------------------------------------------------
+
+
+def _children(value: Any) -> Any:
+    """The `(name, value)` pairs of an options dataclass or dict, or None for a leaf."""
+    names = _field_names(type(value))
+    if names is not None:
+        return [(name, getattr(value, name)) for name in names]
+    if isinstance(value, dict):
+        return value.items()
+    return None
+
+
+def _is_group(value: Any) -> bool:
+    return _field_names(type(value)) is not None or isinstance(value, dict)
+
+
+def _child(group: Any, name: Any) -> tuple[bool, Any]:
+    names = _field_names(type(group))
+    if names is not None:
+        return (True, getattr(group, name)) if name in names else (False, None)
+    if isinstance(group, dict):
+        return (True, group[name]) if name in group else (False, None)
+    return False, None
+
+
+def _leaf(value: Any) -> Any:
+    return options_to_dict(value) if isinstance(value, (list, tuple)) else value
+
+
+def _diff(expected: Any, items: Any, prefix: str, mismatches: list[str]) -> None:
+    for name, value in items:
+        path = f"{prefix}{name}"
+        found, expected_value = _child(expected, name)
+        children = _children(value)
+        expected_group = found and _is_group(expected_value)
+
+        if children is not None and expected_group:
+            _diff(expected_value, children, f"{path}.", mismatches)
+        elif not found or (children is not None) != expected_group:
+            value = _leaf(value) if children is None else options_to_dict(value)
+            mismatches.append(f"{path}: {value!r} is not in the expected options")
+        elif _leaf(expected_value) != _leaf(value):
+            mismatches.append(f"{path}: expected {expected_value!r}, got {value!r}")
+
+
+def diff_options(expected: Any, actual: Any) -> list[str]:
+    """Describe every option set in `actual` that `expected` does not match.
+
+    Both sides may be options dataclasses or nested dicts. Only the options in
+    `actual` are visited, so an empty list means `expected` contains `actual`.
+    """
+    mismatches: list[str] = []
+    _diff(expected, _children(actual), "", mismatches)
+    return mismatches
+
+
+def options_contain(expected: Any, actual: Any) -> bool:
+    """Whether every option set in `actual` has the same value in `expected`."""
+    return not diff_options(expected, actual)
@@ -0,0 +1,168 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import json
+from dataclasses import asdict
+from enum import IntEnum
+
+import numpy as np
+import pytest
+from qiskit_ibm_runtime.options import EstimatorOptions, SamplerOptions
+from qiskit_ibm_runtime.options.utils import Unset
+
+from qc_grader.grader.options import (
+    diff_options,
+    get_option,
+    options_contain,
+    options_to_dict,
+    sanitize_for_json,
+)
+
+# ------------------------------------------------------------------------------------------------------
+# sanitize_for_json
+# ------------------------------------------------------------------------------------------------------
+
+
+def test_sanitize_for_json_real_unset():
+    assert sanitize_for_json(Unset) is None
+    assert sanitize_for_json({"a": Unset, "b": [Unset, 1]}) == {
+        "a": None,
+        "b": [None, 1],
+    }
+
+
+def test_sanitize_for_json_subclasses_follow_json():
+    class Level(IntEnum):
+        LOW = 1
+
+    class Mapping(dict):
+        pass
+
+    assert sanitize_for_json(Level.LOW) is Level.LOW
+    assert sanitize_for_json(np.float64(1.5)) == 1.5
+    assert sanitize_for_json(np.int64(1)) is None
+    assert type(sanitize_for_json(Mapping(a=1))) is dict
+
+
+def test_sanitize_for_json_runtime_options():
+    options = EstimatorOptions()
+    options.resilience.zne.noise_factors = (1, 3, 5)  # type: ignore
+    options.dynamical_decoupling.enable = True  # type: ignore
+
+    result = sanitize_for_json(asdict(options))
+
+    assert result["resilience"]["zne"]["noise_factors"] == (1, 3, 5)
+    assert result["dynamical_decoupling"]["enable"] is True
+    assert result["default_shots"] is None
+    json.dumps(result)
+    json.dumps(sanitize_for_json(asdict(SamplerOptions())))
+
+
+# ------------------------------------------------------------------------------------------------------
+# Field extraction
+# ------------------------------------------------------------------------------------------------------
+
+
+def _configured_estimator_options() -> EstimatorOptions:
+    options = EstimatorOptions()
+    options.resilience.zne_mitigation = True  # type: ignore
+    options.resilience.zne.noise_factors = (1, 3, 5)  # type: ignore
+    options.twirling.strategy = "active-accum"  # type: ignore
+    options.environment.job_tags = ["qgss"]  # type: ignore
+    return options
+
+
+def test_get_option():
+    options = _configured_estimator_options()
+
+    assert get_option(options, "resilience.zne.noise_factors") == (1, 3, 5)
+    assert get_option(options, "twirling.strategy") == "active-accum"
+    assert get_option(options, "resilience.pec.max_overhead") is Unset
+
+
+def test_options_to_dict_matches_asdict():
+    options = _configured_estimator_options()
+
+    assert options_to_dict(options) == asdict(options)
+    assert options_to_dict(SamplerOptions()) == asdict(SamplerOptions())
+
+
+def test_options_to_dict_does_not_copy_leaves():
+    options = EstimatorOptions()
+    marker = object()
+    options.experimental = {"marker": marker}
+
+    assert options_to_dict(options)["experimental"]["marker"] is marker
+
+
+# ------------------------------------------------------------------------------------------------------
+# diff_options
+# ------------------------------------------------------------------------------------------------------
+
+
+def _legacy_dict_contains(full: dict, subset: dict) -> bool:
+    for key, value in subset.items():
+        if key not in full:
+            return False
+        if isinstance(value, dict) and isinstance(full[key], dict):
+            if not _legacy_dict_contains(full[key], value):
+                return False
+        elif full[key] != value:
+            return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "full,subset",
+    [
+        ({"a": 1, "b": {"c": 2}}, {"b": {"c": 2}}),
+        ({"a": 1, "b": {"c": 2}}, {"b": {"c": 3}}),
+        ({"a": 1}, {"a": 1, "z": 0}),
+        ({"a": {"b": 1}}, {"a": {}}),
+        ({"a": {}}, {"a": {}}),
+        ({"a": 1}, {"a": {}}),
+        ({"a": {"b": 1}}, {"a": 1}),
+        ({"a": 1}, {"a": {"b": 1}}),
+        ({"a": [1, 2]}, {"a": [1, 2]}),
+        ({"a": (1, 2)}, {"a": [1, 2]}),
+        ({1: {"x": None}}, {1: {"x": None}}),
+        ({}, {}),
+    ],
+)
+def test_options_contain_matches_dict_contains(full, subset):
+    assert options_contain(full, subset) is _legacy_dict_contains(full, subset)
+
+
+def test_options_contain_accepts_dataclasses():
+    expected = EstimatorOptions()
+    expected.resilience.zne_mitigation = True  # type: ignore
+    job_options = {"resilience": {"zne_mitigation": True}}
+
+    assert options_contain(expected, job_options)
+    assert options_contain(expected, expected)
+    assert options_contain(options_to_dict(expected), expected)
+    assert not options_contain(expected, SamplerOptions())
+
+
+def test_diff_options_describes_mismatches():
+    expected = SamplerOptions()
+    expected.dynamical_decoupling.enable = True  # type: ignore
+    expected.default_shots = 1000
+    job_options = {
+        "default_shots": 1000,
+        "dynamical_decoupling": {"enable": False},
+        "twirling": {"enable_gates": True, "unknown": 1},
+    }
+
+    assert diff_options(expected, job_options) == [
+        "dynamical_decoupling.enable: expected True, got False",
+        "twirling.enable_gates: expected Unset, got True",
+        "twirling.unknown: 1 is not in the expected options",
+    ]
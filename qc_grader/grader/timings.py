@@ -0,0 +1,202 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Opt-in timing of the phases of each call to the grading server."""
+
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from typing import Any, Callable, Iterator, Literal, TypeVar, cast
+
+import typeguard._functions
+from typeguard import TypeCheckMemo
+
+from qc_grader import __version__
+from qc_grader.grader.typecheck import _in_qc_grader
+
+# "1" records timings, "print" also prints a breakdown after every call.
+_TIMINGS_ENV_VAR_NAME = "QC_GRADER_TIMINGS"
+# A file to append every recorded call to, as a line of JSON.
+_LOG_ENV_VAR_NAME = "QC_GRADER_TIMINGS_LOG"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@dataclass
+class CallTimings:
+    # The grader function, e.g. "grade_answer", and the server endpoint it called.
+    call: str
+    endpoint: str = ""
+    # Nanoseconds spent in each phase, in the order they first ran.
+    phases_ns: dict[str, int] = field(default_factory=dict)
+    total_ns: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    # How many objects of each type the JSON encoder converted, e.g. "ndarray".
+    encoded_types: Counter[str] = field(default_factory=Counter)
+
+    def add(self, phase: str, nanoseconds: int) -> None:
+        self.phases_ns[phase] = self.phases_ns.get(phase, 0) + nanoseconds
+
+    def breakdown(self) -> str:
+        lines = [f"{self.call} {self.endpoint}: {self.total_ns / 1e6:.1f} ms"]
+        for phase, nanoseconds in self.phases_ns.items():
+            lines.append(f"  {phase:<16}{nanoseconds / 1e6:>10.1f} ms")
+        lines.append(
+            f"  {'sent':<16}{self.request_bytes:>10} bytes, "
+            f"received {self.response_bytes} bytes"
+        )
+        if self.encoded_types:
+            encoded = ", ".join(
+                f"{name} x{count}" for name, count in self.encoded_types.most_common()
+            )
+            lines.append(f"  {'encoded':<16}{encoded}")
+        return "\n".join(lines)
+
+
+_enabled = False
+_print_breakdown = False
+_log_path: str | None = None
+# Per context, so concurrent calls from several threads each record their own.
+_current: ContextVar[CallTimings | None] = ContextVar("_current", default=None)
+_last: CallTimings | None = None
+# Nanoseconds `@typechecked` spent checking the arguments of qc_grader functions
+# outside of any recorded call, e.g. a grader's answer, which the next call counts.
+_unrecorded_check_ns: ContextVar[int] = ContextVar("_unrecorded_check_ns", default=0)
+
+# Functions instrumented by `@typechecked` look this up in `typeguard._functions` on
+# every call, so replacing it there times every argument check.
+_check_argument_types = typeguard._functions.check_argument_types_internal
+
+
+def _timed_check_argument_types(
+    func_name: str, arguments: dict[str, tuple[Any, Any]], memo: TypeCheckMemo
+) -> Literal[True]:
+    if not _in_qc_grader(memo):
+        return _check_argument_types(func_name, arguments, memo)
+
+    start = time.perf_counter_ns()
+    _check_argument_types(func_name, arguments, memo)
+    # Checks that fail stop the call, so only those that pass are counted.
+    nanoseconds = time.perf_counter_ns() - start
+    if (timings := _current.get()) is not None:
+        timings.add("check_answer", nanoseconds)
+    else:
+        _unrecorded_check_ns.set(_unrecorded_check_ns.get() + nanoseconds)
+    return True
+
+
+def _use_argument_check(check: Callable[..., Literal[True]]) -> None:
+    # setattr, since ty takes a function defined with `def` to be fixed.
+    setattr(typeguard._functions, "check_argument_types_internal", check)
+
+
+def enable_timings(print_breakdown: bool = False, log_path: str | None = None) -> None:
+    """Record how long each call to the grading server spends in each phase.
+
+    Args:
+        print_breakdown: Print the timings after every call.
+        log_path: A file to append the timings of every call to, one JSON object per
+            line, e.g. to collect them from a whole class.
+    """
+    global _enabled, _print_breakdown, _log_path
+    _enabled = True
+    _print_breakdown = print_breakdown
+    _log_path = log_path
+    _use_argument_check(_timed_check_argument_types)
+
+
+def disable_timings() -> None:
+    global _enabled, _print_breakdown, _log_path
+    _enabled = False
+    _print_breakdown = False
+    _log_path = None
+    _use_argument_check(_check_argument_types)
+
+
+def last_timings() -> CallTimings | None:
+    """Return the timings of the last call to the grading server, if recorded."""
+    return _last
+
+
+def current_timings() -> CallTimings | None:
+    """Return the timings of the call in progress, if they are being recorded."""
+    return _current.get()
+
+
+def _write_log(timings: CallTimings, log_path: str) -> None:
+    record = {"time": time.time(), "client_version": __version__, **asdict(timings)}
+    with open(log_path, "a", encoding="utf-8") as log:
+        log.write(json.dumps(record) + "\n")
+
+
+def recorded(fn: _F) -> _F:
+    """Record the phases run during each call to `fn`, if timings are enabled.
+
+    Type checks of the arguments of qc_grader functions count as phase
+    `check_answer`, including those made just before the call, e.g. of the answer
+    passed to the grader that makes it. Time not spent in any phase only counts
+    towards the total.
+    """
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        global _last
+        if not _enabled:
+            return fn(*args, **kwargs)
+
+        timings = CallTimings(fn.__name__)
+        if check_ns := _unrecorded_check_ns.get():
+            timings.add("check_answer", check_ns)
+            _unrecorded_check_ns.set(0)
+        token = _current.set(timings)
+        start = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timings.total_ns = check_ns + time.perf_counter_ns() - start
+            _current.reset(token)
+            _last = timings
+            if _print_breakdown:
+                print(f"\n{timings.breakdown()}")
+            if _log_path is not None:
+                _write_log(timings, _log_path)
+
+    return cast(_F, wrapper)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Add the time spent in this block to phase `name` of the call in progress."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter_ns() - start)
+
+
+def _configure_from_env() -> None:
+    mode = os.environ.get(_TIMINGS_ENV_VAR_NAME, "")
+    log_path = os.environ.get(_LOG_ENV_VAR_NAME) or None
+    if mode not in ("", "0") or log_path is not None:
+        enable_timings(print_breakdown=mode == "print", log_path=log_path)
+
+
+_configure_from_env()
@@ -0,0 +1,182 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import requests
+import typeguard
+import typeguard._functions
+from typeguard import typechecked
+
+from qc_grader.grader import disable_timings, enable_timings, last_timings
+from qc_grader.grader import timings as timings_module
+from qc_grader.grader.grade import _check_progress, grade_answer
+
+_GRADE_RESPONSE = {"passed": True, "score": 1, "msg": "Correct!"}
+_GRADE_RESPONSE_JSON = json.dumps(_GRADE_RESPONSE)
+
+
+def _response(method, url, json, headers):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = _GRADE_RESPONSE_JSON.encode()
+    response.elapsed = timedelta(microseconds=1)
+    response.request = requests.Request(method, url, json=json).prepare()
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _server():
+    with (
+        patch("qc_grader.grader.api.get_access_token", return_value="token"),
+        patch("qc_grader.grader.api.requests.request", side_effect=_response),
+    ):
+        yield
+    disable_timings()
+    timings_module._last = None
+
+
+def test_nothing_is_recorded_by_default(capsys):
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+
+    assert last_timings() is None
+    assert "Correct!" in capsys.readouterr().out
+
+
+def test_grade_answer_phases():
+    enable_timings()
+    grade_answer({"values": np.arange(3), "shift": 1j}, "lab1", "ex1", "ch1")
+
+    timings = last_timings()
+    assert timings is not None
+    assert timings.call == "grade_answer"
+    assert timings.endpoint == "/submissions/ch1/lab1/ex1"
+    assert list(timings.phases_ns) == [
+        "encode",
+        "auth",
+        "server",
+        "download",
+        "parse",
+        "check_response",
+    ]
+    assert timings.total_ns >= sum(timings.phases_ns.values())
+    assert timings.request_bytes > 0
+    assert timings.response_bytes == len(json.dumps(_GRADE_RESPONSE))
+    assert timings.encoded_types == {"ndarray": 1, "complex": 1}
+
+
+@typechecked
+def _grade_pairs(pairs: list[list[int]]) -> None:
+    grade_answer(pairs, "lab1", "ex1", "ch1")
+
+
+def test_checking_the_answer_is_recorded():
+    enable_timings()
+    _grade_pairs([[i, i + 1] for i in range(1000)])
+
+    timings = last_timings()
+    assert timings is not None
+    assert list(timings.phases_ns)[:2] == ["check_answer", "encode"]
+    assert timings.phases_ns["check_answer"] > 0
+    assert timings.total_ns >= sum(timings.phases_ns.values())
+
+    # Answers that fail the check are not sent, and their check is not counted.
+    with pytest.raises(typeguard.TypeCheckError):
+        _grade_pairs([["0", 1]])  # type: ignore
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+    timings = last_timings()
+    assert timings is not None
+    assert "check_answer" not in timings.phases_ns
+
+
+def test_argument_checks_are_only_timed_while_enabled():
+    check = typeguard._functions.check_argument_types_internal
+    enable_timings()
+    assert typeguard._functions.check_argument_types_internal is not check
+    disable_timings()
+    assert typeguard._functions.check_argument_types_internal is check
+
+
+def test_check_progress_is_recorded():
+    enable_timings()
+    _check_progress("ch1")
+
+    timings = last_timings()
+    assert timings is not None
+    assert timings.call == "_check_progress"
+    assert timings.endpoint == "/progress/ch1"
+    assert "encode" not in timings.phases_ns
+
+
+def test_printed_breakdown(capsys):
+    enable_timings(print_breakdown=True)
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+
+    out = capsys.readouterr().out
+    assert "grade_answer /submissions/ch1/lab1/ex1:" in out
+    assert "  encode" in out
+    assert "bytes, received" in out
+
+
+def test_log_gets_a_line_per_call(tmp_path):
+    log_path = tmp_path / "timings.jsonl"
+    enable_timings(log_path=str(log_path))
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+    grade_answer([3], "lab1", "ex2", "ch1")
+
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [record["endpoint"] for record in records] == [
+        "/submissions/ch1/lab1/ex1",
+        "/submissions/ch1/lab1/ex2",
+    ]
+    assert set(records[0]["phases_ns"]) >= {"encode", "auth", "server"}
+    assert "client_version" in records[0]
+
+
+def test_concurrent_calls_record_their_own_phases(tmp_path):
+    log_path = tmp_path / "timings.jsonl"
+    enable_timings(log_path=str(log_path))
+    with ThreadPoolExecutor(16) as workers:
+        for future in [
+            workers.submit(grade_answer, [i], "lab1", f"ex{i}", "ch1")
+            for i in range(100)
+        ]:
+            future.result()
+
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert sorted(record["endpoint"] for record in records) == sorted(
+        f"/submissions/ch1/lab1/ex{i}" for i in range(100)
+    )
+    for record in records:
+        assert list(record["phases_ns"]) == [
+            "encode",
+            "auth",
+            "server",
+            "download",
+            "parse",
+            "check_response",
+        ]
+
+
+def test_timings_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("QC_GRADER_TIMINGS", "print")
+    timings_module._configure_from_env()
+    assert timings_module._enabled and timings_module._print_breakdown
+
+    disable_timings()
+    monkeypatch.setenv("QC_GRADER_TIMINGS", "")
+    monkeypatch.setenv("QC_GRADER_TIMINGS_LOG", str(tmp_path / "timings.jsonl"))
+    timings_module._configure_from_env()
+    assert timings_module._enabled and not timings_module._print_breakdown
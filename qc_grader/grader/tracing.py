@@ -0,0 +1,285 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Optional OpenTelemetry-style tracing of calls to the grading server.
+
+Spans are exported in the OTLP/JSON format, to a file or an OTLP/HTTP endpoint such
+as an OpenTelemetry Collector, without needing the OpenTelemetry SDK.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import queue
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, ContextManager, Iterator, Protocol, TypeVar, cast
+
+import requests
+
+from qc_grader import __version__
+
+# A file to append spans to, one OTLP/JSON request per line.
+_FILE_ENV_VAR_NAME = "QC_GRADER_TRACES_FILE"
+# An OTLP/HTTP endpoint to send spans to, e.g. "http://localhost:4318".
+_ENDPOINT_ENV_VAR_NAME = "QC_GRADER_OTLP_ENDPOINT"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_SERVICE_NAME = "qc_grader"
+# OTLP status codes.
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+# Seconds to wait at exit for queued traces to be sent, before dropping them.
+_EXIT_FLUSH_TIMEOUT = 1.0
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_time_unix_nano: int
+    end_time_unix_nano: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    # An OTLP status code and, for errors, the exception message.
+    status_code: int = _STATUS_OK
+    status_message: str = ""
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None: ...
+
+
+def _attribute_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings.
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _attribute_value(value)}
+        for key, value in attributes.items()
+    ]
+
+
+def to_otlp_json(spans: list[Span]) -> dict[str, Any]:
+    """Return `spans` as the body of an OTLP/HTTP JSON export request."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _attributes(
+                        {"service.name": _SERVICE_NAME, "service.version": __version__}
+                    )
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__, "version": __version__},
+                        "spans": [
+                            {
+                                "traceId": span.trace_id,
+                                "spanId": span.span_id,
+                                **(
+                                    {"parentSpanId": span.parent_span_id}
+                                    if span.parent_span_id
+                                    else {}
+                                ),
+                                "name": span.name,
+                                "startTimeUnixNano": str(span.start_time_unix_nano),
+                                "endTimeUnixNano": str(span.end_time_unix_nano),
+                                "attributes": _attributes(span.attributes),
+                                "status": {
+                                    "code": span.status_code,
+                                    "message": span.status_message,
+                                },
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class InMemorySpanExporter:
+    """Keeps exported spans in `spans`, e.g. for tests."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+
+class FileSpanExporter:
+    """Appends each trace to `path` as a line of OTLP/JSON.
+
+    This is the format of the OpenTelemetry Collector's file exporter, so the file can
+    be replayed into a collector or read with `json.loads` line by line.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        line = json.dumps(to_otlp_json(spans))
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+class OtlpHttpSpanExporter:
+    """Sends each trace to `{endpoint}/v1/traces` as OTLP/JSON on a background thread.
+
+    Traces that do not fit in a queue of `max_pending` are dropped rather than making
+    grading wait, and failures to send are ignored. At exit, traces not sent within
+    a second are dropped too, so a slow collector does not hold up shutting down.
+    """
+
+    def __init__(self, endpoint: str, timeout: float = 5.0, max_pending: int = 64):
+        self.url = f"{endpoint.rstrip('/')}/v1/traces"
+        self.timeout = timeout
+        self._queue: queue.Queue[list[Span]] = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(
+            target=self._run, name="qc-grader-otlp-exporter", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush, _EXIT_FLUSH_TIMEOUT)
+
+    def export(self, spans: list[Span]) -> None:
+        with contextlib.suppress(queue.Full):
+            self._queue.put_nowait(spans)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued trace has been sent, or failed to.
+
+        Returns whether they were, which is `False` if `timeout` seconds passed first.
+        """
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            try:
+                requests.post(self.url, json=to_otlp_json(spans), timeout=self.timeout)
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
+
+_exporter: SpanExporter | None = None
+# Per context, so concurrent calls from several threads each get their own trace.
+_current: ContextVar[Span | None] = ContextVar("_current", default=None)
+# Spans of the trace in progress, exported together once its root span ends.
+_finished: ContextVar[list[Span]] = ContextVar("_finished")
+_NO_SPAN = contextlib.nullcontext()
+
+
+def enable_tracing(exporter: SpanExporter) -> None:
+    """Trace calls to the grading server and export the spans with `exporter`."""
+    global _exporter
+    _exporter = exporter
+
+
+def disable_tracing() -> None:
+    global _exporter
+    _exporter = None
+
+
+def set_attributes(attributes: dict[str, Any]) -> None:
+    """Add `attributes` to the span in progress, if there is one."""
+    if (current := _current.get()) is not None:
+        current.attributes.update(attributes)
+
+
+@contextlib.contextmanager
+def _span(name: str, attributes: dict[str, Any]) -> Iterator[Span]:
+    parent = _current.get()
+    if parent is None:
+        finished: list[Span] = []
+        finished_token = _finished.set(finished)
+    else:
+        finished = _finished.get()
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else secrets.token_hex(16),
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent.span_id if parent else None,
+        start_time_unix_nano=time.time_ns(),
+        attributes=attributes,
+    )
+    current_token = _current.set(span)
+    try:
+        yield span
+    except BaseException as error:
+        span.status_code = _STATUS_ERROR
+        span.status_message = f"{type(error).__name__}: {error}"
+        raise
+    finally:
+        span.end_time_unix_nano = time.time_ns()
+        _current.reset(current_token)
+        finished.append(span)
+        if parent is None:
+            _finished.reset(finished_token)
+            if _exporter is not None:
+                _exporter.export(finished)
+
+
+def span(
+    name: str, attributes: dict[str, Any] | None = None
+) -> ContextManager[Span | None]:
+    """Trace the block in a span named `name`, if tracing is enabled.
+
+    When it is not, this returns a shared no-op context manager.
+    """
+    if _exporter is None:
+        return _NO_SPAN
+    return _span(name, dict(attributes or {}))
+
+
+def traced(fn: _F) -> _F:
+    """Trace each call to `fn` in a span named after it, if tracing is enabled."""
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _exporter is None:
+            return fn(*args, **kwargs)
+        with _span(fn.__name__, {}):
+            return fn(*args, **kwargs)
+
+    return cast(_F, wrapper)
+
+
+def _configure_from_env() -> None:
+    if path := os.environ.get(_FILE_ENV_VAR_NAME):
+        enable_tracing(FileSpanExporter(path))
+    elif endpoint := os.environ.get(_ENDPOINT_ENV_VAR_NAME):
+        enable_tracing(OtlpHttpSpanExporter(endpoint))
+
+
+_configure_from_env()
@@ -0,0 +1,223 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from qc_grader.grader import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    OtlpHttpSpanExporter,
+    disable_tracing,
+    enable_tracing,
+)
+from qc_grader.grader import tracing
+from qc_grader.grader.grade import grade_answer
+
+_GRADE_RESPONSE = {"passed": True, "score": 1, "msg": "Correct!"}
+_GRADE_RESPONSE_JSON = json.dumps(_GRADE_RESPONSE)
+
+
+def _response(method, url, json, headers):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = _GRADE_RESPONSE_JSON.encode()
+    response.elapsed = timedelta(microseconds=1)
+    response.request = requests.Request(method, url, json=json).prepare()
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _server():
+    with (
+        patch("qc_grader.grader.auth.read_api_key", return_value="key"),
+        patch("qc_grader.grader.auth.IAMAuthenticator") as authenticator,
+        patch("qc_grader.grader.api.requests.request", side_effect=_response),
+    ):
+        authenticator.return_value.token_manager.get_token.return_value = "token"
+        yield
+    disable_tracing()
+
+
+@pytest.fixture
+def collector():
+    """A local stand-in for an OpenTelemetry Collector's OTLP/HTTP receiver."""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((self.path, json.loads(body)))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", received
+    server.shutdown()
+    server.server_close()
+
+
+def test_no_spans_when_disabled():
+    assert tracing.span("anything") is tracing._NO_SPAN
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+    assert tracing._current.get() is None
+    assert tracing._finished.get(None) is None
+
+
+def test_grade_answer_spans():
+    exporter = InMemorySpanExporter()
+    enable_tracing(exporter)
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+
+    spans = {span.name: span for span in exporter.spans}
+    assert list(spans) == [
+        "to_json",
+        "get_access_token",
+        "send_request",
+        "grade_answer",
+    ]
+    root = spans["grade_answer"]
+    assert root.parent_span_id is None
+    assert root.attributes == {
+        "qc.challenge": "ch1",
+        "qc.lab": "lab1",
+        "qc.exercise": "ex1",
+    }
+    for name in ("to_json", "send_request"):
+        assert spans[name].trace_id == root.trace_id
+        assert spans[name].parent_span_id == root.span_id
+    assert spans["get_access_token"].parent_span_id == spans["send_request"].span_id
+    assert spans["to_json"].attributes == {"qc.payload.bytes": 6}
+    assert spans["send_request"].attributes["http.response.status_code"] == 200
+    assert spans["send_request"].attributes["url.path"] == "/submissions/ch1/lab1/ex1"
+    assert all(
+        span.start_time_unix_nano <= span.end_time_unix_nano for span in spans.values()
+    )
+
+
+def test_errors_are_recorded():
+    exporter = InMemorySpanExporter()
+    enable_tracing(exporter)
+    with patch("qc_grader.grader.auth.read_api_key", return_value=None):
+        grade_answer([1, 2], "lab1", "ex1", "ch1")
+
+    spans = {span.name: span for span in exporter.spans}
+    assert spans["get_access_token"].status_code == tracing._STATUS_ERROR
+    assert spans["get_access_token"].status_message.startswith("AuthenticationError")
+    assert spans["grade_answer"].status_code == tracing._STATUS_OK
+    assert len({span.trace_id for span in exporter.spans}) == 1
+
+
+def test_concurrent_calls_get_their_own_traces():
+    exporter = InMemorySpanExporter()
+    enable_tracing(exporter)
+    with ThreadPoolExecutor(16) as workers:
+        for future in [
+            workers.submit(grade_answer, [i], "lab1", f"ex{i}", "ch1")
+            for i in range(100)
+        ]:
+            future.result()
+
+    traces: dict[str, list[tracing.Span]] = {}
+    for span in exporter.spans:
+        traces.setdefault(span.trace_id, []).append(span)
+    assert len(traces) == 100
+    for spans in traces.values():
+        [root] = [span for span in spans if span.parent_span_id is None]
+        [send] = [span for span in spans if span.name == "send_request"]
+        assert len(spans) == 4
+        assert send.parent_span_id == root.span_id
+        assert send.attributes["url.path"].endswith(root.attributes["qc.exercise"])
+
+
+def test_file_exporter_writes_a_line_of_otlp_json_per_trace(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    enable_tracing(FileSpanExporter(str(path)))
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+    grade_answer([1, 2], "lab1", "ex2", "ch1")
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 2
+    resource_spans = lines[0]["resourceSpans"][0]
+    assert {"key": "service.name", "value": {"stringValue": "qc_grader"}} in (
+        resource_spans["resource"]["attributes"]
+    )
+    spans = resource_spans["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans][-1] == "grade_answer"
+    assert "parentSpanId" not in spans[-1]
+
+
+def test_otlp_exporter_sends_traces_to_a_collector(collector):
+    endpoint, received = collector
+    exporter = OtlpHttpSpanExporter(endpoint)
+    enable_tracing(exporter)
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+    exporter.flush()
+
+    [(path, body)] = received
+    assert path == "/v1/traces"
+    spans = body["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    send = next(span for span in spans if span["name"] == "send_request")
+    assert {
+        "key": "http.response.status_code",
+        "value": {"intValue": "200"},
+    } in send["attributes"]
+
+
+def test_flush_gives_up_on_a_slow_collector():
+    stalled = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            stalled.wait(5)
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        exporter = OtlpHttpSpanExporter(f"http://127.0.0.1:{server.server_port}")
+        enable_tracing(exporter)
+        grade_answer([1, 2], "lab1", "ex1", "ch1")
+
+        start = time.perf_counter()
+        assert not exporter.flush(timeout=0.1)
+        assert time.perf_counter() - start < 1
+        stalled.set()
+        assert exporter.flush(timeout=5)
+    finally:
+        stalled.set()
+        server.shutdown()
+        server.server_close()
+
+
+def test_otlp_exporter_ignores_an_unreachable_collector(capsys):
+    exporter = OtlpHttpSpanExporter("http://127.0.0.1:9", timeout=1)
+    enable_tracing(exporter)
+    grade_answer([1, 2], "lab1", "ex1", "ch1")
+    exporter.flush()
+
+    assert "Correct!" in capsys.readouterr().out
@@ -0,0 +1,163 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""How many items of collections passed to graders `@typechecked` checks.
+
+Policies only apply to functions defined in `qc_grader`, so other code in the same
+kernel that uses typeguard keeps its own behaviour.
+"""
+
+import collections.abc
+import dataclasses
+import os
+import random
+import typing
+from typing import Any, Iterable, Literal, cast, get_args
+
+import typeguard
+from typeguard import CollectionCheckStrategy, TypeCheckMemo
+
+_POLICY_ENV_VAR_NAME = "QC_GRADER_TYPECHECK"
+
+# "full" checks every item, "first" only the first item of each collection, like
+# typeguard's default, and "sampled" the first item and a few random others.
+TypeCheckPolicy = Literal["full", "first", "sampled"]
+
+# Number of items of a collection "sampled" checks.
+SAMPLE_SIZE = 8
+
+# Origins of the annotations whose checkers go through the items of a collection.
+_COLLECTION_ORIGINS = {
+    list,
+    tuple,
+    dict,
+    set,
+    frozenset,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+    typing.Sequence,
+    typing.MutableSequence,
+    typing.Mapping,
+    typing.MutableMapping,
+    typing.AbstractSet,
+    typing.MutableSet,
+}
+
+
+class _SampledItems:
+    """A typeguard collection check strategy checking up to `size` items."""
+
+    def __init__(self, size: int):
+        self.size = size
+        # A private generator, so sampling leaves the notebook's `random` state alone.
+        self._random = random.Random()
+
+    def iterate_samples(self, collection: Iterable) -> Iterable:
+        if not isinstance(collection, collections.abc.Sequence):
+            collection = list(collection)
+        if len(collection) <= self.size:
+            return collection
+        # Always include the first item, so this finds at least what "first" does.
+        indices = self._random.sample(range(1, len(collection)), self.size - 1)
+        return [collection[0], *(collection[index] for index in sorted(indices))]
+
+
+_STRATEGIES: dict[str, Any] = {
+    "full": CollectionCheckStrategy.ALL_ITEMS,
+    "first": CollectionCheckStrategy.FIRST_ITEM,
+    "sampled": _SampledItems(SAMPLE_SIZE),
+}
+
+_strategy: Any = None
+
+
+def set_typecheck_policy(policy: TypeCheckPolicy | None) -> None:
+    """Check collections passed to every grader according to `policy`.
+
+    This overrides the strategy given to `@typechecked` by individual graders. `None`
+    goes back to each grader's own strategy.
+    """
+    global _strategy
+    if policy is not None and policy not in _STRATEGIES:
+        raise ValueError(
+            f"Unknown type check policy {policy!r}, expected one of "
+            f"{', '.join(get_args(TypeCheckPolicy))}"
+        )
+    _strategy = _STRATEGIES[policy] if policy is not None else None
+    # typeguard is only hooked into while a policy is set.
+    hooked = _lookup_checker in typeguard.checker_lookup_functions
+    if _strategy is None and hooked:
+        typeguard.checker_lookup_functions.remove(_lookup_checker)
+    elif _strategy is not None and not hooked:
+        typeguard.checker_lookup_functions.insert(0, _lookup_checker)
+
+
+def get_typecheck_policy() -> TypeCheckPolicy | None:
+    """Return the policy set by `set_typecheck_policy` or the env var, if any."""
+    for policy, strategy in _STRATEGIES.items():
+        if strategy is _strategy:
+            return cast(TypeCheckPolicy, policy)
+    return None
+
+
+def _in_qc_grader(memo: TypeCheckMemo) -> bool:
+    # The globals are those of the module defining the checked function.
+    package = memo.globals.get("__package__") or ""
+    return package.partition(".")[0] == __name__.partition(".")[0]
+
+
+def _with_strategy(checker: typeguard.TypeCheckerCallable, strategy: Any) -> Any:
+    def check(value: Any, origin_type: Any, args: tuple, memo: TypeCheckMemo) -> None:
+        if memo.config.collection_check_strategy is not strategy and _in_qc_grader(
+            memo
+        ):
+            # Items are checked with the new memo too, so this happens once per call.
+            memo = TypeCheckMemo(
+                memo.globals,
+                memo.locals,
+                self_type=memo.self_type,
+                config=dataclasses.replace(
+                    memo.config, collection_check_strategy=strategy
+                ),
+            )
+        checker(value, origin_type, args, memo)
+
+    return check
+
+
+def _lookup_checker(
+    origin_type: Any, args: tuple, extras: tuple
+) -> typeguard.TypeCheckerCallable | None:
+    if _strategy is None or origin_type not in _COLLECTION_ORIGINS:
+        return None
+    for lookup in typeguard.checker_lookup_functions:
+        if lookup is not _lookup_checker:
+            checker = lookup(origin_type, args, extras)
+            if checker is not None:
+                return _with_strategy(checker, _strategy)
+    return None
+
+
+def _configured_policy() -> TypeCheckPolicy | None:
+    value = os.environ.get(_POLICY_ENV_VAR_NAME) or None
+    if value is not None and value not in _STRATEGIES:
+        print(
+            f"Ignoring {_POLICY_ENV_VAR_NAME}={value!r}, expected one of "
+            f"{', '.join(get_args(TypeCheckPolicy))}"
+        )
+        return None
+    return cast(TypeCheckPolicy, value)
+
+
+set_typecheck_policy(_configured_policy())
@@ -0,0 +1,154 @@
+# (C) Copyright IBM 2026
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import random
+from typing import Sequence
+
+import pytest
+import typeguard
+from typeguard import (
+    CollectionCheckStrategy,
+    TypeCheckError,
+    TypeCheckMemo,
+    check_type_internal,
+    typechecked,
+)
+
+from qc_grader.grader import get_typecheck_policy, set_typecheck_policy
+from qc_grader.grader.typecheck import (
+    SAMPLE_SIZE,
+    _configured_policy,
+    _in_qc_grader,
+    _lookup_checker,
+    _SampledItems,
+)
+
+
+@typechecked(collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS)
+def _all_items(pairs: Sequence[Sequence[int]]) -> int:
+    return len(pairs)
+
+
+@typechecked
+def _first_item(counts: dict[str, int]) -> int:
+    return len(counts)
+
+
+_BAD_LAST_PAIR = [[0, 1]] * 100 + [[0, "1"]]
+_BAD_LAST_COUNT = {**{str(i): i for i in range(100)}, "x": "100"}
+
+
+@pytest.fixture(autouse=True)
+def _default_policy():
+    yield
+    set_typecheck_policy(None)
+
+
+def test_graders_keep_their_own_strategy_by_default():
+    assert get_typecheck_policy() is None
+    with pytest.raises(TypeCheckError):
+        _all_items(_BAD_LAST_PAIR)  # type: ignore
+    _first_item(_BAD_LAST_COUNT)  # type: ignore
+
+
+def test_full_checks_every_item():
+    set_typecheck_policy("full")
+
+    assert get_typecheck_policy() == "full"
+    with pytest.raises(TypeCheckError):
+        _all_items(_BAD_LAST_PAIR)  # type: ignore
+    with pytest.raises(TypeCheckError, match="key 'x'"):
+        _first_item(_BAD_LAST_COUNT)  # type: ignore
+
+
+def test_first_overrides_the_grader_strategy():
+    set_typecheck_policy("first")
+
+    assert _all_items(_BAD_LAST_PAIR) == 101  # type: ignore
+    with pytest.raises(TypeCheckError):
+        _all_items([["0", 1]] + [[0, 1]] * 100)  # type: ignore
+
+
+@pytest.mark.parametrize("policy", ["full", "first", "sampled"])
+def test_every_policy_checks_the_structure(policy):
+    set_typecheck_policy(policy)
+
+    with pytest.raises(TypeCheckError, match="is not a sequence"):
+        _all_items(3)  # type: ignore
+    with pytest.raises(TypeCheckError):
+        _all_items([3])  # type: ignore
+
+
+def test_sampled_checks_small_collections_fully():
+    set_typecheck_policy("sampled")
+
+    with pytest.raises(TypeCheckError):
+        _all_items([[0, 1]] * (SAMPLE_SIZE - 1) + [[0, "1"]])  # type: ignore
+    assert _all_items(_BAD_LAST_PAIR) == 101  # type: ignore
+
+
+def test_sampled_items_include_the_first():
+    items = list(range(100))
+
+    for collection in (items, set(items), dict.fromkeys(items).items()):
+        samples = list(_SampledItems(5).iterate_samples(collection))
+
+        assert len(samples) == 5
+        assert samples[0] == next(iter(collection))
+        assert set(samples) <= set(collection)
+    assert _SampledItems(5).iterate_samples([1, 2]) == [1, 2]
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError, match="Unknown type check policy 'some'"):
+        set_typecheck_policy("some")  # type: ignore
+
+
+def test_policy_from_env(monkeypatch, capsys):
+    monkeypatch.setenv("QC_GRADER_TYPECHECK", "sampled")
+    assert _configured_policy() == "sampled"
+
+    monkeypatch.setenv("QC_GRADER_TYPECHECK", "")
+    assert _configured_policy() is None
+
+    monkeypatch.setenv("QC_GRADER_TYPECHECK", "some")
+    assert _configured_policy() is None
+    assert "Ignoring QC_GRADER_TYPECHECK='some'" in capsys.readouterr().out
+
+
+def test_typeguard_is_only_hooked_into_while_a_policy_is_set():
+    assert _lookup_checker not in typeguard.checker_lookup_functions
+    set_typecheck_policy("first")
+    assert typeguard.checker_lookup_functions[0] is _lookup_checker
+    set_typecheck_policy(None)
+    assert _lookup_checker not in typeguard.checker_lookup_functions
+
+
+def test_policies_only_apply_to_qc_grader():
+    assert _in_qc_grader(TypeCheckMemo(globals(), {}))
+    assert not _in_qc_grader(TypeCheckMemo({"__package__": "elsewhere"}, {}))
+    assert not _in_qc_grader(TypeCheckMemo({}, {}))
+
+    set_typecheck_policy("full")
+    memo = TypeCheckMemo({"__package__": "elsewhere"}, {})
+    # Checked with the default strategy, which only looks at the first item.
+    check_type_internal(_BAD_LAST_PAIR, Sequence[Sequence[int]], memo)
+    with pytest.raises(TypeCheckError):
+        check_type_internal(_BAD_LAST_PAIR, Sequence[Sequence[int]], _memo())
+
+
+def _memo() -> TypeCheckMemo:
+    return TypeCheckMemo(globals(), {})
+
+
+def test_sampling_leaves_the_global_random_state_alone():
+    state = random.getstate()
+    _SampledItems(5).iterate_samples(list(range(100)))
+    assert random.getstate() == state